@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from ansible.module_utils.common.parameters import remove_values
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_auth_mounts import (
+    AUTH_METHOD_ARGUMENT_SPEC,
+    run_auth_method,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_cache import (
+    VaultFileCache,
+    default_cache_path,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_tracing import (
+    inject_context,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultControllerModule,
+    VaultModule,
+    VaultModuleFailure,
+)
+
+
+# Long enough for every host running the task to pick up the shared result.
+# Entries are also keyed on the playbook run, so they are never shared with a
+# later run of the same playbook.
+RESULT_CACHE_TTL = 300
+
+# Options that change how the task runs, but not what it does to Vault, and
+# are left out of the de-duplication key.
+UNKEYED_PARAMS = ("run_on_controller", "max_workers", "rate_limit")
+
+
+def run_id():
+    """Identifies the current playbook run.
+
+    Action plugins run in worker processes started by the ansible-playbook
+    process, so its process ID is shared by every host of the run.
+    """
+    return os.getppid()
+
+
+def no_log_values(argument_spec, params):
+    """Returns the values of the parameters marked ``no_log`` in ``argument_spec``, to be masked in results."""
+    values = set()
+    for name, spec in argument_spec.items():
+        value = params.get(name)
+        if value is None:
+            continue
+        if spec.get("no_log"):
+            if isinstance(value, dict):
+                value = list(value.values())
+            if isinstance(value, (list, tuple)):
+                values.update(to_native(item) for item in value if item is not None)
+            else:
+                values.add(to_native(value))
+        if spec.get("options"):
+            for item in value if isinstance(value, list) else [value]:
+                if isinstance(item, dict):
+                    values.update(no_log_values(spec["options"], item))
+    return values
+
+
+class ActionModule(ActionBase):
+    """
+    Runs vault_auth_method on the controller when run_on_controller is set.
+
+    The module only talks to the Vault API, so there is no need to ship it to
+    every host. All hosts running the same task with the same parameters share
+    a single execution: the first one to get the lock runs the Vault logic
+    in-process, and the others pick its result up from the controller cache.
+    Async tasks always run the module on the host.
+    """
+
+    _supports_async = True
+
+    def _execute_on_controller(self, params, check_mode, diff):
+        module = None
+        try:
+            module = VaultControllerModule(params, check_mode=check_mode, diff=diff)
+            result = run_auth_method(module)
+        except VaultModuleFailure as e:
+            result = e.result
+        except Exception as e:
+            result = dict(changed=False, failed=True, msg=to_native(e))
+        if module is None:
+            return result
+
+        module.finish_vault_tracing(failed=result.get("failed", False))
+        return module.with_vault_metrics(result)
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        module_args = inject_context(self._task.args.copy())
+        # The async wrapper polls for a job on the host, so async tasks can not
+        # share a controller-side execution.
+        if not module_args.get("run_on_controller") or self._task.async_val:
+            result.update(
+                self._execute_module(
+                    module_name="dubzland.vault.vault_auth_method",
+                    module_args=module_args,
+                    task_vars=task_vars,
+                    wrap_async=self._task.async_val
+                    and not self._connection.has_native_async,
+                )
+            )
+            return result
+
+        argument_spec = VaultModule.generate_argument_spec(**AUTH_METHOD_ARGUMENT_SPEC)
+        validator = ArgumentSpecValidator(argument_spec)
+        validation = validator.validate(module_args)
+        if validation.error_messages:
+            result.update(
+                failed=True,
+                msg="Invalid arguments: %s" % "; ".join(validation.error_messages),
+            )
+            return result
+
+        params = validation.validated_parameters
+        check_mode = bool(self._play_context.check_mode)
+        diff = bool(self._play_context.diff)
+        key = VaultFileCache.make_key(
+            run_id(),
+            self._task._uuid,
+            check_mode,
+            diff,
+            json.dumps(
+                dict((k, v) for k, v in params.items() if k not in UNKEYED_PARAMS),
+                sort_keys=True,
+                default=str,
+            ),
+        )
+
+        cache = VaultFileCache(default_cache_path("action_results.json"))
+        with cache.locked():
+            module_result = cache.get(key)
+            if module_result is None:
+                module_result = self._execute_on_controller(params, check_mode, diff)
+                module_result = remove_values(
+                    module_result, no_log_values(argument_spec, params)
+                )
+                if not module_result.get("failed"):
+                    # Only the host that ran the module reports its requests.
+                    cache.set(
+                        key,
+                        dict(
+                            (k, v)
+                            for k, v in module_result.items()
+                            if k != "vault_metrics"
+                        ),
+                        RESULT_CACHE_TTL,
+                    )
+
+        result.update(module_result)
+        return result
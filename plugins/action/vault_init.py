@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.action import ActionBase
+
+
+# Secrets returned by vault_init, which are dropped from the result once
+# they have been written to the output directory.
+SECRET_KEYS = (
+    "root_token",
+    "keys",
+    "keys_base64",
+    "recovery_keys",
+    "recovery_keys_base64",
+)
+
+
+# Entries of the output directory written by vault_init. Each is replaced as
+# a whole, so that no key of an earlier initialization is left behind.
+INIT_ENTRIES = ("rootkey", "unseal", "recovery")
+
+
+def init_files(init_result):
+    files = [("rootkey", init_result["root_token"])]
+    for index, key in enumerate(init_result.get("keys") or []):
+        files.append((os.path.join("unseal", "key_%d" % index), key))
+    for index, key in enumerate(init_result.get("recovery_keys") or []):
+        files.append((os.path.join("recovery", "key_%d" % index), key))
+    return files
+
+
+def write_init_files(directory, init_result):
+    """Writes the root token and keys below ``directory``, readable by the owner only.
+
+    Every file is written to a staging directory first. The root token and
+    the ``unseal`` and ``recovery`` directories are then swapped in as a
+    whole, so keys left by an earlier initialization are removed, and put
+    back if any of them can not be moved into place.
+
+    :return: The paths written.
+    :rtype: list
+    """
+    files = init_files(init_result)
+    if not os.path.isdir(directory):
+        os.makedirs(directory, mode=0o700)
+
+    staging = tempfile.mkdtemp(dir=directory, prefix=".vault-init-")
+    restored = True
+    try:
+        new = os.path.join(staging, "new")
+        old = os.path.join(staging, "old")
+        os.mkdir(old, 0o700)
+        for name, contents in files:
+            path = os.path.join(new, name)
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path), mode=0o700)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "w") as key_file:
+                key_file.write(contents)
+
+        moved = []
+        try:
+            for entry in INIT_ENTRIES:
+                path = os.path.join(directory, entry)
+                if os.path.lexists(path):
+                    os.replace(path, os.path.join(old, entry))
+                moved.append(entry)
+                if os.path.lexists(os.path.join(new, entry)):
+                    os.replace(os.path.join(new, entry), path)
+        except OSError:
+            restored = _restore(directory, old, moved)
+            raise
+    finally:
+        # Files that could not be put back are left in the staging directory
+        # rather than deleted.
+        if restored:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    return [os.path.join(directory, name) for name, contents in files]
+
+
+def _restore(directory, old, entries):
+    """Puts the entries moved aside by write_init_files back in place.
+
+    :return: Whether all of them were put back.
+    :rtype: bool
+    """
+    restored = True
+    for entry in entries:
+        path = os.path.join(directory, entry)
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            elif os.path.lexists(path):
+                os.unlink(path)
+            if os.path.lexists(os.path.join(old, entry)):
+                os.replace(os.path.join(old, entry), path)
+        except OSError:
+            restored = False
+    return restored
+
+
+class ActionModule(ActionBase):
+    """
+    Runs vault_init on the host, then writes the keys it generated to
+    output_directory on the controller in a single step, instead of with a
+    task per key.
+    """
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        module_args = self._task.args.copy()
+        output_directory = module_args.pop("output_directory", None)
+
+        module_result = self._execute_module(
+            module_name="dubzland.vault.vault_init",
+            module_args=module_args,
+            task_vars=task_vars,
+        )
+        result.update(module_result)
+
+        if output_directory is None or not module_result.get("root_token"):
+            return result
+
+        directory = os.path.expanduser(output_directory)
+        try:
+            result["files"] = write_init_files(directory, module_result)
+        except (IOError, OSError) as e:
+            # Vault is initialized at this point, and the keys can not be
+            # generated again, so they are returned rather than lost.
+            result.update(
+                failed=True,
+                msg="Vault was initialized, but the keys could not be written to %s: %s"
+                % (directory, to_native(e)),
+            )
+            return result
+
+        for key in SECRET_KEYS:
+            result.pop(key, None)
+
+        return result
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.dubzland.vault.plugins.plugin_utils._vault_action import (
+    VaultActionBase,
+)
+
+
+class ActionModule(VaultActionBase):
+    MODULE_NAME = "dubzland.vault.vault_kv_sync"
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_native, to_text
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_cache import (
+    write_atomic,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_tracing import (
+    inject_context,
+)
+
+MANIFEST_VERSION = 1
+
+
+def read_policy_directory(directory):
+    """Returns a policy for every ``.hcl`` file in ``directory``, named after the file."""
+    policies = []
+    for filename in sorted(os.listdir(directory)):
+        name, extension = os.path.splitext(filename)
+        path = os.path.join(directory, filename)
+        if extension != ".hcl" or not os.path.isfile(path):
+            continue
+        with open(path, "rb") as policy_file:
+            policies.append(dict(name=name, policy=to_text(policy_file.read())))
+    return policies
+
+
+def manifest_scope(module_args):
+    """Identifies the cluster and namespace a manifest was recorded for."""
+    return dict(url=module_args.get("url"), namespace=module_args.get("namespace"))
+
+
+def read_manifest(path, scope):
+    """Returns the hashes recorded in the manifest at ``path``, when it was recorded for ``scope``."""
+    try:
+        with open(path) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (IOError, OSError, ValueError):
+        return {}
+
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("scope") != scope:
+        return {}
+    return manifest.get("policies") or {}
+
+
+def write_manifest(path, scope, hashes):
+    directory = os.path.dirname(path)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory, mode=0o700)
+    write_atomic(
+        path,
+        json.dumps(
+            dict(version=MANIFEST_VERSION, scope=scope, policies=hashes),
+            indent=2,
+            sort_keys=True,
+        ),
+    )
+
+
+class ActionModule(ActionBase):
+    """
+    Reads the policy files and the manifest of vault_policies on the
+    controller, runs the module with their contents, and records the hashes
+    it returns in the manifest.
+    """
+
+    def _load_policies(self, module_args):
+        policies = []
+        for policy in module_args.get("policies") or []:
+            policy = dict(policy)
+            src = policy.pop("src", None)
+            if src is not None:
+                path = self._find_needle("files", src)
+                with open(path, "rb") as policy_file:
+                    policy["policy"] = to_text(policy_file.read())
+            policies.append(policy)
+
+        directory = module_args.get("directory")
+        if directory is not None:
+            listed = set(policy["name"] for policy in policies)
+            policies.extend(
+                policy
+                for policy in read_policy_directory(os.path.expanduser(directory))
+                if policy["name"] not in listed
+            )
+
+        return policies
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        module_args = inject_context(self._task.args.copy())
+        manifest = module_args.pop("manifest", None)
+
+        try:
+            module_args["policies"] = self._load_policies(module_args)
+        except (AnsibleError, IOError, OSError) as e:
+            result.update(
+                failed=True, msg="Could not read the policies: %s" % to_native(e)
+            )
+            return result
+        module_args.pop("directory", None)
+
+        scope = manifest_scope(module_args)
+        if manifest is not None:
+            manifest = os.path.expanduser(manifest)
+            module_args["known_hashes"] = read_manifest(manifest, scope)
+
+        result.update(
+            self._execute_module(
+                module_name="dubzland.vault.vault_policies",
+                module_args=module_args,
+                task_vars=task_vars,
+            )
+        )
+
+        if manifest is None or result.get("failed"):
+            return result
+
+        hashes = result.pop("hashes", {})
+        if self._task.check_mode:
+            return result
+
+        try:
+            write_manifest(manifest, scope, hashes)
+        except (IOError, OSError) as e:
+            result["warnings"] = result.get("warnings", []) + [
+                "The policy manifest could not be written to %s: %s"
+                % (manifest, to_native(e))
+            ]
+
+        return result
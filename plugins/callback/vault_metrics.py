@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+name: vault_metrics
+type: aggregate
+short_description: Summarizes the Vault requests made during a playbook run
+description:
+  - Collects the C(vault_metrics) returned by the tasks of this collection run with C(metrics=true), and displays
+    the total number of requests and logins, and the endpoints that took the longest, at the end of the run.
+author:
+  - Josh Williams (@t3hpr1m3)
+requirements:
+  - Enable the callback in C(callbacks_enabled) in C(ansible.cfg), or with E(ANSIBLE_CALLBACKS_ENABLED).
+options:
+  top:
+    type: int
+    default: 10
+    description: Number of endpoints displayed, by total time spent on them.
+    env:
+      - name: VAULT_METRICS_TOP
+    ini:
+      - section: callback_vault_metrics
+        key: top
+  output:
+    type: path
+    description: Also write the summary, with every endpoint, to this JSON file.
+    env:
+      - name: VAULT_METRICS_OUTPUT
+    ini:
+      - section: callback_vault_metrics
+        key: output
+"""
+
+import json
+
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.callback import CallbackBase
+
+
+class VaultMetricsSummary(object):
+    """Adds up the ``vault_metrics`` of many task results, by endpoint and authentication method."""
+
+    def __init__(self):
+        self.tasks = 0
+        self.totals = dict(
+            requests=0, errors=0, retries=0, seconds=0.0, bytes_sent=0, bytes_received=0
+        )
+        self.endpoints = {}
+        self.logins = {}
+
+    def add(self, metrics):
+        self.tasks += 1
+        for key, value in (metrics.get("totals") or {}).items():
+            if key in self.totals:
+                self.totals[key] += value
+
+        for request in metrics.get("requests") or []:
+            key = (request["method"], request["path"])
+            endpoint = self.endpoints.setdefault(
+                key, dict(count=0, seconds=0.0, max_seconds=0.0, errors=0, retries=0)
+            )
+            endpoint["count"] += 1
+            endpoint["seconds"] += request["seconds"]
+            endpoint["max_seconds"] = max(endpoint["max_seconds"], request["seconds"])
+            endpoint["retries"] += request.get("retries") or 0
+            status = request.get("status")
+            if status is None or status >= 400:
+                endpoint["errors"] += 1
+
+        for login in metrics.get("logins") or []:
+            entry = self.logins.setdefault(
+                login["auth_method"], dict(count=0, cached=0, seconds=0.0)
+            )
+            entry["count"] += 1
+            entry["seconds"] += login["seconds"]
+            if login.get("cached"):
+                entry["cached"] += 1
+
+    def slowest(self, count=None):
+        """Returns the endpoints by total time spent on them, longest first."""
+        endpoints = [
+            dict(
+                stats,
+                method=method,
+                path=path,
+                mean_seconds=stats["seconds"] / stats["count"],
+            )
+            for (method, path), stats in self.endpoints.items()
+        ]
+        endpoints.sort(key=lambda endpoint: endpoint["seconds"], reverse=True)
+        return endpoints[:count] if count is not None else endpoints
+
+    def as_dict(self):
+        return dict(
+            tasks=self.tasks,
+            totals=self.totals,
+            logins=self.logins,
+            endpoints=self.slowest(),
+        )
+
+
+class CallbackModule(CallbackBase):
+    """Displays a summary of the Vault requests made by the tasks of a playbook run."""
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "dubzland.vault.vault_metrics"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, display=None):
+        super(CallbackModule, self).__init__(display=display)
+        self.summary = VaultMetricsSummary()
+
+    def _collect(self, result):
+        metrics = result._result.get("vault_metrics")
+        if isinstance(metrics, dict):
+            self.summary.add(metrics)
+
+    # The result of a loop only holds the results of its items, which are
+    # collected one by one.
+    def v2_runner_on_ok(self, result):
+        self._collect(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._collect(result)
+
+    def v2_runner_item_on_ok(self, result):
+        self._collect(result)
+
+    def v2_runner_item_on_failed(self, result):
+        self._collect(result)
+
+    def v2_playbook_on_stats(self, stats):
+        summary = self.summary
+        if not summary.tasks:
+            return
+
+        totals = summary.totals
+        self._display.banner("VAULT METRICS")
+        self._display.display(
+            "%d requests (%d errors, %d retries) in %.2fs over %d tasks, "
+            "%d bytes sent, %d bytes received"
+            % (
+                totals["requests"],
+                totals["errors"],
+                totals["retries"],
+                totals["seconds"],
+                summary.tasks,
+                totals["bytes_sent"],
+                totals["bytes_received"],
+            )
+        )
+
+        for auth_method, login in sorted(summary.logins.items()):
+            self._display.display(
+                "login %s: %d (%d cached) in %.2fs"
+                % (auth_method, login["count"], login["cached"], login["seconds"])
+            )
+
+        for endpoint in summary.slowest(self.get_option("top")):
+            self._display.display(
+                "%-6s %-50s %6d requests %8.3fs total %8.3fs mean %8.3fs max"
+                % (
+                    endpoint["method"],
+                    endpoint["path"],
+                    endpoint["count"],
+                    endpoint["seconds"],
+                    endpoint["mean_seconds"],
+                    endpoint["max_seconds"],
+                )
+            )
+
+        output = self.get_option("output")
+        if output:
+            try:
+                with open(output, "w") as output_file:
+                    json.dump(summary.as_dict(), output_file, indent=2, sort_keys=True)
+            except (IOError, OSError) as e:
+                self._display.warning(
+                    "Could not write the Vault metrics to %s: %s"
+                    % (output, to_native(e))
+                )
@@ -22,6 +22,7 @@ options:
       - azure
       - cert
       - jwt
+      - kubernetes
       - ldap
       - token
       - userpass
@@ -50,8 +51,17 @@ options:
     description:
       - For token auth, will perform a C(lookup-self) operation to determine the token's validity before using it.
       - Disable if your token does not have the C(lookup-self) capability.
+      - The lookup is made on every task, even with I(token_cache) enabled, so that a revoked token is never accepted.
     type: bool
     default: false
+  token_renew_threshold:
+    description:
+      - For token auth, renew the token with C(renew-self) once its remaining lifetime drops below this many seconds.
+      - Applies to renewable and periodic tokens only. Renewing extends the lifetime of the token, which stays the same.
+      - With I(token_cache) enabled and I(token_validate) disabled, the C(lookup-self) result is cached for the remaining
+        lifetime of the token.
+      - Requires the C(lookup-self) and C(renew-self) capabilities.
+    type: int
   username:
     type: str
     description: Authentication user name.
@@ -61,9 +71,9 @@ options:
   role_id:
     type: str
     description:
-      - Vault Role ID or name. Used in C(approle), C(aws_iam), C(azure) and C(cert) auth methods.
+      - Vault Role ID or name. Used in C(approle), C(aws_iam), C(azure), C(cert) and C(kubernetes) auth methods.
       - For C(cert) auth, if no I(role_id) is supplied, the default behavior is to try all certificate roles and return any one that matches.
-      - For C(azure) auth, I(role_id) is required.
+      - For C(azure) and C(kubernetes) auth, I(role_id) is required.
   secret_id:
     type: str
     description: Secret ID to be used for Vault AppRole authentication.
@@ -122,4 +132,32 @@ options:
   cert_auth_private_key:
     description: For C(cert) auth, path to the private key file to authenticate with, in PEM format.
     type: path
+  kubernetes_token_path:
+    description:
+      - For C(kubernetes) auth, path to the service account token to log in with.
+      - The token is read once per process, and read again only when the file changes.
+      - Defaults to C(/var/run/secrets/kubernetes.io/serviceaccount/token).
+    type: path
+  token_cache:
+    description:
+      - Reuse tokens obtained by logging in across tasks, instead of logging in again on every task.
+      - Tokens are stored in I(token_cache_path) until they come within I(token_cache_margin) seconds of expiring,
+        at which point they are renewed with C(renew-self) or replaced by a new login.
+      - Does not apply to C(token) and C(none) authentication, except that C(token) authentication caches the
+        C(lookup-self) result used by I(token_renew_threshold) in the same file.
+    type: bool
+    default: false
+  token_cache_path:
+    description:
+      - File used to store cached tokens. It is created with C(0600) permissions and guarded by a lock file.
+      - Defaults to C(~/.ansible/dubzland.vault/token_cache.json) on the host running the task.
+    type: path
+  token_cache_ttl:
+    description: Maximum number of seconds a token is kept in the cache, regardless of its lease duration.
+    type: int
+    default: 3600
+  token_cache_margin:
+    description: Number of seconds before expiry at which a cached token is renewed or replaced.
+    type: int
+    default: 60
 """
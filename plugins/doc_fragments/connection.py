@@ -16,4 +16,48 @@ options:
     type: str
     required: true
     description: The resolvable endpoint for the Vault API.
+  namespace:
+    type: str
+    description: The Vault Enterprise namespace to operate in.
+  timeout:
+    type: int
+    default: 30
+    description: Number of seconds to wait for a response from Vault before giving up on a request.
+  validate_certs:
+    type: bool
+    default: true
+    description: Whether to validate the TLS certificate presented by Vault.
+  ca_cert:
+    type: path
+    aliases: [ cacert ]
+    description: Path to a CA bundle used to validate the Vault server certificate.
+  client_cert:
+    type: path
+    description: Path to a PEM encoded client certificate for TLS client authentication.
+  client_key:
+    type: path
+    description: Path to the private key matching I(client_cert), if it is not included in that file.
+  pool_connections:
+    type: int
+    default: 10
+    description: Number of connection pools (one per Vault host) to keep open.
+  pool_maxsize:
+    type: int
+    default: 10
+    description: Maximum number of keep-alive connections kept open to a single Vault host.
+  retries:
+    type: int
+    default: 3
+    description:
+      - Number of times a request is retried on connection errors and on C(412) and C(429) responses.
+      - Reads (C(GET), C(LIST), C(HEAD) and C(OPTIONS)) are also retried on read timeouts and on C(500),
+        C(502), C(503) and C(504) responses. Writes are not, as Vault may already have applied them.
+      - Set to V(0) to disable retries.
+  retry_backoff_factor:
+    type: float
+    default: 0.3
+    description:
+      - Backoff factor applied between retries, in seconds.
+      - The delay before retry I(n) is I(retry_backoff_factor) * 2 ** (I(n) - 1). A C(Retry-After) header
+        sent by Vault takes precedence.
 """
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    DOCUMENTATION = """
+options:
+  targets:
+    type: list
+    elements: dict
+    description:
+      - Run against each of these Vault clusters and/or namespaces concurrently, instead of only O(url).
+      - Every target uses the same authentication and connection options.
+    suboptions:
+      url:
+        type: str
+        description: The resolvable endpoint for the Vault API. Defaults to O(url).
+      namespace:
+        type: str
+        description: The Vault Enterprise namespace to operate in. Defaults to O(namespace).
+  max_workers:
+    type: int
+    default: 8
+    description: Maximum number of O(targets) worked on at the same time.
+  rate_limit:
+    type: float
+    description:
+      - Maximum number of requests per second sent to a single Vault cluster, shared by all of its namespaces.
+      - Unlimited when not set.
+"""
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    DOCUMENTATION = """
+options:
+  metrics:
+    type: bool
+    default: false
+    description:
+      - Record every request sent to Vault and every login, and return them in C(vault_metrics).
+      - C(vault_metrics.requests) lists the C(method), C(path), C(status), C(seconds), C(retries), C(bytes_sent)
+        and C(bytes_received) of up to 500 requests. C(vault_metrics.logins) lists the C(auth_method),
+        C(seconds) and whether the token was C(cached) for every login. C(vault_metrics.totals) sums up every
+        request made.
+      - The P(dubzland.vault.vault_metrics#callback) callback plugin summarizes these across a playbook run.
+"""
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    DOCUMENTATION = """
+options:
+  tracing:
+    type: dict
+    description:
+      - Record an OpenTelemetry trace of the module run, with a span for the run, every login, every request sent
+        to Vault and every resource reconciled.
+      - Requires the C(opentelemetry-sdk) Python package, and C(opentelemetry-exporter-otlp-proto-http) for
+        O(tracing.exporter=otlp). Neither is imported when O(tracing) is not set.
+    suboptions:
+      traceparent:
+        type: str
+        description:
+          - W3C C(traceparent) of the span the module run belongs to, e.g. the deployment pipeline or the play.
+          - Defaults to the trace context of the controller, set by the action plugin of the module from the current
+            OpenTelemetry span of the controller, or from the E(TRACEPARENT) and E(TRACESTATE) environment variables.
+          - A new trace is started when there is none.
+      tracestate:
+        type: str
+        description: W3C C(tracestate) accompanying O(tracing.traceparent).
+      exporter:
+        type: str
+        default: otlp
+        choices: [ "otlp", "file" ]
+        description:
+          - V(otlp) sends the spans to an OpenTelemetry collector over OTLP/HTTP.
+          - V(file) appends the spans to O(tracing.path), one JSON document per line.
+      endpoint:
+        type: str
+        description:
+          - OTLP/HTTP traces endpoint, e.g. C(http://localhost:4318/v1/traces).
+          - Defaults to the standard C(OTEL_EXPORTER_OTLP_*) environment variables, then to a collector on
+            C(localhost).
+      headers:
+        type: dict
+        description: Headers sent to O(tracing.endpoint), e.g. for authentication.
+      path:
+        type: path
+        description: File the spans are appended to. Required when O(tracing.exporter=file).
+      service_name:
+        type: str
+        default: ansible
+        description: C(service.name) of the spans.
+"""
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+name: vault_auth_methods
+short_description: Reads the HashiCorp Vault authentication method mount table
+description:
+  - Returns the authentication methods mounted in Vault, as listed by C(sys/auth).
+  - The mount table is read on the controller, and cached per Vault URL, namespace and login identity
+    for O(cache_ttl) seconds, so templates and conditionals evaluated for many hosts share a single request.
+author:
+  - Josh Williams (@t3hpr1m3)
+requirements:
+  - python >= 3.8
+  - hvac >= 7.1.4
+options:
+  _terms:
+    description:
+      - Paths of the authentication methods to return, for example C(approle/).
+      - When no paths are given, the whole mount table is returned as a single dictionary.
+    type: list
+    elements: str
+    required: false
+  cache_ttl:
+    description:
+      - Number of seconds a mount table is cached for.
+      - Set to V(0) to always read the mount table from Vault.
+    type: int
+    default: 60
+  cache_path:
+    description:
+      - File the mount tables are cached in, so that all of the workers on the controller share them.
+      - Defaults to C(~/.ansible/dubzland.vault/auth_methods_cache.json).
+    type: path
+extends_documentation_fragment:
+  - dubzland.vault.auth
+  - dubzland.vault.connection
+"""
+
+EXAMPLES = """
+- name: Enable userpass only when it is not already mounted
+  dubzland.vault.vault_auth_method:
+    method_type: userpass
+    url: http://localhost:8200
+    token: "{{ _root_token }}"
+  when: >-
+    'userpass/' not in lookup('dubzland.vault.vault_auth_methods',
+                              url='http://localhost:8200', token=_root_token)
+
+- name: Show the AppRole mount
+  ansible.builtin.debug:
+    msg: >-
+      {{ lookup('dubzland.vault.vault_auth_methods', 'approle/',
+                url='http://localhost:8200', token=_root_token) }}
+"""
+
+RETURN = """
+_raw:
+  description:
+    - The whole mount table keyed by path, when no terms are given.
+    - Otherwise, the mount table entry for every term, or V(None) for paths that are not mounted.
+  type: list
+  elements: dict
+"""
+
+import time
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import to_native
+from ansible.plugins.lookup import LookupBase
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_cache import (
+    VaultFileCache,
+    default_cache_path,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_common import (
+    VaultAuthenticationError,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_connection_options import (
+    VaultConnectionOptions,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_auth import (
+    VaultAuth,
+)
+
+try:
+    import hvac
+
+    python_hvac_installed = True
+except ImportError:
+    python_hvac_installed = False
+
+
+# Mount tables already read by this worker process, keyed like the file cache.
+_mount_tables = {}
+
+
+class LookupModule(LookupBase):
+    def get_params(self):
+        params = {}
+        for option in VaultConnectionOptions.ARGUMENT_SPEC:
+            params[option] = self.get_option(option)
+        for option in VaultAuth.ARGUMENT_SPEC:
+            params[option] = self.get_option(option)
+        return params
+
+    def cache_key(self, params, authenticator):
+        if params["auth_method"] == "token":
+            identity = params["token"]
+        else:
+            identity = authenticator.get_authenticator().cache_identity()
+
+        return VaultFileCache.make_key(
+            params["url"],
+            params["namespace"],
+            params["auth_method"],
+            params["mount_point"],
+            identity,
+        )
+
+    def read_mount_table(self, params, authenticator):
+        connection_options = VaultConnectionOptions(params)
+        client = hvac.Client(**connection_options.get_hvac_connection_params())
+        authenticator.authenticate(client)
+
+        return client.sys.list_auth_methods().get("data")
+
+    def get_mount_table(self, params):
+        authenticator = VaultAuth(params)
+        try:
+            authenticator.validate()
+        except VaultAuthenticationError as e:
+            raise AnsibleError(to_native(e))
+
+        ttl = self.get_option("cache_ttl")
+        if not ttl:
+            return self.read_mount_table(params, authenticator)
+
+        key = self.cache_key(params, authenticator)
+        expires_at, mount_table = _mount_tables.get(key, (0, None))
+        if expires_at > time.time():
+            return mount_table
+
+        cache = VaultFileCache(
+            self.get_option("cache_path")
+            or default_cache_path("auth_methods_cache.json")
+        )
+        with cache.locked():
+            mount_table = cache.get(key)
+            if mount_table is None:
+                mount_table = self.read_mount_table(params, authenticator)
+                cache.set(key, mount_table, ttl)
+
+        _mount_tables[key] = (time.time() + ttl, mount_table)
+        return mount_table
+
+    def run(self, terms, variables=None, **kwargs):
+        if not python_hvac_installed:
+            raise AnsibleError(
+                "The dubzland.vault.vault_auth_methods lookup requires the hvac python library."
+            )
+
+        self.set_options(var_options=variables, direct=kwargs)
+
+        try:
+            mount_table = self.get_mount_table(self.get_params())
+        except hvac.exceptions.VaultError as e:
+            raise AnsibleError(
+                "Unable to read the Vault authentication methods: %s" % to_native(e)
+            )
+
+        if not terms:
+            return [mount_table]
+
+        return [mount_table.get(term.rstrip("/") + "/") for term in terms]
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+name: vault_status
+short_description: Reports the status of HashiCorp Vault servers
+description:
+  - Reads C(sys/seal-status), C(sys/health) and, for unsealed nodes, C(sys/leader) from every node concurrently,
+    on the controller.
+  - Returns the same C(cluster) summary and C(nodes) list as the M(dubzland.vault.vault_status) module.
+author:
+  - Josh Williams (@t3hpr1m3)
+requirements:
+  - python >= 3.8
+  - hvac >= 7.1.4
+options:
+  _terms:
+    description:
+      - URLs of the nodes to poll.
+      - When no URLs are given, O(url) is polled.
+    type: list
+    elements: str
+    required: false
+  url:
+    type: str
+    required: false
+    description: The resolvable endpoint for the Vault API, polled when no terms are given.
+  timeout:
+    type: int
+    default: 5
+    description: Seconds to wait for each node to answer.
+  retries:
+    type: int
+    default: 0
+    description: Number of times a failed request to a node is retried.
+  max_workers:
+    type: int
+    default: 8
+    description: Maximum number of nodes polled at the same time.
+extends_documentation_fragment:
+  - dubzland.vault.connection
+"""
+
+EXAMPLES = """
+- name: Only continue the rolling restart while the cluster is healthy
+  ansible.builtin.assert:
+    that:
+      - >-
+        lookup('dubzland.vault.vault_status',
+               'https://vault-1.example.com:8200',
+               'https://vault-2.example.com:8200',
+               'https://vault-3.example.com:8200').cluster.healthy
+
+- name: Show the active node
+  ansible.builtin.debug:
+    msg: >-
+      {{ lookup('dubzland.vault.vault_status',
+                'https://vault-1.example.com:8200',
+                'https://vault-2.example.com:8200').cluster.active }}
+"""
+
+RETURN = """
+_raw:
+  description:
+    - A single dictionary, holding the C(cluster) summary and the status of every node in C(nodes).
+  type: list
+  elements: dict
+"""
+
+from ansible.errors import AnsibleError
+from ansible.plugins.lookup import LookupBase
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_connection_options import (
+    VaultConnectionOptions,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_status import (
+    run_status,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultControllerModule,
+    VaultModuleFailure,
+)
+
+
+class LookupModule(LookupBase):
+    def get_params(self):
+        params = dict(max_workers=self.get_option("max_workers"), rate_limit=None)
+        for option in VaultConnectionOptions.ARGUMENT_SPEC:
+            params[option] = self.get_option(option)
+        return params
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+
+        params = self.get_params()
+        urls = terms or [params["url"]]
+        if not all(urls):
+            raise AnsibleError(
+                "The dubzland.vault.vault_status lookup requires node URLs, or the url option."
+            )
+        params["targets"] = [dict(url=url, namespace=None) for url in urls]
+
+        try:
+            result = run_status(VaultControllerModule(params))
+        except VaultModuleFailure as e:
+            raise AnsibleError(e.result["msg"])
+
+        return [dict(cluster=result["cluster"], nodes=result["nodes"])]
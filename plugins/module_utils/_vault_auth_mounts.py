@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from .vault_fanout import VaultFanout
+from .vault_reconciler import VaultMountReconciler, without_none
+
+
+AUTH_METHOD_TYPES = ["token", "userpass", "approle"]
+
+AUTH_METHOD_CONFIG_SPEC = dict(
+    default_lease_ttl=dict(type="str"),
+    max_lease_ttl=dict(type="str"),
+    audit_non_hmac_request_keys=dict(type="list", elements="str", no_log=True),
+    audit_non_hmac_response_keys=dict(type="list", elements="str", no_log=True),
+    listing_visibility=dict(type="list", elements="str"),
+    passthrough_request_headers=dict(type="list", elements="str", no_log=True),
+    allowed_response_headers=dict(type="list", elements="str"),
+    plugin_version=dict(type="str"),
+    identity_token_key=dict(type="str", no_log=True),
+)
+
+# Options of the vault_auth_method module, on top of the connection and
+# authentication options.
+AUTH_METHOD_ARGUMENT_SPEC = dict(
+    method_type=dict(type="str", choices=AUTH_METHOD_TYPES, required=True),
+    path=dict(type="str"),
+    description=dict(type="str"),
+    config=dict(type="dict", options=AUTH_METHOD_CONFIG_SPEC),
+    state=dict(default="present", choices=["present", "absent"]),
+    verify_result=dict(type="bool", default=False),
+    run_on_controller=dict(type="bool", default=False),
+    **VaultFanout.ARGUMENT_SPEC
+)
+
+
+def auth_method_path(method_type, path=None):
+    """Returns the mount path as it appears in the sys/auth listing, which always ends with a slash."""
+    if not path:
+        path = method_type
+    return path.rstrip("/") + "/"
+
+
+def desired_auth_method(method_type, description, config):
+    """Builds the desired mount table entry from the module options."""
+    return dict(type=method_type, description=description, config=without_none(config))
+
+
+class VaultAuthMethodReconciler(VaultMountReconciler):
+    """Reconciles the authentication methods mounted under sys/auth."""
+
+    KIND = "authentication method"
+    RESULT_KEY = "auth_method"
+
+    def list(self):
+        return self.client.sys.list_auth_methods().get("data")
+
+    def create(self, key, desired):
+        self.client.sys.enable_auth_method(
+            desired["type"],
+            description=desired["description"],
+            path=key,
+            config=desired["config"],
+        )
+
+    def update(self, key, desired, current, updated_keys):
+        self.client.sys.tune_auth_method(
+            key, description=desired["description"], **desired["config"]
+        )
+
+    def delete(self, key, current):
+        self.client.sys.disable_auth_method(key)
+
+    def read_tuning(self, key):
+        return self.client.sys.read_auth_method_tuning(key).get("data")
+
+    def is_protected(self, key, current):
+        # The token method is always mounted, and can not be disabled. Mounts of
+        # a type the modules can not manage, and the paths listed in
+        # ``exclude``, are left alone as well.
+        method_type = current.get("type")
+        if method_type == "token" or method_type not in AUTH_METHOD_TYPES:
+            return True
+        excluded = self.module.params.get("exclude") or []
+        return key in set(self.key(path) for path in excluded)
+
+
+def converge_auth_method(reconciler):
+    """Reconciles the authentication method described by the vault_auth_method parameters."""
+    params = reconciler.module.params
+    method_type = params["method_type"]
+
+    return reconciler.converge(
+        auth_method_path(method_type, params["path"]),
+        desired_auth_method(method_type, params["description"], params["config"]),
+        params["state"],
+        params["verify_result"],
+    )
+
+
+def run_auth_method(module):
+    """Runs vault_auth_method against every target, and returns the module result."""
+    return VaultAuthMethodReconciler.run(module, converge_auth_method)
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from contextlib import contextmanager
+
+
+DEFAULT_CACHE_DIRECTORY = os.path.join("~", ".ansible", "dubzland.vault")
+
+
+def default_cache_path(filename):
+    return os.path.join(os.path.expanduser(DEFAULT_CACHE_DIRECTORY), filename)
+
+
+# Small files already read by this process, by path, with the modification
+# time they were read at.
+_file_contents = {}
+
+
+def read_file(path):
+    """Returns the stripped contents of a small text file.
+
+    The contents are kept in memory, and only read again once the file's
+    modification time changes.
+
+    :raises OSError: When the file can not be read.
+    """
+    mtime = os.stat(path).st_mtime
+    cached = _file_contents.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path) as f:
+        contents = f.read().strip()
+    _file_contents[path] = (mtime, contents)
+
+    return contents
+
+
+def write_atomic(path, contents):
+    """Replaces ``path`` with ``contents``, readable by the owner only.
+
+    The contents go to a temporary file in the same directory first, so
+    readers never see a partially written file.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".", prefix=".vault-cache-"
+    )
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            tmp_file.write(contents)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class VaultFileCache(object):
+    """
+    Small JSON key/value store with per-entry expiry.
+
+    All reads and writes happen while holding an exclusive ``flock`` on a
+    sidecar lock file, so concurrent Ansible workers on the same controller
+    see a consistent view. The data file is always written with 0600
+    permissions and replaced atomically.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock_path = path + ".lock"
+        # Every thread takes the lock through its own file descriptor, so
+        # threads block each other just like separate processes do.
+        self._local = threading.local()
+
+    @staticmethod
+    def make_key(*parts):
+        data = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def locked(self):
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory, mode=0o700)
+            fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            self._local.fd = fd
+        self._local.depth = depth + 1
+        try:
+            yield self
+        finally:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                fcntl.flock(self._local.fd, fcntl.LOCK_UN)
+                os.close(self._local.fd)
+                self._local.fd = None
+
+    def _load(self):
+        try:
+            with open(self.path) as cache_file:
+                data = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def _save(self, data):
+        write_atomic(self.path, json.dumps(data))
+
+    def get(self, key):
+        with self.locked():
+            entry = self._load().get(key)
+
+        if entry is None or entry.get("expires_at", 0) <= time.time():
+            return None
+        return entry.get("value")
+
+    def set(self, key, value, ttl):
+        now = time.time()
+        with self.locked():
+            data = self._load()
+            data = dict((k, v) for k, v in data.items() if v.get("expires_at", 0) > now)
+            data[key] = dict(value=value, expires_at=now + ttl)
+            self._save(data)
+
+    def delete(self, key):
+        with self.locked():
+            data = self._load()
+            if data.pop(key, None) is not None:
+                self._save(data)
+
+
+class VaultMemoryCache(object):
+    """
+    Thread safe, in-process key/value store with per-entry expiry.
+
+    Used for things that are expensive to discover and only valid in the
+    current process, like cloud provider credential objects, which must not
+    be written to disk.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key, value, expires_at=None):
+        """Stores ``value`` until ``expires_at`` (a timestamp), or forever."""
+        if expires_at is None:
+            expires_at = float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class VaultTokenCache(object):
+    """Stores Vault login tokens until shortly before they expire."""
+
+    ARGUMENT_SPEC = dict(
+        token_cache=dict(type="bool", default=False),
+        token_cache_path=dict(type="path"),
+        token_cache_ttl=dict(type="int", default=3600),
+        token_cache_margin=dict(type="int", default=60),
+    )
+
+    def __init__(self, path=None, ttl=3600, margin=60):
+        if path is None:
+            path = default_cache_path("token_cache.json")
+        self._cache = VaultFileCache(path)
+        self.ttl = ttl
+        self.margin = margin
+
+    @classmethod
+    def from_params(cls, params):
+        if not params.get("token_cache"):
+            return None
+        return cls(
+            path=params.get("token_cache_path"),
+            ttl=params.get("token_cache_ttl") or 3600,
+            margin=params.get("token_cache_margin") or 0,
+        )
+
+    def locked(self):
+        return self._cache.locked()
+
+    def key(self, url, namespace, auth_method, mount_point, identity):
+        return VaultFileCache.make_key(
+            url, namespace, auth_method, mount_point, identity
+        )
+
+    def get(self, key):
+        return self._cache.get(key)
+
+    def is_fresh(self, entry):
+        return entry["expires_at"] - self.margin > time.time()
+
+    def store(self, key, response):
+        """Caches the token from a login or renew response. Returns the cached entry, if any."""
+        auth = response.get("auth") if isinstance(response, dict) else None
+        if not auth or not auth.get("client_token"):
+            return None
+
+        lease_duration = auth.get("lease_duration") or 0
+        ttl = min(lease_duration, self.ttl) if lease_duration > 0 else self.ttl
+        entry = dict(
+            token=auth["client_token"],
+            renewable=bool(auth.get("renewable")),
+            expires_at=time.time() + ttl,
+        )
+        self._cache.set(key, entry, ttl)
+        return entry
+
+    def delete(self, key):
+        self._cache.delete(key)
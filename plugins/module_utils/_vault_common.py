@@ -9,12 +9,40 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+def import_hvac():
+    """Imports hvac on first use. Returns None when it is not installed.
+
+    hvac pulls in requests, which is a large share of a module's start up
+    time, so it is only imported once a client is actually needed.
+    """
+    try:
+        import hvac
+    except ImportError:
+        return None
+    return hvac
+
+
 class VaultAuthenticationError(ValueError):
     """Use in authentication code to raise an Exception that can be turned into AnsibleError or used to fail_json()"""
 
 
+class VaultReconcileError(ValueError):
+    """Use in reconciliation code to raise an Exception that can be turned into AnsibleError or used to fail_json()"""
+
+
 class VaultAuthMethod:
+    """
+    Base class for authentication methods.
+
+    Subclasses implement ``validate()``, which checks the options without
+    talking to Vault, ``authenticate(client)``, which logs in and returns the
+    login response, and optionally ``cache_identity()`` to opt in to the
+    token cache. Options specific to the method are declared in
+    ``ARGUMENT_SPEC``, and passed to ``VaultAuth.register_method()``.
+    """
+
     NAME = None
+    ARGUMENT_SPEC = {}
 
     def __init__(self, options):
         self._options = options
@@ -32,5 +60,14 @@ class VaultAuthMethod:
     def login_params(self, *field_names):
         params = {}
         for field in field_names:
-            params = self._options[field]
+            value = self._options.get(field)
+            if value is not None:
+                params[field] = value
         return params
+
+    def cache_identity(self):
+        """Identifies the principal being logged in as, for the token cache.
+
+        Returning None (the default) disables token caching for the method.
+        """
+        return None
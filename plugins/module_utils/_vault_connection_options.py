@@ -8,12 +8,143 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+# Responses worth retrying: 412 is returned by performance standbys that have
+# not caught up with a write yet, 429 by rate limit quotas, and the 5xx codes
+# by a load balancer or a node that is stepping down.
+RETRY_STATUS_CODES = (412, 429, 500, 502, 503, 504)
+
+# Requests that are safe to send again once Vault may have received them.
+# Vault uses PUT and DELETE for writes that are not idempotent (sys/init,
+# unsealing, logins), so only reads are retried on any status or read error.
+RETRY_METHODS = frozenset(["GET", "HEAD", "LIST", "OPTIONS"])
+
+# Responses returned before Vault applies a write, on which writes are
+# retried too.
+RETRY_WRITE_STATUS_CODES = (412, 429)
+
+# Sessions are shared by every client built with the same pool, retry and TLS
+# settings, so connections (and their TLS handshakes) are reused across all
+# of the requests made during a module run.
+_sessions = {}
+
+
+def _build_retry(retries, backoff_factor):
+    from urllib3.util.retry import Retry
+
+    class VaultRetry(Retry):
+        # Connection errors are retried for every method by urllib3, as the
+        # request never reached Vault.
+        def is_retry(self, method, status_code, has_retry_after=False):
+            if not self._is_method_retryable(method):
+                return status_code in RETRY_WRITE_STATUS_CODES
+            return super(VaultRetry, self).is_retry(
+                method, status_code, has_retry_after
+            )
+
+    kwargs = dict(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    try:
+        return VaultRetry(allowed_methods=RETRY_METHODS, **kwargs)
+    except TypeError:
+        # urllib3 < 1.26
+        return VaultRetry(method_whitelist=RETRY_METHODS, **kwargs)
+
+
+def get_session(
+    pool_connections, pool_maxsize, retries, backoff_factor, verify=True, cert=None
+):
+    key = (pool_connections, pool_maxsize, retries, backoff_factor, verify, cert)
+    session = _sessions.get(key)
+    if session is None:
+        # requests is imported here rather than at the top of the module, as
+        # it comes with hvac and is only needed once a client is built.
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=_build_retry(retries, backoff_factor),
+        )
+        session = requests.Session()
+        # hvac prefers the TLS settings of a session it is given over its own
+        # verify and cert arguments whenever the session verifies, which a
+        # new session always does.
+        session.verify = verify
+        session.cert = cert
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _sessions[key] = session
+
+    return session
+
 
 class VaultConnectionOptions(object):
-    ARGUMENT_SPEC = dict(url=dict(type="str", required=True))
+    ARGUMENT_SPEC = dict(
+        url=dict(type="str", required=True),
+        namespace=dict(type="str"),
+        timeout=dict(type="int", default=30),
+        validate_certs=dict(type="bool", default=True),
+        ca_cert=dict(type="path", aliases=["cacert"]),
+        client_cert=dict(type="path"),
+        client_key=dict(type="path", no_log=False),
+        pool_connections=dict(type="int", default=10),
+        pool_maxsize=dict(type="int", default=10),
+        retries=dict(type="int", default=3),
+        retry_backoff_factor=dict(type="float", default=0.3),
+    )
 
     def __init__(self, params):
         self.url = params.get("url")
+        self.namespace = params.get("namespace")
+        self.timeout = params.get("timeout", 30)
+        self.validate_certs = params.get("validate_certs", True)
+        self.ca_cert = params.get("ca_cert")
+        self.client_cert = params.get("client_cert")
+        self.client_key = params.get("client_key")
+        self.pool_connections = params.get("pool_connections", 10)
+        self.pool_maxsize = params.get("pool_maxsize", 10)
+        self.retries = params.get("retries", 3)
+        self.retry_backoff_factor = params.get("retry_backoff_factor", 0.3)
+
+    def get_verify(self):
+        if not self.validate_certs:
+            return False
+        return self.ca_cert or True
+
+    def get_cert(self):
+        if self.client_cert and self.client_key:
+            return (self.client_cert, self.client_key)
+        return self.client_cert
+
+    def get_session(self):
+        try:
+            return get_session(
+                self.pool_connections,
+                self.pool_maxsize,
+                self.retries,
+                self.retry_backoff_factor,
+                self.get_verify(),
+                self.get_cert(),
+            )
+        except ImportError:
+            return None
 
     def get_hvac_connection_params(self):
-        return dict(url=self.url)
+        params = dict(
+            url=self.url,
+            namespace=self.namespace,
+            timeout=self.timeout,
+            verify=self.get_verify(),
+            cert=self.get_cert(),
+        )
+        session = self.get_session()
+        if session is not None:
+            params["session"] = session
+
+        return params
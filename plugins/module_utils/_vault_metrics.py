@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+
+# Number of requests listed in a result. Bulk modules can send thousands, and
+# the totals always cover all of them.
+MAX_REQUESTS = 500
+
+
+def request_path(url):
+    """Returns the API path a request was sent to, as Vault names it, e.g. ``sys/auth``."""
+    path = urlsplit(url).path
+    if path.startswith("/v1/"):
+        path = path[len("/v1/") :]
+    return path.lstrip("/")
+
+
+class VaultMetrics(object):
+    """
+    Records every request sent to Vault, and every login, during a module
+    run, for the ``vault_metrics`` key of the module result.
+
+    Requests are recorded by wrapping the ``request`` method of each client's
+    adapter, so workers sharing the metrics of a module record into the same
+    lists.
+    """
+
+    ARGUMENT_SPEC = dict(
+        metrics=dict(type="bool", default=False),
+    )
+
+    def __init__(self, max_requests=MAX_REQUESTS):
+        self.max_requests = max_requests
+        self.requests = []
+        self.logins = []
+        self._totals = dict(
+            requests=0, errors=0, retries=0, seconds=0.0, bytes_sent=0, bytes_received=0
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_params(cls, params):
+        if not params.get("metrics"):
+            return None
+        return cls()
+
+    def instrument(self, client):
+        """Records every request sent by ``client`` from now on."""
+        request = client.adapter.request
+
+        def instrumented(method, url, *args, **kwargs):
+            sample = dict(
+                method=method.upper(),
+                path=request_path(url),
+                status=None,
+                retries=0,
+                bytes_sent=0,
+                bytes_received=0,
+            )
+            hooks = dict(kwargs.pop("hooks", None) or {})
+            response_hooks = hooks.get("response") or []
+            if callable(response_hooks):
+                response_hooks = [response_hooks]
+            hooks["response"] = list(response_hooks) + [
+                lambda response, *a, **kw: self._measure(sample, response)
+            ]
+
+            started = time.monotonic()
+            try:
+                return request(method, url, *args, hooks=hooks, **kwargs)
+            finally:
+                sample["seconds"] = round(time.monotonic() - started, 6)
+                self.record_request(sample)
+
+        client.adapter.request = instrumented
+        return client
+
+    @staticmethod
+    def _measure(sample, response):
+        """Fills the status, size and retries of a request in from its response."""
+        sample["status"] = response.status_code
+        body = getattr(response.request, "body", None)
+        sample["bytes_sent"] = len(body) if body else 0
+        sample["bytes_received"] = len(response.content or b"")
+        retries = getattr(response.raw, "retries", None)
+        sample["retries"] = len(getattr(retries, "history", None) or ())
+
+    def record_request(self, sample):
+        with self._lock:
+            totals = self._totals
+            totals["requests"] += 1
+            totals["seconds"] += sample["seconds"]
+            totals["retries"] += sample["retries"]
+            totals["bytes_sent"] += sample["bytes_sent"]
+            totals["bytes_received"] += sample["bytes_received"]
+            if sample["status"] is None or sample["status"] >= 400:
+                totals["errors"] += 1
+            if len(self.requests) < self.max_requests:
+                self.requests.append(sample)
+
+    def record_login(self, auth_method, seconds, cached=False):
+        """Records the time spent getting a token, whether it came from the token cache or not."""
+        with self._lock:
+            self.logins.append(
+                dict(auth_method=auth_method, seconds=round(seconds, 6), cached=cached)
+            )
+
+    def as_result(self):
+        """Returns the recorded requests, logins and totals, as returned in ``vault_metrics``."""
+        with self._lock:
+            totals = dict(self._totals, logins=len(self.logins))
+            totals["seconds"] = round(totals["seconds"], 6)
+            return dict(
+                requests=list(self.requests),
+                logins=list(self.logins),
+                totals=totals,
+            )
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible.module_utils.common.text.converters import to_native
+
+from .vault_fanout import VaultFanout
+from .vault_module import ensure_hvac_package
+
+
+# sys/health reports the node state through its status code by default
+# (429 for standbys, 503 when sealed, ...). Asking for 200 in every state
+# keeps those responses out of the connection's retry logic, and the state
+# is read from the body instead.
+HEALTH_PARAMS = dict(
+    standby_ok=True,
+    active_code=200,
+    standby_code=200,
+    dr_secondary_code=200,
+    performance_standby_code=200,
+    sealed_code=200,
+    uninit_code=200,
+    method="GET",
+)
+
+# Status polling should fail fast: a node that does not answer is reported
+# as unreachable rather than retried.
+STATUS_ARGUMENT_SPEC = dict(
+    timeout=dict(type="int", default=5),
+    retries=dict(type="int", default=0),
+    **VaultFanout.ARGUMENT_SPEC
+)
+
+
+def _json(response):
+    if hasattr(response, "json"):
+        return response.json()
+    return response
+
+
+def read_node_status(client):
+    """Reads the seal status, health and, when unsealed, the HA leader of a single node."""
+    try:
+        seal_status = client.sys.read_seal_status()
+        health = _json(client.sys.read_health_status(**HEALTH_PARAMS))
+        status = dict(
+            reachable=True,
+            initialized=health.get("initialized", seal_status.get("initialized")),
+            sealed=seal_status["sealed"],
+            standby=health.get("standby", False),
+            performance_standby=health.get("performance_standby", False),
+            progress=seal_status.get("progress"),
+            threshold=seal_status.get("t"),
+            shares=seal_status.get("n"),
+            version=seal_status.get("version") or health.get("version"),
+            cluster_name=seal_status.get("cluster_name") or health.get("cluster_name"),
+            leader_address=None,
+        )
+        if status["initialized"] and not status["sealed"]:
+            leader = client.sys.read_leader_status()
+            status["leader_address"] = leader.get("leader_address") or None
+    except Exception as e:
+        return dict(reachable=False, active=False, error=to_native(e))
+
+    status["active"] = bool(
+        status["initialized"] and not status["sealed"] and not status["standby"]
+    )
+    return status
+
+
+def summarize(nodes):
+    """Condenses per-node statuses into a summary of the whole cluster."""
+    reachable = [node for node in nodes if node["reachable"]]
+    active = [node["url"] for node in nodes if node["active"]]
+    sealed = [node["url"] for node in reachable if node["sealed"]]
+
+    return dict(
+        nodes=len(nodes),
+        reachable=len(reachable),
+        unreachable=[node["url"] for node in nodes if not node["reachable"]],
+        initialized=bool(reachable) and all(node["initialized"] for node in reachable),
+        sealed=sealed,
+        active=active,
+        standby=[
+            node["url"] for node in reachable if node["standby"] and not node["sealed"]
+        ],
+        versions=sorted(set(node["version"] for node in reachable if node["version"])),
+        healthy=len(reachable) == len(nodes) and not sealed and len(active) == 1,
+    )
+
+
+def run_status(module):
+    """Polls every node concurrently, and returns the module result."""
+    ensure_hvac_package(module)
+
+    fanout = VaultFanout(module)
+    results = fanout.run(
+        lambda client, target: read_node_status(client), authenticate=False
+    )
+
+    nodes = []
+    for result in results:
+        result.pop("namespace", None)
+        if result.pop("failed"):
+            result.update(reachable=False, active=False, error=result.pop("msg"))
+        nodes.append(result)
+
+    return dict(changed=False, cluster=summarize(nodes), nodes=nodes)
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import contextlib
+import os
+
+from ._vault_metrics import request_path
+
+
+# Returned by span() when tracing is disabled, so callers do not need to
+# check whether it is enabled.
+_NO_SPAN = contextlib.nullcontext()
+
+
+def span(tracing, name, **attributes):
+    """Returns a context manager recording a span named ``name`` with ``tracing``, when it is enabled."""
+    if tracing is None:
+        return _NO_SPAN
+    return tracing.span(name, **attributes)
+
+
+def propagate(tracing, func):
+    """Returns ``func``, run under the span current at the time of the call, for handing to another thread."""
+    if tracing is None:
+        return func
+    return tracing.propagate(func)
+
+
+def inject_context(module_args):
+    """Returns ``module_args``, with the trace context of the controller in ``tracing``.
+
+    The context is taken from the current OpenTelemetry span of the
+    controller, when there is one, or from the E(TRACEPARENT) and
+    E(TRACESTATE) environment variables otherwise. Nothing is changed when
+    tracing is disabled or a ``traceparent`` was given.
+    """
+    tracing = module_args.get("tracing")
+    if not isinstance(tracing, dict) or tracing.get("traceparent"):
+        return module_args
+
+    carrier = {}
+    try:
+        from opentelemetry import propagate as otel_propagate
+    except ImportError:
+        pass
+    else:
+        otel_propagate.inject(carrier)
+    if not carrier.get("traceparent"):
+        carrier = dict(
+            traceparent=os.environ.get("TRACEPARENT"),
+            tracestate=os.environ.get("TRACESTATE"),
+        )
+    if not carrier.get("traceparent"):
+        return module_args
+
+    tracing = dict(tracing, traceparent=carrier["traceparent"])
+    if carrier.get("tracestate") and not tracing.get("tracestate"):
+        tracing["tracestate"] = carrier["tracestate"]
+    return dict(module_args, tracing=tracing)
+
+
+class VaultTracingDependencyError(ImportError):
+    """Raised when tracing is enabled, but a package it needs is not installed."""
+
+    def __init__(self, library):
+        super(VaultTracingDependencyError, self).__init__(library)
+        self.library = library
+
+
+class VaultTracing(object):
+    """
+    Records OpenTelemetry spans for a module run: one for the whole run,
+    with a span for every login, request and reconciled resource under it.
+
+    OpenTelemetry is only imported once tracing is enabled with the
+    ``tracing`` option, so modules run without it pay nothing for it. The
+    spans are exported with a provider of their own, flushed when the
+    module exits, rather than through the global one.
+    """
+
+    ARGUMENT_SPEC = dict(
+        tracing=dict(
+            type="dict",
+            options=dict(
+                traceparent=dict(type="str"),
+                tracestate=dict(type="str"),
+                exporter=dict(type="str", default="otlp", choices=["otlp", "file"]),
+                endpoint=dict(type="str"),
+                headers=dict(type="dict", no_log=True),
+                path=dict(type="path"),
+                service_name=dict(type="str", default="ansible"),
+            ),
+            required_if=[("exporter", "file", ("path",))],
+        ),
+    )
+
+    def __init__(self, options, name):
+        try:
+            from opentelemetry import context, trace
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            from opentelemetry.trace.propagation.tracecontext import (
+                TraceContextTextMapPropagator,
+            )
+        except ImportError:
+            raise VaultTracingDependencyError("opentelemetry-sdk")
+
+        self._context = context
+        self._trace = trace
+        self._output = None
+        self._provider = TracerProvider(
+            resource=Resource.create({"service.name": options["service_name"]})
+        )
+        self._provider.add_span_processor(BatchSpanProcessor(self._exporter(options)))
+        self._tracer = self._provider.get_tracer("dubzland.vault")
+
+        carrier = dict(
+            (key, options[key])
+            for key in ("traceparent", "tracestate")
+            if options.get(key)
+        )
+        parent = TraceContextTextMapPropagator().extract(carrier)
+        self._root = self._tracer.start_span(name, context=parent)
+        self._root_context = trace.set_span_in_context(self._root)
+
+    def _exporter(self, options):
+        if options["exporter"] == "file":
+            from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+            # One JSON document per line, so that concurrent runs can append
+            # to the same file.
+            self._output = open(options["path"], "a")
+            return ConsoleSpanExporter(
+                out=self._output,
+                formatter=lambda span: span.to_json(indent=None) + "\n",
+            )
+
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+        except ImportError:
+            raise VaultTracingDependencyError("opentelemetry-exporter-otlp-proto-http")
+        return OTLPSpanExporter(
+            endpoint=options.get("endpoint"), headers=options.get("headers")
+        )
+
+    @classmethod
+    def from_params(cls, params, name):
+        """Returns the tracing for a module named ``name``, or None when it is disabled.
+
+        :raises VaultTracingDependencyError: When OpenTelemetry is not installed.
+        """
+        if not params.get("tracing"):
+            return None
+        return cls(params["tracing"], name)
+
+    @property
+    def trace_id(self):
+        return "%032x" % self._root.get_span_context().trace_id
+
+    @contextlib.contextmanager
+    def span(self, name, **attributes):
+        """Records a span, under the current span or, in new threads, the span of the module run."""
+        context = None
+        if not self._trace.get_current_span().get_span_context().is_valid:
+            context = self._root_context
+        with self._tracer.start_as_current_span(
+            name,
+            context=context,
+            attributes=dict(
+                (key, value) for key, value in attributes.items() if value is not None
+            ),
+        ) as current:
+            yield current
+
+    def propagate(self, func):
+        """Returns ``func``, run under the span current now, for handing to another thread."""
+        current = self._context.get_current()
+
+        def attached(*args, **kwargs):
+            token = self._context.attach(current)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._context.detach(token)
+
+        return attached
+
+    def instrument(self, client):
+        """Records a span for every request sent by ``client`` from now on."""
+        request = client.adapter.request
+
+        def traced(method, url, *args, **kwargs):
+            hooks = dict(kwargs.pop("hooks", None) or {})
+            response_hooks = hooks.get("response") or []
+            if callable(response_hooks):
+                response_hooks = [response_hooks]
+
+            with self.span(
+                "HTTP %s" % method.upper(),
+                **{
+                    "http.request.method": method.upper(),
+                    "url.path": request_path(url),
+                }
+            ) as current:
+
+                def record(response, *a, **kw):
+                    current.set_attribute(
+                        "http.response.status_code", response.status_code
+                    )
+                    retries = getattr(response.raw, "retries", None)
+                    history = getattr(retries, "history", None)
+                    if history:
+                        current.set_attribute("http.request.resend_count", len(history))
+
+                hooks["response"] = list(response_hooks) + [record]
+                return request(method, url, *args, hooks=hooks, **kwargs)
+
+        client.adapter.request = traced
+        return client
+
+    def finish(self, failed=False):
+        """Ends the span of the module run, and exports every span recorded."""
+        if failed:
+            self._root.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        self._root.end()
+        self._provider.shutdown()
+        if self._output is not None:
+            self._output.close()
@@ -8,16 +8,95 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import copy
+import time
 
-from .vault_auth_method_app_role import VaultAuthMethodAppRole
-from .vault_auth_method_aws_iam import VaultAuthMethodAwsIam
-from .vault_auth_method_azure import VaultAuthMethodAzure
-from .vault_auth_method_cert import VaultAuthMethodCert
-from .vault_auth_method_jwt import VaultAuthMethodJwt
-from .vault_auth_method_ldap import VaultAuthMethodLdap
-from .vault_auth_method_none import VaultAuthMethodNone
-from .vault_auth_method_token import VaultAuthMethodToken
-from .vault_auth_method_userpass import VaultAuthMethodUserpass
+from ._vault_cache import VaultTokenCache
+from ._vault_tracing import span
+
+
+# Authentication methods are imported by the loaders below when first
+# selected, so a task only pays for the one it uses. The imports are kept
+# static (inside functions) so that AnsiballZ still finds and ships them.
+# Additional methods are added with VaultAuth.register_method().
+def _load_approle():
+    from .vault_auth_method_app_role import VaultAuthMethodAppRole
+
+    return VaultAuthMethodAppRole
+
+
+def _load_aws_iam():
+    from .vault_auth_method_aws_iam import VaultAuthMethodAwsIam
+
+    return VaultAuthMethodAwsIam
+
+
+def _load_azure():
+    from .vault_auth_method_azure import VaultAuthMethodAzure
+
+    return VaultAuthMethodAzure
+
+
+def _load_cert():
+    from .vault_auth_method_cert import VaultAuthMethodCert
+
+    return VaultAuthMethodCert
+
+
+def _load_jwt():
+    from .vault_auth_method_jwt import VaultAuthMethodJwt
+
+    return VaultAuthMethodJwt
+
+
+def _load_kubernetes():
+    from .vault_auth_method_kubernetes import VaultAuthMethodKubernetes
+
+    return VaultAuthMethodKubernetes
+
+
+def _load_ldap():
+    from .vault_auth_method_ldap import VaultAuthMethodLdap
+
+    return VaultAuthMethodLdap
+
+
+def _load_none():
+    from .vault_auth_method_none import VaultAuthMethodNone
+
+    return VaultAuthMethodNone
+
+
+def _load_token():
+    from .vault_auth_method_token import VaultAuthMethodToken
+
+    return VaultAuthMethodToken
+
+
+def _load_userpass():
+    from .vault_auth_method_userpass import VaultAuthMethodUserpass
+
+    return VaultAuthMethodUserpass
+
+
+# Built-in authentication methods. Those added with register_method() are
+# kept apart, in _registered_methods.
+AUTH_METHOD_LOADERS = {
+    "approle": _load_approle,
+    "aws_iam": _load_aws_iam,
+    "azure": _load_azure,
+    "cert": _load_cert,
+    "jwt": _load_jwt,
+    "kubernetes": _load_kubernetes,
+    "ldap": _load_ldap,
+    "none": _load_none,
+    "token": _load_token,
+    "userpass": _load_userpass,
+}
+
+# Loader and options of every method added with VaultAuth.register_method(),
+# by name.
+_registered_methods = {}
 
 
 class VaultAuth(object):
@@ -25,23 +104,14 @@ class VaultAuth(object):
         auth_method=dict(
             type="str",
             default="token",
-            choices=[
-                "approle",
-                "aws_iam",
-                "azure",
-                "cert",
-                "jwt",
-                "ldap",
-                "token",
-                "userpass",
-                "none",
-            ],
+            choices=sorted(AUTH_METHOD_LOADERS),
         ),
         mount_point=dict(type="str"),
         token=dict(type="str", no_log=True),
         token_path=dict(type="str", default=None, no_log=False),
         token_filename=dict(type="str", default=".vault-token"),
         token_validate=dict(type="bool", default=False),
+        token_renew_threshold=dict(type="int"),
         username=dict(type="str", no_log=True),
         password=dict(type="str", no_log=True),
         role_id=dict(type="str", no_log=True),
@@ -59,32 +129,136 @@ class VaultAuth(object):
         azure_resource=dict(type="str", default="https://management.azure.com/"),
         cert_auth_private_key=dict(type="path", no_log=False),
         cert_auth_public_key=dict(type="path"),
+        kubernetes_token_path=dict(type="path"),
+        **VaultTokenCache.ARGUMENT_SPEC
     )
 
-    def __init__(self, params):
-        self._authenticators = {
-            "approle": VaultAuthMethodAppRole,
-            "aws_iam": VaultAuthMethodAwsIam,
-            "azure": VaultAuthMethodAzure,
-            "cert": VaultAuthMethodCert,
-            "jwt": VaultAuthMethodJwt,
-            "ldap": VaultAuthMethodLdap,
-            "none": VaultAuthMethodNone,
-            "token": VaultAuthMethodToken,
-            "userpass": VaultAuthMethodUserpass,
-        }
+    @classmethod
+    def register_method(cls, name, loader, argument_spec=None):
+        """Makes an additional authentication method available as ``auth_method=name``.
+
+        Must be called before the module's argument spec is generated.
+
+        :param name: Value of the auth_method option selecting the method.
+        :type name: str
+        :param loader: Called without arguments the first time the method is
+            selected, and returns its VaultAuthMethod subclass.
+        :type loader: callable
+        :param argument_spec: Options the method needs on top of the shared
+            ones, usually the class's ``ARGUMENT_SPEC``. It is given here so
+            the class does not have to be imported to build the spec.
+        :type argument_spec: dict
+
+        :raises ValueError: When an option is already declared differently.
+        """
+        argument_spec = argument_spec or {}
+        declared = cls.argument_spec()
+        for option, spec in argument_spec.items():
+            if option in declared and declared[option] != spec:
+                raise ValueError(
+                    "Authentication method %s redefines the %s option" % (name, option)
+                )
+
+        _registered_methods[name] = (loader, argument_spec)
+
+    @classmethod
+    def argument_spec(cls):
+        """Returns a new copy of the options of every authentication method.
+
+        ``ARGUMENT_SPEC`` only holds the built-in methods, so that registering
+        a method never changes it; the registered ones are added here.
+        """
+        spec = copy.deepcopy(cls.ARGUMENT_SPEC)
+        for loader, argument_spec in _registered_methods.values():
+            spec.update(copy.deepcopy(argument_spec))
+        spec["auth_method"]["choices"] = sorted(
+            set(AUTH_METHOD_LOADERS) | set(_registered_methods)
+        )
+        return spec
+
+    def __init__(self, params, metrics=None, tracing=None):
         self._params = params
         self._authenticator = None
+        self._token_cache = VaultTokenCache.from_params(params)
+        self.metrics = metrics
+        self.tracing = tracing
 
     def get_authenticator(self):
         if self._authenticator is None:
             auth_method = self._params.get("auth_method")
-            self._authenticator = self._authenticators[auth_method](self._params)
+            if auth_method in _registered_methods:
+                loader = _registered_methods[auth_method][0]
+            else:
+                loader = AUTH_METHOD_LOADERS[auth_method]
+            method_class = loader()
+            self._authenticator = method_class(self._params)
 
         return self._authenticator
 
     def validate(self):
         self.get_authenticator().validate()
 
-    def authenticate(self, client):
-        self.get_authenticator().authenticate(client)
+    def authenticate(self, client, url=None, namespace=None):
+        auth_method = self._params.get("auth_method")
+        with span(
+            self.tracing,
+            "vault.authenticate",
+            **{
+                "vault.auth_method": auth_method,
+                "vault.url": url or self._params.get("url"),
+                "vault.namespace": namespace or self._params.get("namespace"),
+            }
+        ) as current:
+            started = time.monotonic()
+            logged_in = self._authenticate(client, url, namespace)
+            if current is not None:
+                current.set_attribute("vault.token_cached", not logged_in)
+            if self.metrics is not None:
+                self.metrics.record_login(
+                    auth_method, time.monotonic() - started, cached=not logged_in
+                )
+
+    def _authenticate(self, client, url, namespace):
+        """Sets the token of ``client``.
+
+        :return: Whether the authentication method logged in, rather than the
+            token being taken from the token cache.
+        :rtype: bool
+        """
+        authenticator = self.get_authenticator()
+        identity = authenticator.cache_identity()
+        if self._token_cache is None or identity is None:
+            authenticator.authenticate(client)
+            return True
+
+        cache = self._token_cache
+        key = cache.key(
+            url or self._params.get("url"),
+            namespace or self._params.get("namespace"),
+            self._params.get("auth_method"),
+            self._params.get("mount_point"),
+            identity,
+        )
+
+        # Hold the cache lock across the login, so parallel workers wait for
+        # a single login instead of each creating their own token.
+        with cache.locked():
+            entry = cache.get(key)
+            if entry is not None:
+                client.token = entry["token"]
+                if cache.is_fresh(entry):
+                    return False
+                if entry["renewable"]:
+                    try:
+                        response = client.auth.token.renew_self()
+                    except Exception:
+                        response = None
+                    if cache.store(key, response) is not None:
+                        return False
+                cache.delete(key)
+
+            response = authenticator.authenticate(client)
+            entry = cache.store(key, response)
+            if entry is not None:
+                client.token = entry["token"]
+            return True
@@ -20,4 +20,7 @@ class VaultAuthMethodAppRole(VaultAuthMethod):
 
     def authenticate(self, client, use_token=True):
         params = self.login_params(*self.AUTH_FIELDS)
-        client.auth.approle.login(use_token=use_token, **params)
+        return client.auth.approle.login(use_token=use_token, **params)
+
+    def cache_identity(self):
+        return [self._options.get("role_id"), self._options.get("secret_id")]
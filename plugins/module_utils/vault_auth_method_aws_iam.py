@@ -8,9 +8,42 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ._vault_cache import VaultMemoryCache
 from ._vault_common import VaultAuthMethod, VaultAuthenticationError
 
 
+# Credentials resolved from a profile or the instance metadata service, by
+# profile name. botocore refreshes temporary credentials itself shortly before
+# they expire, so the objects can be kept for the life of the process.
+_session_credentials = VaultMemoryCache()
+
+
+def get_session_credentials(profile):
+    credentials = _session_credentials.get(profile)
+    if credentials is None:
+        try:
+            import boto3
+            import botocore
+        except ImportError:
+            raise VaultAuthenticationError(
+                "boto3 is required for loading a profile or IAM role credentials."
+            )
+
+        try:
+            credentials = boto3.session.Session(profile_name=profile).get_credentials()
+        except botocore.exceptions.ProfileNotFound:
+            raise VaultAuthenticationError(
+                "The AWS profile '%s' was not found." % profile
+            )
+
+        if not credentials:
+            raise VaultAuthenticationError("No AWS credentials supplied or available.")
+
+        _session_credentials.set(profile, credentials)
+
+    return credentials.get_frozen_credentials()
+
+
 class VaultAuthMethodAwsIam(VaultAuthMethod):
     NAME = "aws_iam"
     AUTH_FIELDS = [
@@ -49,37 +82,25 @@ class VaultAuthMethodAwsIam(VaultAuthMethod):
         if header_value:
             params["header_value"] = header_value
 
-        if not (params["access_key"] and params["secret_key"]):
-            try:
-                import boto3
-                import botocore
-            except ImportError:
-                raise VaultAuthenticationError(
-                    "boto3 is required for loading a profile or IAM role credentials."
-                )
-
-            profile = self._options.get("aws_profile")
-            try:
-                session_credentials = boto3.session.Session(
-                    profile_name=profile
-                ).get_credentials()
-            except botocore.exceptions.ProfileNotFound:
-                raise VaultAuthenticationError(
-                    "The AWS profile '%s' was not found." % profile
-                )
-
-            if not session_credentials:
-                raise VaultAuthenticationError(
-                    "No AWS credentials supplied or available."
-                )
-
-            params["access_key"] = session_credentials.access_key
-            params["secret_key"] = session_credentials.secret_key
-            if session_credentials.token:
-                params["session_token"] = session_credentials.token
-
         self._auth_aws_iam_login_params = params
 
     def authenticate(self, client, use_token=True):
-        params = self._auth_aws_iam_login_params
-        client.auth.aws.iam_login(use_token=use_token, **params)
+        params = dict(self._auth_aws_iam_login_params)
+
+        # Credentials are only discovered once a login is actually needed, so
+        # a cached Vault token skips the trip to STS or the metadata service.
+        if not (params["access_key"] and params["secret_key"]):
+            credentials = get_session_credentials(self._options.get("aws_profile"))
+            params["access_key"] = credentials.access_key
+            params["secret_key"] = credentials.secret_key
+            if credentials.token:
+                params["session_token"] = credentials.token
+
+        return client.auth.aws.iam_login(use_token=use_token, **params)
+
+    def cache_identity(self):
+        return [
+            self._options.get("role_id"),
+            self._options.get("aws_profile"),
+            self._options.get("aws_access_key"),
+        ]
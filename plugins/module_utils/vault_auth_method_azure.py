@@ -8,9 +8,55 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from ._vault_cache import VaultFileCache, VaultMemoryCache
 from ._vault_common import VaultAuthMethod, VaultAuthenticationError
 
 
+# Access tokens are dropped this many seconds before they expire.
+TOKEN_EXPIRY_MARGIN = 300
+
+# Credential objects and the access tokens they handed out, keyed by the
+# service principal or managed identity they belong to.
+_credentials = VaultMemoryCache()
+_access_tokens = VaultMemoryCache()
+
+
+def _get_credential(tenant_id, client_id, client_secret):
+    key = VaultFileCache.make_key(tenant_id, client_id, client_secret)
+    credential = _credentials.get(key)
+    if credential is None:
+        try:
+            import azure.identity
+        except ImportError:
+            raise VaultAuthenticationError(
+                "azure-identity is required for getting access token from azure service principal or managed identity."
+            )
+
+        if client_id and client_secret:
+            credential = azure.identity.ClientSecretCredential(
+                tenant_id, client_id, client_secret
+            )
+        elif client_id:
+            credential = azure.identity.ManagedIdentityCredential(client_id=client_id)
+        else:
+            credential = azure.identity.ManagedIdentityCredential()
+        _credentials.set(key, credential)
+
+    return credential
+
+
+def get_access_token(tenant_id, client_id, client_secret, scope):
+    key = VaultFileCache.make_key(tenant_id, client_id, client_secret, scope)
+    token = _access_tokens.get(key)
+    if token is None:
+        credential = _get_credential(tenant_id, client_id, client_secret)
+        access_token = credential.get_token(scope)
+        token = access_token.token
+        _access_tokens.set(key, token, access_token.expires_on - TOKEN_EXPIRY_MARGIN)
+
+    return token
+
+
 class VaultAuthMethodAzure(VaultAuthMethod):
     NAME = "azure"
     AUTH_FIELDS = [
@@ -37,40 +83,36 @@ class VaultAuthMethodAzure(VaultAuthMethod):
         if mount_point:
             params["mount_point"] = mount_point
 
-        if not params["jwt"]:
-            azure_tenant_id = self._options.get("azure_tenant_id")
-            azure_client_id = self._options.get("azure_client_id")
-            azure_client_secret = self._options.get("azure_client_secret")
-
-            azure_resource = self._options.get("azure_resource")
-            azure_scope = azure_resource + "/.default"
-
-            try:
-                import azure.identity
-            except ImportError:
-                raise VaultAuthenticationError(
-                    "azure-identity is required for getting access token from azure service principal or managed identity."
-                )
-
-            if azure_client_id and azure_client_secret:
-                if not azure_tenant_id:
-                    raise VaultAuthenticationError(
-                        "azure_tenant_id is required when using azure service principal."
-                    )
-                azure_credentials = azure.identity.ClientSecretCredential(
-                    azure_tenant_id, azure_client_id, azure_client_secret
-                )
-            elif azure_client_id:
-                azure_credentials = azure.identity.ManagedIdentityCredential(
-                    client_id=azure_client_id
-                )
-            else:
-                azure_credentials = azure.identity.ManagedIdentityCredential()
-
-            params["jwt"] = azure_credentials.get_token(azure_scope).token
+        if (
+            not params["jwt"]
+            and self._options.get("azure_client_id")
+            and self._options.get("azure_client_secret")
+            and not self._options.get("azure_tenant_id")
+        ):
+            raise VaultAuthenticationError(
+                "azure_tenant_id is required when using azure service principal."
+            )
 
         self._auth_azure_login_params = params
 
     def authenticate(self, client, use_token=True):
-        params = self._auth_azure_login_params
-        client.auth.azure.login(use_token=use_token, **params)
+        params = dict(self._auth_azure_login_params)
+
+        # The access token is only requested once a login is actually needed,
+        # so a cached Vault token skips the trip to Azure AD or IMDS.
+        if not params["jwt"]:
+            params["jwt"] = get_access_token(
+                self._options.get("azure_tenant_id"),
+                self._options.get("azure_client_id"),
+                self._options.get("azure_client_secret"),
+                self._options.get("azure_resource") + "/.default",
+            )
+
+        return client.auth.azure.login(use_token=use_token, **params)
+
+    def cache_identity(self):
+        return [
+            self._options.get("role_id"),
+            self._options.get("azure_tenant_id"),
+            self._options.get("azure_client_id"),
+        ]
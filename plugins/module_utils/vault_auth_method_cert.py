@@ -21,7 +21,7 @@ class VaultAuthMethodCert(VaultAuthMethod):
     ]
 
     def validate(self):
-        self.validate_required_fields(["cert_auth_public_key", "cert_auth_private_key"])
+        self.validate_required_fields("cert_auth_public_key", "cert_auth_private_key")
 
     def authenticate(self, client):
         opts = self.login_params(*self.AUTH_FIELDS)
@@ -36,4 +36,10 @@ class VaultAuthMethodCert(VaultAuthMethod):
         if "role_id" in opts:
             params["name"] = opts["role_id"]
 
-        client.auth.cert.login(**params)
+        return client.auth.cert.login(**params)
+
+    def cache_identity(self):
+        return [
+            self._options.get("role_id"),
+            self._options.get("cert_auth_public_key"),
+        ]
@@ -16,7 +16,7 @@ class VaultAuthMethodJwt(VaultAuthMethod):
     AUTH_FIELDS = ["jwt", "role_id", "mount_point"]
 
     def validate(self):
-        self.validate_required_fields(["jwt", "role_id"])
+        self.validate_required_fields("jwt", "role_id")
 
     def authenticate(self, client):
         params = self.login_params(*self.AUTH_FIELDS)
@@ -24,4 +24,7 @@ class VaultAuthMethodJwt(VaultAuthMethod):
         if "mount_point" in params:
             params["path"] = params.pop("mount_point")
 
-        client.auth.jwt.jwt_login(**params)
+        return client.auth.jwt.jwt_login(**params)
+
+    def cache_identity(self):
+        return [self._options.get("role_id"), self._options.get("jwt")]
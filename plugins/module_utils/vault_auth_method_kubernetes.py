@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ._vault_cache import read_file
+from ._vault_common import VaultAuthMethod, VaultAuthenticationError
+
+
+DEFAULT_TOKEN_PATH = "/var/run/secrets/kubernetes.io/serviceaccount/token"
+
+
+def read_service_account_token(path):
+    # The kubelet rotates projected tokens by replacing the file, which
+    # read_file() picks up through the changed modification time.
+    try:
+        return read_file(path)
+    except (IOError, OSError) as e:
+        raise VaultAuthenticationError(
+            "Unable to read the Kubernetes service account token '%s': %s"
+            % (path, e.strerror)
+        )
+
+
+class VaultAuthMethodKubernetes(VaultAuthMethod):
+    NAME = "kubernetes"
+
+    def validate(self):
+        self.validate_required_fields("role_id")
+
+    def token_path(self):
+        return self._options.get("kubernetes_token_path") or DEFAULT_TOKEN_PATH
+
+    def authenticate(self, client, use_token=True):
+        params = dict(
+            role=self._options.get("role_id"),
+            jwt=read_service_account_token(self.token_path()),
+            use_token=use_token,
+        )
+        mount_point = self._options.get("mount_point")
+        if mount_point:
+            params["mount_point"] = mount_point
+
+        return client.auth.kubernetes.login(**params)
+
+    def cache_identity(self):
+        return [self._options.get("role_id"), self.token_path()]
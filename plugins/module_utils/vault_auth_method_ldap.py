@@ -16,8 +16,11 @@ class VaultAuthMethodLdap(VaultAuthMethod):
     AUTH_FIELDS = ["username", "password", "mount_point"]
 
     def validate(self):
-        self.validate_required_fields(["username", "password"])
+        self.validate_required_fields("username", "password")
 
     def authenticate(self, client, use_token=True):
         params = self.login_params(*self.AUTH_FIELDS)
-        client.auth.ldap.login(use_token=use_token, **params)
+        return client.auth.ldap.login(use_token=use_token, **params)
+
+    def cache_identity(self):
+        return [self._options.get("username"), self._options.get("password")]
@@ -9,13 +9,21 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 import os
+import time
 
+from ._vault_cache import VaultFileCache, default_cache_path, read_file
 from ._vault_common import VaultAuthMethod, VaultAuthenticationError
 
 
 class VaultAuthMethodToken(VaultAuthMethod):
     NAME = "token"
-    AUTH_FIELDS = ["token", "token_path", "token_filename", "token_validate"]
+    AUTH_FIELDS = [
+        "token",
+        "token_path",
+        "token_filename",
+        "token_validate",
+        "token_renew_threshold",
+    ]
 
     def validate(self):
         if (
@@ -32,17 +40,84 @@ class VaultAuthMethodToken(VaultAuthMethod):
                         "The Vault token file '%s' was found but is not a file."
                         % token_filename
                     )
-                with open(token_filename) as token_file:
-                    self._options["token"] = token_file.read().strip()
+                self._options["token"] = read_file(token_filename)
 
         if self._options.get("token") is None:
             raise VaultAuthenticationError("No Vault Token specified or discovered.")
 
+    def _lookup_cache(self):
+        if not self._options.get("token_cache"):
+            return None
+        path = self._options.get("token_cache_path")
+        return VaultFileCache(path or default_cache_path("token_cache.json"))
+
+    def _lookup_key(self, client):
+        return VaultFileCache.make_key(
+            "lookup-self",
+            getattr(client, "url", None),
+            self._options.get("namespace"),
+            self._options.get("token"),
+        )
+
+    def _store_lookup(self, cache, key, ttl, renewable, policies):
+        lookup = dict(
+            ttl=ttl,
+            renewable=bool(renewable),
+            policies=policies,
+            expires_at=time.time() + ttl if ttl else None,
+        )
+        if cache is not None:
+            cache_ttl = self._options.get("token_cache_ttl") or 3600
+            cache.set(key, lookup, min(ttl, cache_ttl) if ttl else cache_ttl)
+
+        return lookup
+
+    def lookup(self, client, cache=None, refresh=False):
+        """Returns the ttl, renewable flag and policies of the token.
+
+        With the token cache enabled, the result of ``lookup-self`` is reused
+        for the rest of the token's lifetime, unless ``refresh`` is set.
+        """
+        key = self._lookup_key(client)
+        lookup = cache.get(key) if cache is not None and not refresh else None
+        if lookup is None:
+            data = client.auth.token.lookup_self()["data"]
+            lookup = self._store_lookup(
+                cache, key, data.get("ttl"), data.get("renewable"), data.get("policies")
+            )
+
+        return lookup
+
+    def renew(self, client, cache=None):
+        """Renews the token, which extends its lifetime but keeps the token itself."""
+        if cache is not None:
+            cache.delete(self._lookup_key(client))
+
+        auth = client.auth.token.renew_self()["auth"]
+        return self._store_lookup(
+            cache,
+            self._lookup_key(client),
+            auth.get("lease_duration"),
+            auth.get("renewable"),
+            auth.get("policies"),
+        )
+
     def authenticate(self, client, use_token=True):
         token = self._options.get("token")
         validate = self._options.get("token_validate")
+        threshold = self._options.get("token_renew_threshold")
         if use_token:
             client.token = token
 
-            if validate:
-                client.auth.token.lookup_self()
+            if validate or threshold:
+                # A validated token is always looked up, so that a revoked
+                # token is not accepted from the cache.
+                cache = self._lookup_cache()
+                lookup = self.lookup(client, cache, refresh=validate)
+                if (
+                    threshold
+                    and lookup["renewable"]
+                    and lookup["expires_at"] is not None
+                    and lookup["expires_at"] - time.time() < threshold
+                ):
+                    self.renew(client, cache)
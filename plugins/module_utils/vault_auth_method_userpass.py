@@ -16,8 +16,11 @@ class VaultAuthMethodUserpass(VaultAuthMethod):
     AUTH_FIELDS = ["username", "password", "mount_point"]
 
     def validate(self):
-        self.validate_required_fields(["username", "password"])
+        self.validate_required_fields("username", "password")
 
     def authenticate(self, client):
         params = self.login_params(*self.AUTH_FIELDS)
-        client.auth.userpass.login(**params)
+        return client.auth.userpass.login(**params)
+
+    def cache_identity(self):
+        return [self._options.get("username"), self._options.get("password")]
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.common.text.converters import to_native
+
+from ._vault_tracing import propagate
+from .vault_module import VaultModuleFailure
+
+
+class RateLimiter(object):
+    """Spaces calls out so that no more than ``rate`` of them start every second."""
+
+    def __init__(self, rate, clock=time.monotonic, sleep=time.sleep):
+        self._interval = 1.0 / rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = self._clock()
+            delay = self._next - now
+            self._next = max(now, self._next) + self._interval
+
+        if delay > 0:
+            self._sleep(delay)
+
+    def wrap(self, func):
+        def limited(*args, **kwargs):
+            self.wait()
+            return func(*args, **kwargs)
+
+        return limited
+
+
+class VaultFanout(object):
+    """
+    Runs the same piece of work against several Vault clusters and/or
+    namespaces concurrently, using a bounded thread pool.
+
+    Each target gets its own authenticated client. All clients share the
+    pooled HTTP session built from the module's connection options, and the
+    requests sent to a single Vault cluster (url) are rate limited together,
+    whichever namespace they target.
+    """
+
+    ARGUMENT_SPEC = dict(
+        targets=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                url=dict(type="str"),
+                namespace=dict(type="str"),
+            ),
+        ),
+        max_workers=dict(type="int", default=8),
+        rate_limit=dict(type="float"),
+    )
+
+    def __init__(self, module):
+        self._module = module
+        self.max_workers = module.params.get("max_workers") or 8
+        self.rate_limit = module.params.get("rate_limit")
+        self._limiters = {}
+        self._limiters_lock = threading.Lock()
+
+    def get_targets(self):
+        params = self._module.params
+        targets = params.get("targets") or [{}]
+
+        return [
+            dict(
+                url=target.get("url") or params.get("url"),
+                namespace=target.get("namespace") or params.get("namespace"),
+            )
+            for target in targets
+        ]
+
+    def _limiter(self, url):
+        with self._limiters_lock:
+            if url not in self._limiters:
+                self._limiters[url] = RateLimiter(self.rate_limit)
+            return self._limiters[url]
+
+    def client(self, target, authenticate=True):
+        client = self._module.hvac_client(
+            url=target["url"], namespace=target["namespace"]
+        )
+        if self.rate_limit:
+            client.adapter.request = self._limiter(target["url"]).wrap(
+                client.adapter.request
+            )
+        if authenticate:
+            self._module.authenticator.authenticate(
+                client, url=target["url"], namespace=target["namespace"]
+            )
+
+        return client
+
+    def _run_target(self, target, func, authenticate):
+        result = dict(target)
+        try:
+            result.update(func(self.client(target, authenticate), target))
+            result.setdefault("failed", False)
+        except VaultModuleFailure as e:
+            result.update(e.result)
+            result.setdefault("changed", False)
+        except SystemExit as e:
+            # Only this target fails, rather than the whole run.
+            result.update(
+                changed=False,
+                failed=True,
+                msg="Exited with status %s" % to_native(e.code),
+            )
+        except Exception as e:
+            result.update(changed=False, failed=True, msg=to_native(e))
+
+        return result
+
+    def run(self, func, authenticate=True):
+        """Calls ``func(client, target)`` for every target.
+
+        :param func: Does the work for a single target, and returns its result.
+        :type func: callable
+        :param authenticate: Log the clients in before calling ``func``. Not
+            needed for unauthenticated endpoints, like the seal status.
+        :type authenticate: bool
+
+        :return: One result per target, in the order the targets were given.
+        :rtype: list
+        """
+        targets = self.get_targets()
+        workers = max(1, min(self.max_workers, len(targets)))
+        run_target = propagate(
+            getattr(self._module, "vault_tracing", None), self._run_target
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(run_target, target, func, authenticate)
+                for target in targets
+            ]
+            return [future.result() for future in futures]
+
+    def aggregate(self, results):
+        """Folds the per-target results into a single module result."""
+        changed = any(result.get("changed") for result in results)
+        failed = [result for result in results if result["failed"]]
+        if failed:
+            return dict(
+                changed=changed,
+                failed=True,
+                msg="%d of %d targets failed" % (len(failed), len(results)),
+                targets=results,
+            )
+
+        return dict(changed=changed, targets=results)
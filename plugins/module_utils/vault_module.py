@@ -8,52 +8,132 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import threading
+
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 
 from ansible_collections.dubzland.vault.plugins.module_utils._vault_connection_options import (
     VaultConnectionOptions,
 )
+from ._vault_common import import_hvac
+from ._vault_metrics import VaultMetrics
+from ._vault_tracing import VaultTracing, VaultTracingDependencyError
 from .vault_auth import (
     VaultAuth,
 )
 
-try:
-    import hvac
-
-    python_hvac_installed = True
-except ImportError:
-    python_hvac_installed = False
-
 
 def ensure_hvac_package(module):
-    if not python_hvac_installed:
+    hvac = import_hvac()
+    if hvac is None:
         module.fail_json(
             msg=missing_required_lib(
                 "hvac",
                 url="https://hvac.readthedocs.io/en/stable/overview.html",
             ),
         )
+    return hvac
 
 
-class VaultModule(AnsibleModule):
-    def __init__(self, *args, **kwargs):
-        super(VaultModule, self).__init__(*args, **kwargs)
+class VaultModuleFailure(Exception):
+    """Raised by VaultControllerModule.fail_json(), carrying the result the module would have failed with."""
+
+    def __init__(self, msg, **kwargs):
+        super(VaultModuleFailure, self).__init__(msg)
+        self.result = dict(kwargs, msg=msg, failed=True)
 
+
+class VaultModuleMixin(object):
+    def _init_vault(self):
         self.connection_options = VaultConnectionOptions(self.params)
-        self.authenticator = VaultAuth(self.params)
+        self.vault_metrics = VaultMetrics.from_params(self.params)
+        self.vault_tracing = None
+        self.authenticator = VaultAuth(self.params, metrics=self.vault_metrics)
+        # Tracing is set up last, so fail_json() can be used if it fails.
+        try:
+            self.vault_tracing = VaultTracing.from_params(
+                self.params, "ansible.module %s" % self.vault_module_name
+            )
+        except VaultTracingDependencyError as e:
+            self.fail_json(msg=missing_required_lib(e.library))
+        self.authenticator.tracing = self.vault_tracing
+
+    @property
+    def vault_module_name(self):
+        return getattr(self, "_name", None) or "dubzland.vault"
 
     @classmethod
     def generate_argument_spec(cls, **kwargs):
         spec = VaultConnectionOptions.ARGUMENT_SPEC.copy()
-        spec.update(VaultAuth.ARGUMENT_SPEC.copy())
+        spec.update(VaultAuth.argument_spec())
+        spec.update(VaultMetrics.ARGUMENT_SPEC.copy())
+        spec.update(VaultTracing.ARGUMENT_SPEC.copy())
         spec.update(**kwargs)
 
         return spec
 
-    def hvac_client(self):
-        ensure_hvac_package(self)
+    def hvac_client(self, **overrides):
+        hvac = ensure_hvac_package(self)
 
         connection_params = self.connection_options.get_hvac_connection_params()
+        connection_params.update(overrides)
         client = hvac.Client(**connection_params)
+        if self.vault_tracing is not None:
+            self.vault_tracing.instrument(client)
+        if self.vault_metrics is not None:
+            self.vault_metrics.instrument(client)
 
         return client
+
+    def with_vault_metrics(self, result):
+        """Adds the metrics recorded so far to ``result``, when ``metrics`` is enabled."""
+        # fail_json() can be called while the arguments are validated, before
+        # the metrics are set up.
+        metrics = getattr(self, "vault_metrics", None)
+        if metrics is not None:
+            result["vault_metrics"] = metrics.as_result()
+        return result
+
+    def finish_vault_tracing(self, failed=False):
+        """Ends the span of the module run and exports the spans, when ``tracing`` is enabled."""
+        tracing = getattr(self, "vault_tracing", None)
+        if tracing is not None:
+            self.vault_tracing = None
+            tracing.finish(failed=failed)
+
+
+class VaultModule(VaultModuleMixin, AnsibleModule):
+    def __init__(self, *args, **kwargs):
+        super(VaultModule, self).__init__(*args, **kwargs)
+
+        self._init_vault()
+
+    def exit_json(self, **kwargs):
+        self.finish_vault_tracing(failed=kwargs.get("failed", False))
+        super(VaultModule, self).exit_json(**self.with_vault_metrics(kwargs))
+
+    def fail_json(self, msg, **kwargs):
+        # Exiting from a worker thread would print a result for the whole
+        # module, so the failure is raised to the code running the worker.
+        if threading.current_thread() is not threading.main_thread():
+            raise VaultModuleFailure(msg, **kwargs)
+        self.finish_vault_tracing(failed=True)
+        super(VaultModule, self).fail_json(msg, **self.with_vault_metrics(kwargs))
+
+
+class VaultControllerModule(VaultModuleMixin):
+    """
+    Stands in for a VaultModule when the Vault logic of a module runs inside
+    an action plugin on the controller, with parameters that have already
+    been validated against the module's argument spec.
+    """
+
+    def __init__(self, params, check_mode=False, diff=False):
+        self.params = params
+        self.check_mode = check_mode
+        self._diff = diff
+
+        self._init_vault()
+
+    def fail_json(self, msg, **kwargs):
+        raise VaultModuleFailure(msg, **kwargs)
@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import collections
+import copy
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.common.text.converters import to_native
+
+from ._vault_common import VaultReconcileError
+from ._vault_tracing import propagate, span
+from .vault_fanout import VaultFanout
+from .vault_utils import get_keys_updated, parse_duration
+
+
+def without_none(values):
+    """Drops the options that were not set, so they are neither compared nor sent to Vault."""
+    return dict(
+        (key, value) for key, value in (values or {}).items() if value is not None
+    )
+
+
+class VaultReconciler(object):
+    """
+    Brings a collection of Vault resources of one kind (auth methods, secrets
+    engines, policies, ...) to their desired state.
+
+    The resources are listed once per run, and every desired resource is
+    compared against that listing with ``get_keys_updated``. Check mode, diff
+    output and the per-resource results are handled here, so a subclass only
+    declares how to talk to Vault:
+
+    - ``list()`` returns every existing resource, keyed the way ``key()``
+      names them;
+    - ``create()``, ``update()`` and ``delete()`` write a single resource;
+    - ``normalize()``, ``validate()``, ``compare()`` and ``merge()`` can be
+      overridden when the listing and the desired state are shaped
+      differently.
+    """
+
+    # Name of the resource in messages, e.g. "secrets engine", and of several
+    # of them, when that is not KIND with an "s" appended.
+    KIND = "resource"
+    KIND_PLURAL = None
+    # Key holding the resulting resource in each result.
+    RESULT_KEY = "resource"
+
+    def __init__(self, module, client):
+        self.module = module
+        self.client = client
+        self._current = None
+
+    @property
+    def check_mode(self):
+        return self.module.check_mode
+
+    @property
+    def diff_mode(self):
+        return getattr(self.module, "_diff", False)
+
+    @property
+    def kind_plural(self):
+        return self.KIND_PLURAL or self.KIND + "s"
+
+    @property
+    def current(self):
+        """Every existing resource, listed once per reconciler."""
+        if self._current is None:
+            self._current = dict(
+                (key, self.normalize(key, entry)) for key, entry in self.list().items()
+            )
+        return self._current
+
+    def key(self, name):
+        """Returns the key a resource is listed under."""
+        return name
+
+    def list(self):
+        raise NotImplementedError
+
+    def create(self, key, desired):
+        raise NotImplementedError
+
+    def update(self, key, desired, current, updated_keys):
+        raise NotImplementedError
+
+    def delete(self, key, current):
+        raise NotImplementedError
+
+    def read_back(self, key, resource):
+        """Reads a changed resource back from Vault, when results are verified."""
+        return resource
+
+    def normalize(self, key, entry):
+        """Converts a listed entry into the shape of the desired state."""
+        return entry
+
+    def validate(self, key, desired, current):
+        """Raises VaultReconcileError when ``current`` can not be brought to ``desired``."""
+
+    def compare(self, desired, current):
+        """Returns the keys of ``desired`` that differ from ``current``."""
+        return get_keys_updated(desired, current)
+
+    def merge(self, desired, current):
+        """Builds the resource that results from applying ``desired`` to ``current``."""
+        merged = copy.deepcopy(current) if current is not None else {}
+        for key, value in desired.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = dict(merged[key], **value)
+            else:
+                merged[key] = copy.deepcopy(value)
+        return merged
+
+    def is_protected(self, key, current):
+        """Whether an existing resource must be left alone by ``exclusive`` runs."""
+        return False
+
+    def reconcile(self, key, desired, state="present", verify=False):
+        """Brings one resource to the desired state.
+
+        :return: The result for the resource, holding ``changed``, ``state``,
+            ``updated_keys``, (when present) the resource under
+            ``RESULT_KEY`` and, when the module runs in diff mode and something
+            changed, a ``diff``.
+        :rtype: dict
+        """
+        with span(
+            getattr(self.module, "vault_tracing", None),
+            "vault.reconcile",
+            **{"vault.kind": self.KIND, "vault.key": key, "vault.state": state}
+        ) as current:
+            result = self._reconcile(key, desired, state, verify)
+            if current is not None:
+                current.set_attribute("vault.changed", result["changed"])
+            return result
+
+    def _reconcile(self, key, desired, state, verify):
+        existing = self.current.get(key)
+
+        if state == "absent":
+            if existing is None:
+                return dict(changed=False, state="absent")
+            if not self.check_mode:
+                self.delete(key, existing)
+            result = dict(changed=True, state="absent")
+            if self.diff_mode:
+                result["diff"] = dict(before=existing, after={})
+            return result
+
+        if existing is None:
+            if not self.check_mode:
+                self.create(key, desired)
+            updated_keys = []
+            changed = True
+        else:
+            self.validate(key, desired, existing)
+            updated_keys = self.compare(desired, existing)
+            changed = bool(updated_keys)
+            if changed and not self.check_mode:
+                self.update(key, desired, existing, updated_keys)
+
+        resource = self.merge(desired, existing)
+        if changed and verify and not self.check_mode:
+            resource = self.read_back(key, resource)
+
+        result = dict(changed=changed, state="present", updated_keys=updated_keys)
+        result[self.RESULT_KEY] = resource
+        if changed and self.diff_mode:
+            result["diff"] = dict(before=existing or {}, after=resource)
+        return result
+
+    def converge(self, key, desired, state="present", verify=False):
+        """Reconciles a single resource, and adds a message to its result."""
+        kind = self.KIND
+        result = self.reconcile(key, desired, state, verify)
+
+        if state == "present":
+            if result["changed"]:
+                result["msg"] = "Successfully created or updated the %s %s" % (
+                    kind,
+                    key,
+                )
+            else:
+                result["msg"] = "No changes to %s %s" % (kind, key)
+        elif result["changed"]:
+            result["msg"] = "Successfully deleted %s %s" % (kind, key)
+            result[self.RESULT_KEY] = self.current.get(key)
+        else:
+            result["msg"] = "%s %s deleted or does not exist" % (kind.capitalize(), key)
+
+        return result
+
+    def _reconcile_each(self, resources, verify, max_workers):
+        """Reconciles every resource, ``max_workers`` at a time.
+
+        :return: The results gathered, and the first VaultReconcileError
+            raised, if any.
+        :rtype: tuple
+        """
+        results = {}
+        if max_workers <= 1 or len(resources) <= 1:
+            try:
+                for key, desired, state in resources:
+                    results[key] = self.reconcile(key, desired, state, verify)
+            except VaultReconcileError as e:
+                return results, e
+            return results, None
+
+        # List before starting the workers, so they share a single listing.
+        self.current
+        error = None
+        reconcile = propagate(
+            getattr(self.module, "vault_tracing", None), self.reconcile
+        )
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(resources))) as pool:
+            futures = [
+                (key, pool.submit(reconcile, key, desired, state, verify))
+                for key, desired, state in resources
+            ]
+            for key, future in futures:
+                try:
+                    results[key] = future.result()
+                except VaultReconcileError as e:
+                    error = error or e
+        return results, error
+
+    def reconcile_all(self, resources, exclusive=False, verify=False, max_workers=1):
+        """Brings many resources to their desired state, from a single listing.
+
+        :param resources: ``(key, desired, state)`` for every resource.
+        :type resources: list
+        :param exclusive: Delete the existing resources that are not listed in
+            ``resources``, unless they are protected.
+        :type exclusive: bool
+        :param max_workers: Number of resources reconciled at the same time.
+        :type max_workers: int
+
+        :return: The module result, with the result of every resource in
+            ``results`` and, in diff mode, the combined ``diff``.
+        :rtype: dict
+        """
+        counts = collections.Counter(key for key, desired, state in resources)
+        duplicates = sorted(key for key, count in counts.items() if count > 1)
+        if duplicates:
+            return dict(
+                changed=False,
+                failed=True,
+                msg="%s listed more than once: %s"
+                % (self.kind_plural.capitalize(), ", ".join(duplicates)),
+                results={},
+            )
+
+        results, error = self._reconcile_each(resources, verify, max_workers)
+        if error is None and exclusive:
+            unmanaged = [
+                (key, None, "absent")
+                for key, existing in self.current.items()
+                if key not in counts and not self.is_protected(key, existing)
+            ]
+            deleted, error = self._reconcile_each(unmanaged, False, max_workers)
+            results.update(deleted)
+
+        if error is not None:
+            return dict(
+                changed=any(result["changed"] for result in results.values()),
+                failed=True,
+                msg=to_native(error),
+                results=results,
+            )
+
+        changed = any(result["changed"] for result in results.values())
+        if changed:
+            msg = "Successfully reconciled %d %s" % (len(results), self.kind_plural)
+        else:
+            msg = "No changes to %s" % self.kind_plural
+        summary = dict(changed=changed, msg=msg, results=results)
+
+        if self.diff_mode:
+            diff = dict(before={}, after={})
+            for key, result in results.items():
+                if "diff" in result:
+                    resource_diff = result.pop("diff")
+                    diff["before"][key] = resource_diff["before"]
+                    if result["state"] == "present":
+                        diff["after"][key] = resource_diff["after"]
+            summary["diff"] = diff
+
+        return summary
+
+    @classmethod
+    def run(cls, module, converge):
+        """Runs ``converge(reconciler)`` against every target of the module.
+
+        Without ``targets``, the single result is returned as the module
+        result, keeping only ``changed``, ``msg``, the resource and ``diff``.
+        """
+        module.authenticator.validate()
+
+        if module.params.get("targets"):
+            fanout = VaultFanout(module)
+            return fanout.aggregate(
+                fanout.run(lambda client, target: converge(cls(module, client)))
+            )
+
+        client = module.hvac_client()
+        module.authenticator.authenticate(client)
+
+        try:
+            result = converge(cls(module, client))
+        except VaultReconcileError as e:
+            return dict(changed=False, failed=True, msg=to_native(e))
+
+        return dict(
+            (key, result[key])
+            for key in ("changed", "msg", cls.RESULT_KEY, "diff")
+            if key in result
+        )
+
+
+class VaultMountReconciler(VaultReconciler):
+    """
+    Reconciles mount-shaped resources (auth methods, secrets engines), listed
+    by path with a ``type``, a ``description`` and tunable ``config`` and
+    ``options``.
+
+    The type of a mount can not be changed, and only the tunable settings
+    that were given are compared.
+    """
+
+    # Settings that can be tuned after the mount is created.
+    TUNABLE = ("config", "options")
+
+    def key(self, name):
+        """Returns the mount path as it is listed, which always ends with a slash."""
+        return name.rstrip("/") + "/"
+
+    def validate(self, key, desired, current):
+        if current.get("type", desired["type"]) != desired["type"]:
+            raise VaultReconcileError(
+                "%s %s is of type %s, not %s"
+                % (self.KIND.capitalize(), key, current["type"], desired["type"])
+            )
+
+    def compare(self, desired, current):
+        updated_keys = []
+        description = desired.get("description")
+        if description is not None and description != current.get("description"):
+            updated_keys.append("description")
+        for setting in self.TUNABLE:
+            if desired.get(setting):
+                updated_keys.extend(
+                    get_keys_updated(desired[setting], current.get(setting) or {})
+                )
+        return updated_keys
+
+    def merge(self, desired, current):
+        if current is None:
+            merged = dict(
+                type=desired["type"], description=desired.get("description") or ""
+            )
+        else:
+            merged = copy.deepcopy(current)
+            if desired.get("description") is not None:
+                merged["description"] = desired["description"]
+
+        for setting in self.TUNABLE:
+            if setting in desired or setting in merged:
+                merged[setting] = dict(
+                    merged.get(setting) or {},
+                    **dict(
+                        (key, self.listed_value(key, value))
+                        for key, value in (desired.get(setting) or {}).items()
+                    )
+                )
+        return merged
+
+    @staticmethod
+    def listed_value(key, value):
+        """Returns a setting as Vault lists it, with durations in seconds."""
+        if "ttl" in key:
+            try:
+                return parse_duration(value)
+            except ValueError:
+                pass
+        return value
+
+    def read_tuning(self, key):
+        """Reads the tuning of a mount, as returned by its ``tune`` endpoint."""
+        raise NotImplementedError
+
+    def read_back(self, key, resource):
+        merged = copy.deepcopy(resource)
+        tuning = dict(self.read_tuning(key) or {})
+        if "description" in tuning:
+            merged["description"] = tuning.pop("description")
+        if "options" in tuning:
+            merged["options"] = dict(
+                merged.get("options") or {}, **(tuning.pop("options") or {})
+            )
+        merged["config"] = dict(merged.get("config") or {}, **tuning)
+
+        return merged
@@ -8,97 +8,90 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import functools
+import re
+
 # import sys
 #
 # from urllib.parse import urlparse
 
 from ansible.module_utils.basic import missing_required_lib
 
-
-try:
-    import hvac
-
-    python_hvac_installed = True
-except ImportError:
-    python_hvac_installed = False
+from ._vault_common import import_hvac
 
 
 def ensure_hvac_package(module):
-    if not python_hvac_installed:
+    hvac = import_hvac()
+    if hvac is None:
         module.fail_json(
             msg=missing_required_lib(
                 "hvac",
                 url="https://hvac.readthedocs.io/en/stable/overview.html",
             ),
         )
+    return hvac
 
 
-def vault_client(module):
-    ensure_hvac_package(module)
-
-    params = module.params
-
-    url = params.get("url")
-    client = hvac.Client(url=url)
-
-    auth_method = params.get("auth_method")
-    login_mount_point = params.get("login_mount_point", auth_method)
-    if not login_mount_point:
-        login_mount_point = auth_method
-
-    if auth_method == "token":
-        token = params.get("token")
-        client.token = token
-    elif auth_method == "userpass":
-        username = params.get("username")
-        password = params.get("password")
-        client.auth.userpass.login(username, password, mount_point=login_mount_point)
-    elif auth_method == "approle":
-        role_id = params.get("role_id")
-        secret_id = params.get("secret_id")
-        client = AppRoleClient(
-            client, role_id, secret_id, mount_point=login_mount_point
-        )
+# Options that Vault treats as sets, so the order their values are given in
+# does not matter.
+SET_KEYS = frozenset(
+    (
+        "audit_non_hmac_request_keys",
+        "audit_non_hmac_response_keys",
+        "passthrough_request_headers",
+        "allowed_response_headers",
+    )
+)
 
-    return client
 
+def _normalize(value, key=None):
+    """Returns the canonical form of a value found under ``key``.
 
-class AppRoleClient(object):
-    """
-    hvac.Client decorator which generates and sets a new approle token on every
-    function call. This allows multiple calls to Vault without having to manually
-    generate and set a token on every Vault call.
+    Durations (any key containing ``ttl``) become seconds, lists of set-like
+    options become frozensets and integers become strings, since lots of
+    things get handled as strings in ansible that aren't necessarily strings.
     """
+    if isinstance(value, dict):
+        return dict((k, _normalize(v, k)) for k, v in value.items())
+    if isinstance(value, list):
+        items = [_normalize(item) for item in value]
+        if key in SET_KEYS:
+            try:
+                return frozenset(items)
+            except TypeError:
+                pass
+        return items
+    if key is not None and "ttl" in key:
+        try:
+            return parse_duration(value)
+        except ValueError:
+            return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _is_equal(desired, current, ignore):
+    """Compares normalized values. Only the keys present in ``desired`` are compared."""
+    if isinstance(desired, dict):
+        if not isinstance(current, dict):
+            return False
+        for key, value in desired.items():
+            if key in ignore:
+                continue
+            if key not in current or not _is_equal(value, current[key], ignore):
+                return False
+        return True
 
-    def __init__(self, client, role_id, secret_id, mount_point):
-        object.__setattr__(self, "client", client)
-        object.__setattr__(self, "role_id", role_id)
-        object.__setattr__(self, "secret_id", secret_id)
-        object.__setattr__(self, "login_mount_point", mount_point)
-
-    def __setattr__(self, name, val):
-        """
-        sets attribute in decorated class (Client)
-        """
-        client = object.__getattribute__(self, "client")
-        client.__setattr__(name, val)
-
-    def __getattribute__(self, name):
-        """
-        generates and sets new approle token in decorated class (Client)
-        returns decorated class (Client) attribute
-        """
-        client = object.__getattribute__(self, "client")
-        attr = client.__getattribute__(name)
-
-        role_id = object.__getattribute__(self, "role_id")
-        secret_id = object.__getattribute__(self, "secret_id")
-        login_mount_point = object.__getattribute__(self, "login_mount_point")
-        resp = client.auth.approle.login(
-            role_id, secret_id=secret_id, mount_point=login_mount_point
-        )
-        client.token = str(resp["auth"]["client_token"])
-        return attr
+    if isinstance(desired, list):
+        if not isinstance(current, list) or len(desired) != len(current):
+            return False
+        for desired_item, current_item in zip(desired, current):
+            if not _is_equal(desired_item, current_item, ignore):
+                return False
+        return True
+
+    return desired == current
 
 
 def _compare_state(desired_state, current_state, ignore=None):
@@ -108,66 +101,132 @@ def _compare_state(desired_state, current_state, ignore=None):
 
     :param desired_state: The state user desires.
     :param current_state: The state that currently exists.
-    :param ignore: Ignore these keys.
+    :param ignore: Ignore these keys, at any level.
     :type ignore: list
 
     :return: True if the states are the same.
     :rtype: bool
     """
+    return _is_equal(
+        _normalize(desired_state), _normalize(current_state), frozenset(ignore or ())
+    )
+
+
+# Nanoseconds per unit, as accepted by Go's time.ParseDuration, plus the
+# "d" suffix that Vault accepts on top of it.
+DURATION_UNITS = {
+    "ns": 1,
+    "us": 10**3,
+    "\u00b5s": 10**3,  # U+00B5 micro sign
+    "\u03bcs": 10**3,  # U+03BC greek small letter mu
+    "ms": 10**6,
+    "s": 10**9,
+    "m": 60 * 10**9,
+    "h": 3600 * 10**9,
+    "d": 24 * 3600 * 10**9,
+}
+
+_DURATION_COMPONENT = re.compile(r"([0-9]*)(?:\.([0-9]*))?([^0-9.]*)")
+_BARE_NUMBER = re.compile(r"[0-9]+(?:\.[0-9]*)?|\.[0-9]+")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_duration_string(value):
+    sign = 1
+    remaining = value
+    if remaining[:1] in ("-", "+"):
+        sign = -1 if remaining[0] == "-" else 1
+        remaining = remaining[1:]
+
+    if not remaining:
+        raise ValueError("invalid duration %r" % value)
+    if remaining == "0":
+        return 0
+
+    # Vault treats a number without a unit as seconds.
+    if _BARE_NUMBER.fullmatch(remaining):
+        remaining += "s"
+
+    nanoseconds = 0
+    pos = 0
+    while pos < len(remaining):
+        match = _DURATION_COMPONENT.match(remaining, pos)
+        whole, fraction, unit = match.groups()
+        if not whole and not fraction:
+            raise ValueError("invalid duration %r" % value)
+        if unit not in DURATION_UNITS:
+            if not unit:
+                raise ValueError("missing unit in duration %r" % value)
+            raise ValueError("unknown unit %r in duration %r" % (unit, value))
+
+        scale = DURATION_UNITS[unit]
+        nanoseconds += int(whole or 0) * scale
+        if fraction:
+            nanoseconds += int(fraction) * scale // 10 ** len(fraction)
+        pos = match.end()
+
+    nanoseconds *= sign
+    if nanoseconds % 10**9 == 0:
+        return nanoseconds // 10**9
+    return nanoseconds / 10**9
+
+
+def parse_duration(value):
+    """Converts a duration into seconds
+
+    Accepts everything Go's ``time.ParseDuration`` does (``"1h30m"``,
+    ``"1.5h"``, ``"300ms"``, ``"-2m"``), days (``"7d"``), and numbers
+    without a unit, which are taken as seconds like Vault does.
+
+    :param value: The duration to convert.
+    :type value: str or int or float
+
+    :return: The duration in seconds. Whole durations are returned as an int.
+    :rtype: int or float
+
+    :raises ValueError: When ``value`` is not a valid duration.
+    """
+    if isinstance(value, bool):
+        raise ValueError("invalid duration %r" % value)
+    if isinstance(value, (int, float)):
+        return int(value) if float(value).is_integer() else value
+    if not isinstance(value, str):
+        raise ValueError("invalid duration %r" % value)
+    return _parse_duration_string(value.strip())
 
-    if ignore is None:
-        ignore = []
-    if isinstance(desired_state, list):
-        if (not isinstance(current_state, list)) or (
-            len(desired_state) != len(current_state)
-        ):
-            return False
-        for i in range(len(desired_state)):
-            if not _compare_state(desired_state[i], current_state[i]):
-                return False
-        return True
 
-    if isinstance(desired_state, dict):
-        if not isinstance(current_state, dict):
-            return False
+def diff_state(desired_state, current_state, ignore=None):
+    """Return the keys that have different values, with their old and new values
 
-        # iterate over dictionary keys
-        for key in desired_state.keys():
-            if key in ignore:
-                continue
-            v = desired_state[key]
-            if (key not in current_state) or (
-                not _compare_state(v, current_state.get(key))
-            ):
-                return False
-        return True
+    Each value is normalized (see _normalize) once, and compared in a single
+    pass, so the cost grows linearly with the size of the desired state.
 
-    # lots of things get handled as strings in ansible that aren't necessarily strings, can extend this list later.
-    if isinstance(desired_state, str) and isinstance(current_state, int):
-        current_state = str(current_state)
-
-    return desired_state == current_state
-
-
-def _convert_to_seconds(original_value):
-    try:
-        value = str(original_value)
-        seconds = 0
-        if "h" in value:
-            ray = value.split("h")
-            seconds = int(ray.pop(0)) * 3600
-            value = "".join(ray)
-        if "m" in value:
-            ray = value.split("m")
-            seconds += int(ray.pop(0)) * 60
-            value = "".join(ray)
-        if value:
-            ray = value.split("s")
-            seconds += int(ray.pop(0))
-        return seconds
-    except Exception:
-        pass
-    return original_value
+    :param desired_state: The state user desires.
+    :type desired_state: dict
+    :param current_state: The state that currently exists.
+    :type current_state: dict
+    :param ignore: Ignore these keys, at any level.
+    :type ignore: list
+
+    :return: A dict of ``{"before": ..., "after": ...}`` per key that differs,
+        in the order of ``desired_state``.
+    :rtype: dict
+    """
+    ignore = frozenset(ignore or ())
+
+    differences = {}
+    for key, new_value in desired_state.items():
+        if key in ignore:
+            continue
+        if key not in current_state:
+            differences[key] = dict(before=None, after=new_value)
+            continue
+        old_value = current_state[key]
+        if not _is_equal(
+            _normalize(new_value, key), _normalize(old_value, key), ignore
+        ):
+            differences[key] = dict(before=old_value, after=new_value)
+    return differences
 
 
 def get_keys_updated(desired_state, current_state, ignore=None):
@@ -185,25 +244,7 @@ def get_keys_updated(desired_state, current_state, ignore=None):
     :return: Different items
     :rtype: list
     """
-
-    if ignore is None:
-        ignore = []
-
-    differences = []
-    for key in desired_state.keys():
-        if key in ignore:
-            continue
-        if key not in current_state:
-            differences.append(key)
-            continue
-        new_value = desired_state[key]
-        old_value = current_state[key]
-        if "ttl" in key:
-            if _convert_to_seconds(old_value) != _convert_to_seconds(new_value):
-                differences.append(key)
-        elif not _compare_state(new_value, old_value):
-            differences.append(key)
-    return differences
+    return list(diff_state(desired_state, current_state, ignore))
 
 
 def is_state_changed(desired_state, current_state):
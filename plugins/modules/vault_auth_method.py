@@ -27,8 +27,11 @@ attributes:
     support: full
     description: Can run in check_mode and return changed status prediction without modifying target.
   diff_mode:
-    support: none
+    support: full
     description: Will return details on what has changed (or possibly needs changing in check_mode), when in diff mode.
+  action:
+    support: full
+    description: Has a corresponding action plugin, which runs the module on the controller when O(run_on_controller=true).
 options:
   method_type:
     type: str
@@ -43,7 +46,9 @@ options:
     description: Path to the authentication method to be enabled.
   description:
     type: str
-    description: Human readable description for the authentication method.
+    description:
+      - Human readable description for the authentication method.
+      - The description of an existing authentication method is left unchanged when not set.
   config:
     type: dict
     suboptions:
@@ -94,9 +99,28 @@ options:
     default: present
     choices: [ "present", "absent" ]
     type: str
+  verify_result:
+    description:
+      - After creating or updating the authentication method, read its tuning back from Vault and return it
+        in RV(auth_method).
+      - By default, RV(auth_method) is built from the desired state and the mount table read at the start of
+        the run, which saves a request whenever a change is made.
+    type: bool
+    default: false
+  run_on_controller:
+    description:
+      - Run the Vault logic on the controller, instead of on every host the task runs for.
+      - All hosts running the task with the same parameters share a single execution, and receive the same result.
+      - Requires the C(hvac) python library on the controller, and O(url) has to be reachable from the controller.
+      - Ignored by tasks run with C(async), which always run the module on the host.
+    type: bool
+    default: false
 extends_documentation_fragment:
   - dubzland.vault.auth
   - dubzland.vault.connection
+  - dubzland.vault.metrics
+  - dubzland.vault.tracing
+  - dubzland.vault.fanout
 """
 
 EXAMPLES = """
@@ -107,18 +131,50 @@ EXAMPLES = """
     state: present
     url: http://localhost:8200
     token: "{{ _root_token }}"
+
+- name: Enable AppRole authentication in every namespace of two clusters
+  dubzland.vault.vault_auth_method:
+    method_type: approle
+    description: AppRole authentication
+    url: https://vault-east.example.com:8200
+    token: "{{ _admin_token }}"
+    targets:
+      - namespace: team-a
+      - namespace: team-b
+      - url: https://vault-west.example.com:8200
+        namespace: team-a
+      - url: https://vault-west.example.com:8200
+        namespace: team-b
+    max_workers: 4
+    rate_limit: 20
+
+- name: Enable AppRole authentication once for the whole play
+  dubzland.vault.vault_auth_method:
+    method_type: approle
+    url: https://vault.example.com:8200
+    token: "{{ _root_token }}"
+    run_on_controller: true
 """
 
 RETURN = r"""
 auth_method:
     description: Details about the authentication method
     type: dict
-    returned: success
+    returned: success, when O(targets) is not set
+targets:
+    description:
+      - Result for every target, in the order given in O(targets).
+      - Each entry holds the target C(url) and C(namespace), C(changed), C(failed), C(msg) and,
+        when it was found or created, the C(auth_method).
+    type: list
+    elements: dict
+    returned: when O(targets) is set
 """
 
 
-from ansible_collections.dubzland.vault.plugins.module_utils.vault_utils import (
-    is_state_changed,
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_auth_mounts import (
+    AUTH_METHOD_ARGUMENT_SPEC,
+    run_auth_method,
 )
 from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
     VaultModule,
@@ -126,104 +182,14 @@ from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import
 
 
 def main():
-    argument_spec = VaultModule.generate_argument_spec(
-        method_type=dict(
-            type="str", choices=["token", "userpass", "approle"], required=True
-        ),
-        path=dict(type="str"),
-        description=dict(type="str"),
-        config=dict(
-            type="dict",
-            options=dict(
-                default_lease_ttl=dict(type="str"),
-                max_lease_ttl=dict(type="str"),
-                audit_non_hmac_request_keys=dict(
-                    type="list", elements="str", no_log=True
-                ),
-                audit_non_hmac_response_keys=dict(
-                    type="list", elements="str", no_log=True
-                ),
-                listing_visibility=dict(type="list", elements="str"),
-                passthrough_request_headers=dict(
-                    type="list", elements="str", no_log=True
-                ),
-                allowed_response_headers=dict(type="list", elements="str"),
-                plugin_version=dict(type="str"),
-                identity_token_key=dict(type="str", no_log=True),
-            ),
-        ),
-        state=dict(default="present", choices=["present", "absent"]),
-    )
+    argument_spec = VaultModule.generate_argument_spec(**AUTH_METHOD_ARGUMENT_SPEC)
     module = VaultModule(argument_spec=argument_spec, supports_check_mode=True)
 
-    path = module.params["path"]
-    description = module.params["description"]
-    method_type = module.params["method_type"]
-    config = module.params["config"]
-    state = module.params["state"]
-    changed = False
-    exists = False
-
-    if path is None:
-        path = method_type + "/"
-    if config is None:
-        config = {}
-
-    client = module.hvac_client()
-    module.authenticator.validate()
-    module.authenticator.authenticate(client)
-
-    response = client.sys.list_auth_methods()
-    auth_methods = response.get("data")
-    if (path) in auth_methods:
-        auth_method = auth_methods.get(path)
-        exists = True
-
-    if state == "present":
-        if exists:
-            if description != auth_method["description"] or is_state_changed(
-                config, auth_method["config"]
-            ):
-                if not module.check_mode:
-                    client.sys.tune_auth_method(path, description=description, **config)
-                changed = True
-        else:
-            if not module.check_mode:
-                client.sys.enable_auth_method(
-                    method_type, description=description, path=path, config=config
-                )
-            changed = True
-
-        if changed:
-            response = client.sys.list_auth_methods()
-            auth_method = response.get("data").get(path)
-            module.exit_json(
-                changed=True,
-                msg="Successfully created or updated the authentication method %s"
-                % path,
-                auth_method=auth_method,
-            )
-
-        module.exit_json(
-            changed=False,
-            msg="No changes to authentication method %s" % path,
-            auth_method=auth_method,
-        )
-    elif state == "absent":
-        if exists:
-            if not module.check_mode:
-                client.sys.disable_auth_method(path)
-
-            module.exit_json(
-                changed=True,
-                msg="Successfully deleted authentication method %s" % path,
-                auth_method=auth_method,
-            )
-
-        module.exit_json(
-            changed=False,
-            msg="Authentication method %s deleted or does not exist" % path,
-        )
+    result = run_auth_method(module)
+    if result.pop("failed", False):
+        module.fail_json(**result)
+
+    module.exit_json(**result)
 
 
 if __name__ == "__main__":
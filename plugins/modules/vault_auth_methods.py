@@ -0,0 +1,244 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: vault_auth_methods
+short_description: Manages many HashiCorp Vault authentication methods at once
+description:
+  - Reconciles a list of authentication methods against the Vault mount table in a single run.
+  - The mount table is read once, and only the enable, tune and disable calls needed to reach
+    the desired state are made.
+  - When O(exclusive=true), authentication methods that are not listed in O(auth_methods) are disabled, unless they
+    are listed in O(exclude) or of a type this module does not manage.
+author:
+  - Josh Williams (@t3hpr1m3)
+requirements:
+  - python >= 3.8
+  - hvac >= 7.1.4
+attributes:
+  check_mode:
+    support: full
+    description: Can run in check_mode and return changed status prediction without modifying target.
+  diff_mode:
+    support: full
+    description: Will return details on what has changed (or possibly needs changing in check_mode), when in diff mode.
+  action:
+    support: full
+    description: Has a corresponding action plugin, which passes the trace context of the controller in O(tracing).
+options:
+  auth_methods:
+    type: list
+    elements: dict
+    required: True
+    description: Authentication methods to manage.
+    suboptions:
+      method_type:
+        type: str
+        required: True
+        description: Type of authentication method to be created
+        choices:
+          - token
+          - userpass
+          - approle
+      path:
+        type: str
+        description:
+          - Path to the authentication method to be enabled.
+          - Defaults to O(auth_methods[].method_type).
+      description:
+        type: str
+        description:
+          - Human readable description for the authentication method.
+          - The description of an existing authentication method is left unchanged when not set.
+      config:
+        type: dict
+        suboptions:
+          default_lease_ttl:
+            type: str
+            description: The default lease duration, specified as a string duration like "5s" or "30m".
+          max_lease_ttl:
+            type: str
+            description: The maximum lease duration, specified as a string duration like "5s" or "30m".
+          audit_non_hmac_request_keys:
+            type: list
+            elements: str
+            description: List of keys that will not be HMAC'd by audit devices in the request data object.
+          audit_non_hmac_response_keys:
+            type: list
+            elements: str
+            description: List of keys that will not be HMAC'd by audit devices in the response data object.
+          listing_visibility:
+            type: list
+            elements: str
+            description: |
+              Specifies whether to show this mount in the UI-specific listing endpoint. Valid values are
+              "unauth" or "hidden", with the default "" being equivalent to "hidden".
+          passthrough_request_headers:
+            type: list
+            elements: str
+            description: List of headers to allow and pass from the request to the plugin.
+          allowed_response_headers:
+            type: list
+            elements: str
+            description: List of headers to allow, allowing a plugin to include them in the response.
+          plugin_version:
+            type: str
+            description:
+              - Specifies the semantic version of the plugin to use, e.g. "v1.0.0".
+              - |
+                If unspecified, the server will select any matching unversioned plugin that may have been
+                registered, the latest versioned plugin registered, or a built-in plugin in that order of precedence.
+          identity_token_key:
+            type: str
+            description: The key to use for signing plugin workload identity tokens. If not provided, this will default to Vault's OIDC default key.
+        description: Configuration provided to the authentication method.
+      state:
+        description:
+          - Indicates the desired authentication method state.
+          - V(present) ensures the authentication method is present.
+          - V(absent) ensures the authentication method is absent.
+        default: present
+        choices: [ "present", "absent" ]
+        type: str
+  exclusive:
+    type: bool
+    default: false
+    description:
+      - Disable every authentication method that is not listed in O(auth_methods) or O(exclude).
+      - Only authentication methods of the types accepted by O(auth_methods[].method_type) are disabled. Methods of
+        any other type (V(ldap), V(oidc), V(kubernetes), ...) are always left alone.
+      - The built-in C(token/) authentication method can not be disabled, and is always left alone.
+  exclude:
+    type: list
+    elements: str
+    default: []
+    description:
+      - Paths of authentication methods that O(exclusive) leaves alone, although they are not listed in
+        O(auth_methods).
+  verify_result:
+    type: bool
+    default: false
+    description:
+      - Read the tuning of every changed authentication method back from Vault, and return it in RV(auth_methods).
+      - By default, the returned authentication methods are built from the desired state and the mount table read
+        at the start of the run, which saves a request per changed authentication method.
+extends_documentation_fragment:
+  - dubzland.vault.auth
+  - dubzland.vault.connection
+  - dubzland.vault.metrics
+  - dubzland.vault.tracing
+"""
+
+EXAMPLES = """
+- name: Enable the baseline authentication methods
+  dubzland.vault.vault_auth_methods:
+    auth_methods:
+      - method_type: approle
+        description: AppRole authentication
+      - method_type: userpass
+        path: operators
+        description: Operator logins
+        config:
+          default_lease_ttl: 1h
+          max_lease_ttl: 8h
+    exclusive: true
+    exclude:
+      - break-glass
+    url: http://localhost:8200
+    token: "{{ _root_token }}"
+"""
+
+RETURN = r"""
+auth_methods:
+    description:
+      - Result for every authentication method that was managed or pruned, keyed by path.
+      - Each entry holds C(changed), the C(state) reached, the C(updated_keys) that were tuned and,
+        unless it was disabled, the resulting C(auth_method).
+    type: dict
+    returned: success
+    sample:
+      approle/:
+        changed: true
+        state: present
+        updated_keys: []
+        auth_method:
+          type: approle
+          description: AppRole authentication
+          config: {}
+"""
+
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_auth_mounts import (
+    AUTH_METHOD_CONFIG_SPEC,
+    AUTH_METHOD_TYPES,
+    VaultAuthMethodReconciler,
+    auth_method_path,
+    desired_auth_method,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultModule,
+)
+
+
+def main():
+    argument_spec = VaultModule.generate_argument_spec(
+        auth_methods=dict(
+            type="list",
+            elements="dict",
+            required=True,
+            options=dict(
+                method_type=dict(type="str", choices=AUTH_METHOD_TYPES, required=True),
+                path=dict(type="str"),
+                description=dict(type="str"),
+                config=dict(type="dict", options=AUTH_METHOD_CONFIG_SPEC),
+                state=dict(default="present", choices=["present", "absent"]),
+            ),
+        ),
+        exclusive=dict(type="bool", default=False),
+        exclude=dict(type="list", elements="str", default=[]),
+        verify_result=dict(type="bool", default=False),
+    )
+    module = VaultModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    resources = [
+        (
+            auth_method_path(auth_method["method_type"], auth_method["path"]),
+            desired_auth_method(
+                auth_method["method_type"],
+                auth_method["description"],
+                auth_method["config"],
+            ),
+            auth_method["state"],
+        )
+        for auth_method in module.params["auth_methods"]
+    ]
+
+    client = module.hvac_client()
+    module.authenticator.validate()
+    module.authenticator.authenticate(client)
+
+    reconciler = VaultAuthMethodReconciler(module, client)
+    result = reconciler.reconcile_all(
+        resources,
+        exclusive=module.params["exclusive"],
+        verify=module.params["verify_result"],
+    )
+    result["auth_methods"] = result.pop("results")
+
+    if result.pop("failed", False):
+        module.fail_json(**result)
+
+    module.exit_json(**result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: vault_init
+short_description: Initializes a HashiCorp Vault server
+description:
+  - Initializes a new Vault server, generating its root key, unseal keys and initial root token.
+  - Nothing is done when the server has already been initialized.
+  - When O(output_directory) is set, the keys and root token are written to files on the controller instead
+    of being returned.
+author:
+  - Josh Williams (@t3hpr1m3)
+requirements:
+  - python >= 3.8
+  - hvac >= 7.1.4
+attributes:
+  check_mode:
+    support: full
+    description: Can run in check_mode and return changed status prediction without modifying target.
+  diff_mode:
+    support: none
+    description: Will return details on what has changed (or possibly needs changing in check_mode), when in diff mode.
+  action:
+    support: full
+    description: Has a corresponding action plugin, which writes the generated keys on the controller.
+options:
+  secret_shares:
+    type: int
+    default: 5
+    description: Number of shares to split the root key into.
+  secret_threshold:
+    type: int
+    default: 3
+    description: Number of shares required to reconstruct the root key. Must be less than or equal to O(secret_shares).
+  pgp_keys:
+    type: list
+    elements: str
+    description:
+      - Base64 encoded PGP public keys used to encrypt the unseal keys, one per share.
+      - Must contain O(secret_shares) keys when set.
+  root_token_pgp_key:
+    type: str
+    description: Base64 encoded PGP public key used to encrypt the initial root token.
+  recovery_shares:
+    type: int
+    description: Number of shares to split the recovery key into. Only used with auto-unseal.
+  recovery_threshold:
+    type: int
+    description: Number of shares required to reconstruct the recovery key. Only used with auto-unseal.
+  recovery_pgp_keys:
+    type: list
+    elements: str
+    description: Base64 encoded PGP public keys used to encrypt the recovery keys, one per share.
+  output_directory:
+    type: path
+    description:
+      - Directory on the controller to write the root token and keys to, instead of returning them.
+      - The root token is written to C(rootkey), the unseal keys to C(unseal/key_N) and the recovery keys to
+        C(recovery/key_N). All files are written to a staging directory first, and only moved into place once
+        every one of them has been written.
+      - Handled by the action plugin, on the controller.
+notes:
+  - The initialization endpoints do not require authentication, so no authentication options are accepted.
+extends_documentation_fragment:
+  - dubzland.vault.connection
+"""
+
+EXAMPLES = """
+- name: Initialize Vault, storing the keys on the controller
+  dubzland.vault.vault_init:
+    url: http://127.0.0.1:8200
+    secret_shares: 5
+    secret_threshold: 3
+    output_directory: "{{ playbook_dir }}/vault-tokens"
+
+- name: Initialize Vault with keys encrypted for each operator
+  dubzland.vault.vault_init:
+    url: https://vault.example.com:8200
+    secret_shares: 3
+    secret_threshold: 2
+    pgp_keys:
+      - "{{ lookup('ansible.builtin.file', 'keys/alice.asc.b64') }}"
+      - "{{ lookup('ansible.builtin.file', 'keys/bob.asc.b64') }}"
+      - "{{ lookup('ansible.builtin.file', 'keys/carol.asc.b64') }}"
+    root_token_pgp_key: "{{ lookup('ansible.builtin.file', 'keys/alice.asc.b64') }}"
+  register: _vault_init
+"""
+
+RETURN = r"""
+initialized:
+    description: Whether the server is initialized.
+    type: bool
+    returned: always
+root_token:
+    description: The initial root token.
+    type: str
+    returned: when the server was initialized by this task, and O(output_directory) is not set
+keys:
+    description: The hex encoded unseal keys.
+    type: list
+    elements: str
+    returned: when the server was initialized by this task, and O(output_directory) is not set
+keys_base64:
+    description: The base64 encoded unseal keys.
+    type: list
+    elements: str
+    returned: when the server was initialized by this task, and O(output_directory) is not set
+recovery_keys:
+    description: The hex encoded recovery keys.
+    type: list
+    elements: str
+    returned: when the server was initialized by this task with auto-unseal, and O(output_directory) is not set
+recovery_keys_base64:
+    description: The base64 encoded recovery keys.
+    type: list
+    elements: str
+    returned: when the server was initialized by this task with auto-unseal, and O(output_directory) is not set
+files:
+    description: Files written to O(output_directory).
+    type: list
+    elements: str
+    returned: when the server was initialized by this task, and O(output_directory) is set
+"""
+
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_connection_options import (
+    VaultConnectionOptions,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultModule,
+)
+
+
+INIT_PARAMS = (
+    "secret_shares",
+    "secret_threshold",
+    "pgp_keys",
+    "root_token_pgp_key",
+    "recovery_shares",
+    "recovery_threshold",
+    "recovery_pgp_keys",
+)
+
+INIT_RESULT_KEYS = (
+    "root_token",
+    "keys",
+    "keys_base64",
+    "recovery_keys",
+    "recovery_keys_base64",
+)
+
+
+def main():
+    argument_spec = dict(
+        VaultConnectionOptions.ARGUMENT_SPEC,
+        secret_shares=dict(type="int", default=5),
+        secret_threshold=dict(type="int", default=3),
+        pgp_keys=dict(type="list", elements="str", no_log=False),
+        root_token_pgp_key=dict(type="str", no_log=False),
+        recovery_shares=dict(type="int"),
+        recovery_threshold=dict(type="int"),
+        recovery_pgp_keys=dict(type="list", elements="str", no_log=False),
+        output_directory=dict(type="path"),
+    )
+    module = VaultModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    if module.params["secret_threshold"] > module.params["secret_shares"]:
+        module.fail_json(msg="secret_threshold can not be larger than secret_shares")
+
+    client = module.hvac_client()
+    if client.sys.is_initialized():
+        module.exit_json(changed=False, initialized=True)
+
+    if module.check_mode:
+        module.exit_json(changed=True, initialized=False)
+
+    params = dict(
+        (key, module.params[key])
+        for key in INIT_PARAMS
+        if module.params[key] is not None
+    )
+    response = client.sys.initialize(**params)
+
+    result = dict((key, response[key]) for key in INIT_RESULT_KEYS if response.get(key))
+    module.exit_json(changed=True, initialized=True, **result)
+
+
+if __name__ == "__main__":
+    main()
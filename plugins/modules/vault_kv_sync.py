@@ -0,0 +1,475 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: vault_kv_sync
+short_description: Imports and exports HashiCorp Vault KV version 2 secrets in bulk
+description:
+  - Copies the secrets stored under O(prefix) of a KV version 2 secrets engine from or to O(file).
+  - O(file) holds one entry per secret, with the C(path) of the secret relative to O(prefix), its C(data)
+    and, when it was exported, the C(version) it was read from.
+  - O(file) is read and written O(chunk_size) entries at a time, so the memory used does not grow with the
+    number of secrets. The entries of a chunk are read from or written to Vault over O(max_workers)
+    concurrent requests.
+  - When importing, secrets that already hold the data of their entry are not written again (see O(compare)).
+author:
+  - Josh Williams (@t3hpr1m3)
+requirements:
+  - python >= 3.8
+  - hvac >= 7.1.4
+  - PyYAML, when O(format=yaml)
+attributes:
+  check_mode:
+    support: full
+    description: Can run in check_mode and return changed status prediction without modifying target.
+  diff_mode:
+    support: none
+    description: The contents of secrets are never returned.
+  action:
+    support: full
+    description: Has a corresponding action plugin, which passes the trace context of the controller in O(tracing).
+options:
+  mode:
+    type: str
+    required: True
+    choices: [ "import", "export" ]
+    description:
+      - V(import) writes the entries of O(file) to Vault.
+      - V(export) writes every secret under O(prefix) to O(file), replacing it.
+  file:
+    type: path
+    required: True
+    description: File on the managed host to read the entries from, or to write them to.
+  format:
+    type: str
+    choices: [ "jsonl", "yaml" ]
+    description:
+      - V(jsonl) holds one JSON object per line.
+      - V(yaml) holds one YAML document per entry.
+      - Defaults to V(yaml) when O(file) ends with C(.yml) or C(.yaml), and to V(jsonl) otherwise.
+  engine_mount_point:
+    type: str
+    default: secret
+    description:
+      - Path the KV version 2 secrets engine is mounted at.
+      - O(mount_point) is the mount of the authentication method used to log in.
+  prefix:
+    type: str
+    default: ""
+    description: Path under O(engine_mount_point) the entry paths are relative to.
+  compare:
+    type: str
+    default: content
+    choices: [ "content", "version", "none" ]
+    description:
+      - How an imported entry is found to be unchanged.
+      - V(content) reads the current version of the secret, and compares a hash of its data with the entry.
+      - V(version) reads the metadata of the secret, and skips the entry when its C(version) is still the
+        current version of the secret. Entries without a C(version) are always written.
+      - V(none) writes every entry.
+  chunk_size:
+    type: int
+    default: 100
+    description: Number of entries held in memory, and handed to the workers, at a time.
+  max_workers:
+    type: int
+    default: 8
+    description: Maximum number of secrets read or written at the same time.
+  file_mode:
+    type: raw
+    default: "0600"
+    description: Permissions of O(file) when it is written by V(export).
+extends_documentation_fragment:
+  - dubzland.vault.auth
+  - dubzland.vault.connection
+  - dubzland.vault.metrics
+  - dubzland.vault.tracing
+"""
+
+EXAMPLES = """
+- name: Back up the application secrets
+  dubzland.vault.vault_kv_sync:
+    mode: export
+    file: /var/backups/vault/apps.jsonl
+    prefix: apps
+    url: https://vault.example.com:8200
+    token: "{{ _admin_token }}"
+
+- name: Seed the secrets of a new cluster
+  dubzland.vault.vault_kv_sync:
+    mode: import
+    file: /srv/seed/secrets.yml
+    engine_mount_point: kv
+    max_workers: 16
+    url: https://vault.example.com:8200
+    token: "{{ _admin_token }}"
+"""
+
+RETURN = r"""
+stats:
+    description:
+      - Counts and throughput of the run.
+      - C(entries) is the number of entries read from O(file), or secrets exported. C(written) is the number of
+        secrets written to Vault, or entries written to O(file). C(unchanged) is the number of entries skipped
+        by O(compare), and C(skipped) the number of exported secrets whose current version is deleted.
+    type: dict
+    returned: always
+    sample:
+      entries: 2000
+      written: 12
+      unchanged: 1988
+      skipped: 0
+      failed: 0
+      seconds: 4.21
+      entries_per_second: 475.06
+failures:
+    description: Path and error of the first entries that could not be synchronized.
+    type: list
+    elements: dict
+    returned: when an entry failed
+"""
+
+
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.module_utils.common.text.converters import to_native, to_text
+from ansible.module_utils.common.yaml import HAS_YAML, yaml_dump, yaml_load_all
+from ansible.module_utils.basic import missing_required_lib
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_tracing import (
+    propagate,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultModule,
+    ensure_hvac_package,
+)
+
+# Number of failed entries returned in the result.
+MAX_FAILURES = 10
+
+
+def data_hash(data):
+    """Hashes the data of a secret, independently of the order of its keys."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return "sha256:" + hashlib.sha256(encoded).hexdigest()
+
+
+def file_format(path, fmt=None):
+    if fmt is not None:
+        return fmt
+    if os.path.splitext(path)[1].lower() in (".yml", ".yaml"):
+        return "yaml"
+    return "jsonl"
+
+
+def _json_documents(stream):
+    for number, line in enumerate(stream, 1):
+        line = to_text(line)
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            raise ValueError("Line %d: %s" % (number, to_native(e)))
+
+
+def _yaml_documents(stream):
+    import yaml
+
+    try:
+        for document in yaml_load_all(stream):
+            if document is not None:
+                yield document
+    except yaml.YAMLError as e:
+        raise ValueError(to_native(e))
+
+
+def read_entries(stream, fmt):
+    """Yields the entries of ``stream``, one at a time.
+
+    :raises ValueError: When an entry can not be parsed, or has no ``path`` or
+        ``data``.
+    """
+    documents = _yaml_documents(stream) if fmt == "yaml" else _json_documents(stream)
+    for number, entry in enumerate(documents, 1):
+        if (
+            not isinstance(entry, dict)
+            or not entry.get("path")
+            or not isinstance(entry.get("data"), dict)
+        ):
+            raise ValueError("Entry %d needs a path and a data mapping" % number)
+        yield entry
+
+
+def format_entry(entry, fmt):
+    if fmt == "yaml":
+        return yaml_dump(entry, explicit_start=True, default_flow_style=False)
+    return json.dumps(entry, sort_keys=True) + "\n"
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class VaultKVSync(object):
+    """
+    Streams KV version 2 secrets between Vault and a file, a chunk at a time.
+
+    Every entry of a chunk is handed to a worker, and the chunk is finished
+    before the next one is read, so at most ``chunk_size`` entries are held in
+    memory. The workers share a single authenticated client.
+    """
+
+    def __init__(self, module, client):
+        self.module = module
+        self.client = client
+        self.kv = client.secrets.kv.v2
+        self.params = module.params
+        self.exceptions = ensure_hvac_package(module).exceptions
+
+        self.stats = dict(entries=0, written=0, unchanged=0, skipped=0, failed=0)
+        self.failures = []
+
+    def secret_path(self, path):
+        prefix = self.params["prefix"].strip("/")
+        path = path.strip("/")
+        return "%s/%s" % (prefix, path) if prefix else path
+
+    def relative_path(self, path):
+        prefix = self.params["prefix"].strip("/")
+        return path[len(prefix) + 1 :] if prefix else path
+
+    def read_secret(self, path):
+        """Returns the current version of a secret, or None when it is missing or deleted."""
+        try:
+            return self.kv.read_secret_version(
+                path=path,
+                mount_point=self.params["engine_mount_point"],
+                raise_on_deleted_version=True,
+            ).get("data")
+        except self.exceptions.InvalidPath:
+            return None
+
+    def is_current_version(self, path, version):
+        try:
+            metadata = self.kv.read_secret_metadata(
+                path=path, mount_point=self.params["engine_mount_point"]
+            ).get("data")
+        except self.exceptions.InvalidPath:
+            return False
+
+        current = (metadata.get("versions") or {}).get(str(version)) or {}
+        return (
+            metadata.get("current_version") == version
+            and not current.get("deletion_time")
+            and not current.get("destroyed")
+        )
+
+    def import_entry(self, entry):
+        """Writes an entry to Vault, unless it is unchanged.
+
+        :return: The counter the entry adds to, ``written`` or ``unchanged``.
+        """
+        path = self.secret_path(entry["path"])
+        compare = self.params["compare"]
+
+        if compare == "version" and entry.get("version") is not None:
+            if self.is_current_version(path, entry["version"]):
+                return "unchanged"
+        elif compare == "content":
+            current = self.read_secret(path)
+            if current is not None and data_hash(current["data"]) == data_hash(
+                entry["data"]
+            ):
+                return "unchanged"
+
+        if not self.module.check_mode:
+            self.kv.create_or_update_secret(
+                path=path,
+                secret=entry["data"],
+                mount_point=self.params["engine_mount_point"],
+            )
+        return "written"
+
+    def export_entry(self, path):
+        """Reads a secret into an entry, or None when its current version is deleted."""
+        secret = self.read_secret(path)
+        if secret is None:
+            return None
+        return dict(
+            path=self.relative_path(path),
+            data=secret["data"],
+            version=(secret.get("metadata") or {}).get("version"),
+        )
+
+    def walk(self, path=""):
+        """Yields the path of every secret under ``path``, in the order Vault lists them."""
+        try:
+            response = self.kv.list_secrets(
+                path=path, mount_point=self.params["engine_mount_point"]
+            )
+        except self.exceptions.InvalidPath:
+            return
+
+        for key in (response.get("data") or {}).get("keys") or []:
+            if key.endswith("/"):
+                for secret in self.walk(path + key):
+                    yield secret
+            else:
+                yield path + key
+
+    def _run_chunk(self, pool, function, chunk, name):
+        """Runs ``function`` for every item of ``chunk``, and returns the results in order.
+
+        The items that raise a Vault error are counted as failed, and left out.
+        """
+        results = []
+        function = propagate(getattr(self.module, "vault_tracing", None), function)
+        futures = [(item, pool.submit(function, item)) for item in chunk]
+        for item, future in futures:
+            try:
+                results.append(future.result())
+            except self.exceptions.VaultError as e:
+                self.stats["failed"] += 1
+                if len(self.failures) < MAX_FAILURES:
+                    self.failures.append(dict(path=name(item), msg=to_native(e)))
+        return results
+
+    def import_file(self, stream, fmt):
+        with ThreadPoolExecutor(max_workers=self.params["max_workers"]) as pool:
+            for chunk in chunked(read_entries(stream, fmt), self.params["chunk_size"]):
+                self.stats["entries"] += len(chunk)
+                for outcome in self._run_chunk(
+                    pool, self.import_entry, chunk, lambda entry: entry["path"]
+                ):
+                    self.stats[outcome] += 1
+
+        return self.stats["written"] > 0
+
+    def export_file(self, stream, fmt):
+        prefix = self.params["prefix"].strip("/")
+        with ThreadPoolExecutor(max_workers=self.params["max_workers"]) as pool:
+            for chunk in chunked(
+                self.walk(prefix + "/" if prefix else ""), self.params["chunk_size"]
+            ):
+                self.stats["entries"] += len(chunk)
+                for entry in self._run_chunk(
+                    pool, self.export_entry, chunk, self.relative_path
+                ):
+                    if entry is None:
+                        self.stats["skipped"] += 1
+                        continue
+                    stream.write(format_entry(entry, fmt).encode("utf-8"))
+                    self.stats["written"] += 1
+
+
+def export_to(module, sync, path, fmt):
+    """Exports into a temporary file next to ``path``, and only replaces ``path`` when the contents changed."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".vault_kv_sync.", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            sync.export_file(stream, fmt)
+
+        changed = not os.path.exists(path) or module.sha256(path) != module.sha256(
+            tmp_path
+        )
+        if sync.stats["failed"]:
+            # Leave the previous export in place, rather than an incomplete one.
+            changed = False
+        elif changed and not module.check_mode:
+            module.atomic_move(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    if not module.check_mode and os.path.exists(path):
+        changed = module.set_mode_if_different(
+            path, module.params["file_mode"], changed
+        )
+    return changed
+
+
+def main():
+    argument_spec = VaultModule.generate_argument_spec(
+        mode=dict(type="str", required=True, choices=["import", "export"]),
+        file=dict(type="path", required=True),
+        format=dict(type="str", choices=["jsonl", "yaml"]),
+        engine_mount_point=dict(type="str", default="secret"),
+        prefix=dict(type="str", default=""),
+        compare=dict(
+            type="str", default="content", choices=["content", "version", "none"]
+        ),
+        chunk_size=dict(type="int", default=100),
+        max_workers=dict(type="int", default=8),
+        file_mode=dict(type="raw", default="0600"),
+    )
+    module = VaultModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    path = module.params["file"]
+    fmt = file_format(path, module.params["format"])
+    if fmt == "yaml" and not HAS_YAML:
+        module.fail_json(msg=missing_required_lib("PyYAML"))
+    if module.params["chunk_size"] < 1 or module.params["max_workers"] < 1:
+        module.fail_json(msg="chunk_size and max_workers must be at least 1")
+
+    client = module.hvac_client()
+    module.authenticator.validate()
+    module.authenticator.authenticate(client)
+
+    sync = VaultKVSync(module, client)
+    started = time.monotonic()
+    try:
+        if module.params["mode"] == "import":
+            with open(path, "rb") as stream:
+                changed = sync.import_file(stream, fmt)
+        else:
+            changed = export_to(module, sync, path, fmt)
+    except (IOError, OSError, ValueError) as e:
+        module.fail_json(
+            msg="Could not %s %s: %s" % (module.params["mode"], path, to_native(e)),
+            stats=sync.stats,
+        )
+
+    seconds = time.monotonic() - started
+    stats = dict(
+        sync.stats,
+        seconds=round(seconds, 2),
+        entries_per_second=round(sync.stats["entries"] / seconds, 2) if seconds else 0,
+    )
+
+    if sync.failures:
+        module.fail_json(
+            msg="%d of %d entries could not be synchronized"
+            % (stats["failed"], stats["entries"]),
+            changed=changed,
+            stats=stats,
+            failures=sync.failures,
+        )
+
+    module.exit_json(changed=changed, stats=stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: vault_policies
+short_description: Synchronizes many HashiCorp Vault ACL policies at once
+description:
+  - Brings every policy in O(policies) and O(directory) to the desired state in a single task.
+  - The existing policies are listed once. A policy is only read when its content hash differs from the one
+    recorded in O(manifest) by a previous run, and only written when its content changed.
+  - Policies are compared after normalizing their whitespace, so re-indenting a policy does not rewrite it.
+  - Reads and writes are spread over O(max_workers) concurrent requests.
+author:
+  - Josh Williams (@t3hpr1m3)
+requirements:
+  - python >= 3.8
+  - hvac >= 7.1.4
+attributes:
+  check_mode:
+    support: full
+    description: Can run in check_mode and return changed status prediction without modifying target.
+  diff_mode:
+    support: full
+    description: Will return details on what has changed (or possibly needs changing in check_mode), when in diff mode.
+  action:
+    support: full
+    description: Has a corresponding action plugin, which reads O(directory), O(policies[].src) and O(manifest) on the controller.
+options:
+  policies:
+    type: list
+    elements: dict
+    default: []
+    description: Policies to manage.
+    suboptions:
+      name:
+        type: str
+        required: True
+        description: Name of the policy.
+      policy:
+        type: str
+        description:
+          - HCL rules of the policy.
+          - Required when O(policies[].state=present), unless O(policies[].src) is set.
+      src:
+        type: path
+        description:
+          - File on the controller holding the HCL rules of the policy.
+          - Searched for like the C(src) of M(ansible.builtin.copy). Handled by the action plugin.
+      state:
+        type: str
+        default: present
+        choices: [ "present", "absent" ]
+        description: Indicates the desired policy state.
+  directory:
+    type: path
+    description:
+      - Directory on the controller holding C(.hcl) files, each managed as a policy named after the file.
+      - Handled by the action plugin.
+  manifest:
+    type: path
+    description:
+      - JSON file on the controller recording the content hash of every policy written or verified by the last
+        successful run against O(url) and O(namespace).
+      - The manifest is trusted to describe what is stored in Vault. Policies whose hash matches the manifest are
+        not read back from Vault, so a change made to them outside of this module is neither detected nor
+        corrected. Set O(verify=true) to compare every policy with Vault regardless.
+      - Handled by the action plugin, which updates the manifest after every successful run.
+  known_hashes:
+    type: dict
+    description:
+      - Content hash of the policies known to be stored in Vault, by name.
+      - Set by the action plugin from O(manifest); there is usually no need to set it.
+      - Ignored when O(verify=true).
+  verify:
+    type: bool
+    default: false
+    description:
+      - Read every policy back from Vault and compare it, even when its hash matches O(manifest), to detect and
+        correct changes made outside of this module.
+      - The manifest is still updated afterwards.
+  exclusive:
+    type: bool
+    default: false
+    description:
+      - Delete every existing policy that is not listed in O(policies) or O(directory).
+      - The C(root) and C(default) policies are never deleted.
+  max_workers:
+    type: int
+    default: 8
+    description: Maximum number of policies read or written at the same time.
+extends_documentation_fragment:
+  - dubzland.vault.auth
+  - dubzland.vault.connection
+  - dubzland.vault.metrics
+  - dubzland.vault.tracing
+"""
+
+EXAMPLES = """
+- name: Synchronize every policy in the repository
+  dubzland.vault.vault_policies:
+    directory: "{{ playbook_dir }}/policies"
+    manifest: "{{ playbook_dir }}/.vault-policies.json"
+    exclusive: true
+    url: https://vault.example.com:8200
+    token: "{{ _admin_token }}"
+  run_once: true
+
+- name: Manage a few policies inline
+  dubzland.vault.vault_policies:
+    policies:
+      - name: read-secrets
+        policy: |
+          path "secret/data/*" {
+            capabilities = ["read"]
+          }
+      - name: operators
+        src: policies/operators.hcl
+      - name: legacy
+        state: absent
+    url: https://vault.example.com:8200
+    token: "{{ _admin_token }}"
+"""
+
+RETURN = r"""
+policies:
+    description:
+      - Result for every policy that was listed, or deleted by O(exclusive), by name.
+      - Each entry holds C(changed), C(state) and, for present policies, the C(policy) C(name) and content C(hash).
+    type: dict
+    returned: always
+hashes:
+    description:
+      - Content hash of every managed policy now stored in Vault, by name.
+      - The action plugin writes these to O(manifest), and drops them from the result.
+    type: dict
+    returned: success, when O(manifest) is not set
+"""
+
+
+import hashlib
+import re
+
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultModule,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_reconciler import (
+    VaultReconciler,
+)
+
+
+# Policies that always exist, and can not be deleted.
+BUILTIN_POLICIES = ("root", "default")
+
+_TRAILING_WHITESPACE = re.compile(r"[ \t]+$", re.MULTILINE)
+
+
+def normalize_policy(policy):
+    """Drops the whitespace that does not change what a policy means."""
+    policy = _TRAILING_WHITESPACE.sub("", policy.replace("\r\n", "\n"))
+    return "\n".join(line for line in policy.split("\n") if line.strip()).strip()
+
+
+def policy_hash(policy):
+    normalized = normalize_policy(policy).encode("utf-8")
+    return "sha256:" + hashlib.sha256(normalized).hexdigest()
+
+
+class VaultPolicyReconciler(VaultReconciler):
+    """
+    Reconciles the ACL policies under sys/policies/acl.
+
+    The listing only holds policy names. A policy's rules are read when its
+    hash is not already known, and compared by hash.
+    """
+
+    KIND = "policy"
+    KIND_PLURAL = "policies"
+    RESULT_KEY = "policy"
+
+    def __init__(self, module, client, known_hashes=None):
+        super(VaultPolicyReconciler, self).__init__(module, client)
+        self.known_hashes = known_hashes or {}
+
+    def list(self):
+        response = self.client.sys.list_acl_policies()
+        names = (response.get("data") or {}).get("keys") or []
+        return dict(
+            (name, dict(name=name, hash=self.known_hashes.get(name))) for name in names
+        )
+
+    def create(self, key, desired):
+        self.client.sys.create_or_update_acl_policy(key, desired["policy"])
+
+    def update(self, key, desired, current, updated_keys):
+        self.create(key, desired)
+
+    def delete(self, key, current):
+        self.client.sys.delete_acl_policy(key)
+
+    def compare(self, desired, current):
+        if current["hash"] == desired["hash"] and not self.diff_mode:
+            return []
+
+        # Each worker only touches the entry of its own policy.
+        response = self.client.sys.read_acl_policy(current["name"])
+        current["policy"] = (response.get("data") or {}).get("policy") or ""
+        current["hash"] = policy_hash(current["policy"])
+        return [] if current["hash"] == desired["hash"] else ["policy"]
+
+    def merge(self, desired, current):
+        merged = dict(name=desired["name"], hash=desired["hash"])
+        if self.diff_mode:
+            merged["policy"] = desired["policy"]
+        return merged
+
+    def is_protected(self, key, current):
+        return key in BUILTIN_POLICIES
+
+
+def main():
+    argument_spec = VaultModule.generate_argument_spec(
+        policies=dict(
+            type="list",
+            elements="dict",
+            default=[],
+            options=dict(
+                name=dict(type="str", required=True),
+                policy=dict(type="str"),
+                src=dict(type="path"),
+                state=dict(default="present", choices=["present", "absent"]),
+            ),
+        ),
+        directory=dict(type="path"),
+        manifest=dict(type="path"),
+        known_hashes=dict(type="dict", no_log=False),
+        verify=dict(type="bool", default=False),
+        exclusive=dict(type="bool", default=False),
+        max_workers=dict(type="int", default=8),
+    )
+    module = VaultModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    resources = []
+    for policy in module.params["policies"]:
+        name = policy["name"]
+        if policy["state"] == "absent":
+            resources.append((name, None, "absent"))
+            continue
+        if policy["policy"] is None:
+            module.fail_json(msg="Policy %s has no rules" % name)
+        if name == "root":
+            module.fail_json(msg="The root policy can not be changed")
+        resources.append(
+            (
+                name,
+                dict(
+                    name=name,
+                    policy=policy["policy"],
+                    hash=policy_hash(policy["policy"]),
+                ),
+                "present",
+            )
+        )
+
+    client = module.hvac_client()
+    module.authenticator.validate()
+    module.authenticator.authenticate(client)
+
+    known_hashes = None if module.params["verify"] else module.params["known_hashes"]
+    reconciler = VaultPolicyReconciler(module, client, known_hashes)
+    result = reconciler.reconcile_all(
+        resources,
+        exclusive=module.params["exclusive"],
+        max_workers=module.params["max_workers"],
+    )
+    result["policies"] = result.pop("results")
+
+    if result.pop("failed", False):
+        module.fail_json(**result)
+
+    result["hashes"] = dict(
+        (name, desired["hash"])
+        for name, desired, state in resources
+        if state == "present"
+    )
+    module.exit_json(**result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: vault_secrets_engine
+short_description: Manages HashiCorp Vault secrets engines
+description:
+  - When the secrets engine is not mounted, it will be enabled.
+  - When the secrets engine is mounted and O(state=absent), it will be disabled.
+  - When the description, O(config) or O(options) of a mounted secrets engine differ, it will be tuned.
+author:
+  - Josh Williams (@t3hpr1m3)
+requirements:
+  - python >= 3.8
+  - hvac >= 7.1.4
+attributes:
+  check_mode:
+    support: full
+    description: Can run in check_mode and return changed status prediction without modifying target.
+  diff_mode:
+    support: full
+    description: Will return details on what has changed (or possibly needs changing in check_mode), when in diff mode.
+  action:
+    support: full
+    description: Has a corresponding action plugin, which passes the trace context of the controller in O(tracing).
+options:
+  engine_type:
+    type: str
+    required: True
+    description:
+      - Type of the secrets engine, e.g. V(kv), V(pki), V(transit) or V(database).
+      - The type of a mounted secrets engine can not be changed.
+  path:
+    type: str
+    description: Path to mount the secrets engine at. Defaults to O(engine_type).
+  description:
+    type: str
+    description: Human readable description for the secrets engine.
+  config:
+    type: dict
+    suboptions:
+      default_lease_ttl:
+        type: str
+        description: The default lease duration, specified as a string duration like "5s" or "30m".
+      max_lease_ttl:
+        type: str
+        description: The maximum lease duration, specified as a string duration like "5s" or "30m".
+      force_no_cache:
+        type: bool
+        description: Disable caching for the secrets engine.
+      audit_non_hmac_request_keys:
+        type: list
+        elements: str
+        description: List of keys that will not be HMAC'd by audit devices in the request data object.
+      audit_non_hmac_response_keys:
+        type: list
+        elements: str
+        description: List of keys that will not be HMAC'd by audit devices in the response data object.
+      listing_visibility:
+        type: str
+        choices: [ "unauth", "hidden" ]
+        description: Specifies whether to show this mount in the UI-specific listing endpoint.
+      passthrough_request_headers:
+        type: list
+        elements: str
+        description: List of headers to allow and pass from the request to the plugin.
+      allowed_response_headers:
+        type: list
+        elements: str
+        description: List of headers to allow, allowing a plugin to include them in the response.
+      plugin_version:
+        type: str
+        description: Specifies the semantic version of the plugin to use, e.g. "v1.0.0".
+    description: Configuration provided to the secrets engine.
+  options:
+    type: dict
+    description:
+      - Options specific to the secrets engine type, e.g. C(version) for V(kv).
+      - Values are compared as strings, as Vault returns them.
+  local:
+    type: bool
+    description:
+      - Only replicate the secrets engine within the local cluster.
+      - Only used when enabling the secrets engine, and can not be changed afterwards.
+  seal_wrap:
+    type: bool
+    description:
+      - Enable seal wrapping for the secrets engine.
+      - Only used when enabling the secrets engine, and can not be changed afterwards.
+  state:
+    description:
+      - Indicates the desired secrets engine state.
+      - V(present) ensures the secrets engine is enabled.
+      - V(absent) ensures the secrets engine is disabled. All of its data is deleted.
+    default: present
+    choices: [ "present", "absent" ]
+    type: str
+  verify_result:
+    description:
+      - After enabling or tuning the secrets engine, read its tuning back from Vault and return it
+        in RV(secrets_engine).
+      - By default, RV(secrets_engine) is built from the desired state and the mount table read at the start
+        of the run.
+    type: bool
+    default: false
+extends_documentation_fragment:
+  - dubzland.vault.auth
+  - dubzland.vault.connection
+  - dubzland.vault.metrics
+  - dubzland.vault.tracing
+  - dubzland.vault.fanout
+"""
+
+EXAMPLES = """
+- name: Enable a KV version 2 secrets engine
+  dubzland.vault.vault_secrets_engine:
+    engine_type: kv
+    path: secret
+    description: Application secrets
+    options:
+      version: 2
+    url: http://localhost:8200
+    token: "{{ _root_token }}"
+
+- name: Limit the lease duration of the database secrets engine
+  dubzland.vault.vault_secrets_engine:
+    engine_type: database
+    config:
+      default_lease_ttl: 1h
+      max_lease_ttl: 24h
+    url: http://localhost:8200
+    token: "{{ _root_token }}"
+
+- name: Disable the transit secrets engine
+  dubzland.vault.vault_secrets_engine:
+    engine_type: transit
+    state: absent
+    url: http://localhost:8200
+    token: "{{ _root_token }}"
+"""
+
+RETURN = r"""
+secrets_engine:
+    description: Details about the secrets engine.
+    type: dict
+    returned: success, when O(targets) is not set
+    sample:
+      type: kv
+      description: Application secrets
+      config:
+        default_lease_ttl: 0
+        max_lease_ttl: 0
+        force_no_cache: false
+      options:
+        version: "2"
+targets:
+    description:
+      - Result for every target, in the order given in O(targets).
+      - Each entry holds the target C(url) and C(namespace), C(changed), C(failed), C(msg) and,
+        when it was found or created, the C(secrets_engine).
+    type: list
+    elements: dict
+    returned: when O(targets) is set
+"""
+
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_common import (
+    VaultReconcileError,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_fanout import (
+    VaultFanout,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultModule,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_reconciler import (
+    VaultMountReconciler,
+    without_none,
+)
+
+
+# Settings fixed when the secrets engine is enabled.
+MOUNT_SETTINGS = ("local", "seal_wrap")
+
+
+class VaultSecretsEngineReconciler(VaultMountReconciler):
+    """Reconciles the secrets engines mounted under sys/mounts."""
+
+    KIND = "secrets engine"
+    RESULT_KEY = "secrets_engine"
+
+    def list(self):
+        response = self.client.sys.list_mounted_secrets_engines()
+        return response.get("data", response)
+
+    def create(self, key, desired):
+        self.client.sys.enable_secrets_engine(
+            desired["type"],
+            path=key,
+            description=desired["description"],
+            config=desired["config"],
+            options=desired["options"] or None,
+            **desired["settings"]
+        )
+
+    def update(self, key, desired, current, updated_keys):
+        self.client.sys.tune_mount_configuration(
+            key,
+            description=desired["description"],
+            options=desired["options"] or None,
+            **desired["config"]
+        )
+
+    def delete(self, key, current):
+        self.client.sys.disable_secrets_engine(key)
+
+    def read_tuning(self, key):
+        return self.client.sys.read_mount_configuration(key).get("data")
+
+    def validate(self, key, desired, current):
+        super(VaultSecretsEngineReconciler, self).validate(key, desired, current)
+        for setting, value in desired["settings"].items():
+            if bool(current.get(setting)) != value:
+                raise VaultReconcileError(
+                    "%s can not be changed on the mounted secrets engine %s"
+                    % (setting, key)
+                )
+
+    def merge(self, desired, current):
+        merged = super(VaultSecretsEngineReconciler, self).merge(desired, current)
+        if current is None:
+            merged.update(desired["settings"])
+        return merged
+
+    def is_protected(self, key, current):
+        return current.get("type") in ("system", "cubbyhole", "identity")
+
+
+def desired_secrets_engine(params):
+    """Builds the desired mount table entry from the module options."""
+    return dict(
+        type=params["engine_type"],
+        description=params["description"],
+        config=without_none(params["config"]),
+        # Vault returns every option as a string.
+        options=dict(
+            (key, str(value)) for key, value in without_none(params["options"]).items()
+        ),
+        settings=without_none(dict((key, params[key]) for key in MOUNT_SETTINGS)),
+    )
+
+
+def converge_secrets_engine(reconciler):
+    params = reconciler.module.params
+    return reconciler.converge(
+        reconciler.key(params["path"] or params["engine_type"]),
+        desired_secrets_engine(params),
+        params["state"],
+        params["verify_result"],
+    )
+
+
+def main():
+    argument_spec = VaultModule.generate_argument_spec(
+        engine_type=dict(type="str", required=True),
+        path=dict(type="str"),
+        description=dict(type="str"),
+        config=dict(
+            type="dict",
+            options=dict(
+                default_lease_ttl=dict(type="str"),
+                max_lease_ttl=dict(type="str"),
+                force_no_cache=dict(type="bool"),
+                audit_non_hmac_request_keys=dict(
+                    type="list", elements="str", no_log=False
+                ),
+                audit_non_hmac_response_keys=dict(
+                    type="list", elements="str", no_log=False
+                ),
+                listing_visibility=dict(type="str", choices=["unauth", "hidden"]),
+                passthrough_request_headers=dict(type="list", elements="str"),
+                allowed_response_headers=dict(type="list", elements="str"),
+                plugin_version=dict(type="str"),
+            ),
+        ),
+        options=dict(type="dict"),
+        local=dict(type="bool"),
+        seal_wrap=dict(type="bool"),
+        state=dict(default="present", choices=["present", "absent"]),
+        verify_result=dict(type="bool", default=False),
+        **VaultFanout.ARGUMENT_SPEC
+    )
+    module = VaultModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    result = VaultSecretsEngineReconciler.run(module, converge_secrets_engine)
+    if result.pop("failed", False):
+        module.fail_json(**result)
+
+    module.exit_json(**result)
+
+
+if __name__ == "__main__":
+    main()
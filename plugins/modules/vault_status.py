@@ -0,0 +1,144 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: vault_status
+short_description: Reports the status of HashiCorp Vault servers
+description:
+  - Reads C(sys/seal-status), C(sys/health) and, for unsealed nodes, C(sys/leader) from every node concurrently.
+  - Returns the status of every node, and a summary of the whole cluster that tasks can gate on.
+  - Nodes that do not answer within O(timeout) are reported as unreachable, and do not fail the task.
+author:
+  - Josh Williams (@t3hpr1m3)
+requirements:
+  - python >= 3.8
+  - hvac >= 7.1.4
+attributes:
+  check_mode:
+    support: full
+    description: Can run in check_mode and return changed status prediction without modifying target.
+  diff_mode:
+    support: none
+    description: Will return details on what has changed (or possibly needs changing in check_mode), when in diff mode.
+options:
+  timeout:
+    type: int
+    default: 5
+    description: Seconds to wait for each node to answer.
+  retries:
+    type: int
+    default: 0
+    description: Number of times a failed request to a node is retried.
+notes:
+  - The status endpoints do not require authentication, so no authentication options are accepted.
+  - O(targets[].namespace) is ignored, as the status applies to the whole server.
+extends_documentation_fragment:
+  - dubzland.vault.connection
+  - dubzland.vault.fanout
+"""
+
+EXAMPLES = """
+- name: Wait for the cluster to be unsealed, with a single active node
+  dubzland.vault.vault_status:
+    url: https://vault-1.example.com:8200
+    targets:
+      - url: https://vault-1.example.com:8200
+      - url: https://vault-2.example.com:8200
+      - url: https://vault-3.example.com:8200
+  register: _vault_status
+  until: _vault_status.cluster.healthy
+  retries: 30
+  delay: 2
+  run_once: true
+"""
+
+RETURN = r"""
+cluster:
+    description: Summary of every node's status.
+    type: dict
+    returned: always
+    contains:
+      nodes:
+        description: Number of nodes polled.
+        type: int
+      reachable:
+        description: Number of nodes that answered.
+        type: int
+      unreachable:
+        description: URLs of the nodes that did not answer.
+        type: list
+        elements: str
+      initialized:
+        description: Whether every reachable node is initialized.
+        type: bool
+      sealed:
+        description: URLs of the sealed nodes.
+        type: list
+        elements: str
+      active:
+        description: URLs of the active nodes. A healthy cluster has exactly one.
+        type: list
+        elements: str
+      standby:
+        description: URLs of the unsealed standby nodes.
+        type: list
+        elements: str
+      versions:
+        description: Vault versions running across the reachable nodes.
+        type: list
+        elements: str
+      healthy:
+        description: Whether every node answered, none is sealed, and exactly one is active.
+        type: bool
+    sample:
+      nodes: 3
+      reachable: 3
+      unreachable: []
+      initialized: true
+      sealed: []
+      active: [https://vault-1.example.com:8200]
+      standby: [https://vault-2.example.com:8200, https://vault-3.example.com:8200]
+      versions: [1.17.2]
+      healthy: true
+nodes:
+    description:
+      - Status of every node, in the order given in O(targets).
+      - Each entry holds the node C(url), whether it is C(reachable), C(initialized), C(sealed), C(standby),
+        C(performance_standby) or C(active), the unseal C(progress), C(threshold) and C(shares), its C(version),
+        C(cluster_name) and C(leader_address), or the C(error) that made it unreachable.
+    type: list
+    elements: dict
+    returned: always
+"""
+
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_connection_options import (
+    VaultConnectionOptions,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_status import (
+    STATUS_ARGUMENT_SPEC,
+    run_status,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultModule,
+)
+
+
+def main():
+    argument_spec = dict(VaultConnectionOptions.ARGUMENT_SPEC, **STATUS_ARGUMENT_SPEC)
+    module = VaultModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    module.exit_json(**run_status(module))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: vault_unseal
+short_description: Unseals HashiCorp Vault servers
+description:
+  - Submits unseal keys to a sealed Vault server until it is unsealed.
+  - Only as many keys as the unseal threshold requires are submitted, and nothing is submitted to a server
+    that is already unsealed.
+  - Every node of an HA cluster can be unsealed concurrently by listing them in O(targets).
+author:
+  - Josh Williams (@t3hpr1m3)
+requirements:
+  - python >= 3.8
+  - hvac >= 7.1.4
+attributes:
+  check_mode:
+    support: full
+    description: Can run in check_mode and return changed status prediction without modifying target.
+  diff_mode:
+    support: none
+    description: Will return details on what has changed (or possibly needs changing in check_mode), when in diff mode.
+options:
+  keys:
+    type: list
+    elements: str
+    required: True
+    description:
+      - Unseal keys (hex or base64 encoded) to submit, in order.
+      - At least as many keys as the unseal threshold are required.
+  reset:
+    type: bool
+    default: false
+    description:
+      - Discard the keys submitted by a previous, unfinished unseal attempt before submitting O(keys).
+notes:
+  - The unseal endpoints do not require authentication, so no authentication options are accepted.
+  - O(targets[].namespace) is ignored, as unsealing applies to the whole server.
+extends_documentation_fragment:
+  - dubzland.vault.connection
+  - dubzland.vault.fanout
+"""
+
+EXAMPLES = """
+- name: Unseal the local Vault server
+  dubzland.vault.vault_unseal:
+    url: http://127.0.0.1:8200
+    keys: "{{ query('ansible.builtin.file', *query('ansible.builtin.fileglob', 'vault-tokens/unseal/key_*')) }}"
+
+- name: Unseal every node of the cluster at once
+  dubzland.vault.vault_unseal:
+    url: https://vault-1.example.com:8200
+    keys: "{{ _unseal_keys }}"
+    targets:
+      - url: https://vault-1.example.com:8200
+      - url: https://vault-2.example.com:8200
+      - url: https://vault-3.example.com:8200
+  run_once: true
+"""
+
+RETURN = r"""
+sealed:
+    description: Whether the server is still sealed.
+    type: bool
+    returned: success, when O(targets) is not set
+progress:
+    description: Number of keys the server has accepted towards the current unseal attempt.
+    type: int
+    returned: success, when O(targets) is not set
+threshold:
+    description: Number of keys required to unseal the server.
+    type: int
+    returned: success, when O(targets) is not set
+shares:
+    description: Number of key shares the root key was split into.
+    type: int
+    returned: success, when O(targets) is not set
+keys_submitted:
+    description: Number of keys submitted during this run.
+    type: int
+    returned: success, when O(targets) is not set
+targets:
+    description:
+      - Result for every node, in the order given in O(targets).
+      - Each entry holds the node C(url), C(changed), C(failed), C(msg), C(sealed), C(progress),
+        C(threshold), C(shares) and C(keys_submitted).
+    type: list
+    elements: dict
+    returned: when O(targets) is set
+"""
+
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_connection_options import (
+    VaultConnectionOptions,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_fanout import (
+    VaultFanout,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultModule,
+)
+
+
+def seal_state(status):
+    return dict(
+        sealed=status["sealed"],
+        progress=status["progress"],
+        threshold=status["t"],
+        shares=status["n"],
+    )
+
+
+def unseal(module, client):
+    """Unseals the server behind ``client``, and returns its result."""
+    keys = module.params["keys"]
+    reset = module.params["reset"]
+
+    result = seal_state(client.sys.read_seal_status())
+    result.update(changed=False, keys_submitted=0)
+    if not result["sealed"]:
+        result["msg"] = "Vault is already unsealed"
+        return result
+
+    needed = result["threshold"] - (0 if reset else result["progress"])
+    if len(keys) < needed:
+        result.update(
+            failed=True,
+            msg="%d more unseal keys are needed, but only %d were given"
+            % (needed, len(keys)),
+        )
+        return result
+
+    result["changed"] = True
+    if module.check_mode:
+        result["msg"] = "Vault would have been unsealed"
+        return result
+
+    if reset:
+        client.sys.submit_unseal_key(reset=True)
+
+    for key in keys:
+        result.update(seal_state(client.sys.submit_unseal_key(key=key)))
+        result["keys_submitted"] += 1
+        if not result["sealed"]:
+            break
+
+    if result["sealed"]:
+        result.update(
+            failed=True,
+            msg="Vault is still sealed after submitting %d keys"
+            % result["keys_submitted"],
+        )
+    else:
+        result["msg"] = "Vault unsealed with %d keys" % result["keys_submitted"]
+
+    return result
+
+
+def main():
+    argument_spec = dict(
+        VaultConnectionOptions.ARGUMENT_SPEC,
+        keys=dict(type="list", elements="str", required=True, no_log=True),
+        reset=dict(type="bool", default=False),
+        **VaultFanout.ARGUMENT_SPEC
+    )
+    module = VaultModule(argument_spec=argument_spec, supports_check_mode=True)
+
+    if module.params["targets"]:
+        fanout = VaultFanout(module)
+        result = fanout.aggregate(
+            fanout.run(
+                lambda client, target: unseal(module, client), authenticate=False
+            )
+        )
+    else:
+        result = unseal(module, module.hvac_client())
+
+    if result.pop("failed", False):
+        module.fail_json(**result)
+
+    module.exit_json(**result)
+
+
+if __name__ == "__main__":
+    main()
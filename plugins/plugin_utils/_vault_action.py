@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible.plugins.action import ActionBase
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_tracing import (
+    inject_context,
+)
+
+
+class VaultActionBase(ActionBase):
+    """
+    Runs ``MODULE_NAME`` on the host, with the trace context of the
+    controller passed in ``tracing`` when tracing is enabled.
+    """
+
+    MODULE_NAME = None
+
+    _supports_async = True
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(VaultActionBase, self).run(tmp, task_vars)
+        del tmp
+
+        result.update(
+            self._execute_module(
+                module_name=self.MODULE_NAME,
+                module_args=inject_context(self._task.args.copy()),
+                task_vars=task_vars,
+                wrap_async=self._task.async_val
+                and not self._connection.has_native_async,
+            )
+        )
+        return result
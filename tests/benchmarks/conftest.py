@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import collections
+import json
+import os
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ansible_collections.dubzland.vault.tests.unit.plugins.modules.utils import (
+    set_module_args,
+)
+
+# Milliseconds added to every response, to stand in for the network and
+# storage round trip of a real server.
+DEFAULT_LATENCY = float(os.environ.get("VAULT_BENCHMARK_LATENCY", "2"))
+
+
+class VaultStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send the headers and body of a response in a single segment, rather
+    # than measuring delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super(VaultStubHandler, self).setup()
+        self.server.stub.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("POST")
+
+    def do_DELETE(self):
+        self.dispatch("DELETE")
+
+    def do_LIST(self):
+        self.dispatch("LIST")
+
+    def dispatch(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        path = self.path.split("?", 1)[0]
+
+        status, payload = self.server.stub.handle(method, path, body)
+        data = json.dumps(payload).encode() if payload is not None else b""
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class VaultStub:
+    """
+    Answers the endpoints the collection's modules use, from an in-memory
+    mount table, policy store and KV version 2 engine mounted at secret/, and
+    counts every request, login and connection.
+    """
+
+    def __init__(self, latency=DEFAULT_LATENCY):
+        self.latency = latency
+        self.requests = collections.Counter()
+        self.logins = collections.Counter()
+        self.connections = 0
+        self.mounts = {}
+        self.policies = {}
+        # Every version of every secret, by path.
+        self.secrets = {}
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), VaultStubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:%d" % self._server.server_address[1]
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self, mounts=None, policies=None, secrets=None):
+        """Forgets the counters, and replaces the mount table, policies and secrets."""
+        with self._lock:
+            self.requests.clear()
+            self.logins.clear()
+            self.connections = 0
+            self.mounts = dict(mounts or {})
+            self.policies = dict(policies or {})
+            self.secrets = dict(
+                (path, list(versions)) for path, versions in (secrets or {}).items()
+            )
+
+    def handle(self, method, path, body):
+        if self.latency:
+            time.sleep(self.latency / 1000.0)
+
+        with self._lock:
+            self.requests[(method, path)] += 1
+            return self._route(method, path[len("/v1/") :], body)
+
+    def _route(self, method, path, body):
+        if path.startswith("auth/") and "/login" in path:
+            mount = path[len("auth/") :].split("/login", 1)[0]
+            self.logins[mount] += 1
+            return 200, dict(
+                auth=dict(
+                    client_token="hvs.benchmark",
+                    accessor="benchmark",
+                    policies=["default"],
+                    lease_duration=3600,
+                    renewable=True,
+                )
+            )
+
+        if path == "auth/token/lookup-self":
+            return 200, dict(
+                data=dict(ttl=3600, renewable=False, policies=["root"], period=None)
+            )
+
+        if path == "sys/auth" and method == "GET":
+            return 200, dict(data=self.mounts)
+
+        if path.startswith("sys/auth/"):
+            mount = path[len("sys/auth/") :]
+            tune = mount.endswith("/tune")
+            mount = (mount[: -len("/tune")] if tune else mount).rstrip("/") + "/"
+
+            if tune and method == "GET":
+                config = self.mounts.get(mount, {}).get("config", {})
+                return 200, dict(data=dict(config))
+            if tune:
+                entry = self.mounts.setdefault(mount, dict(config={}))
+                description = body.pop("description", None)
+                if description is not None:
+                    entry["description"] = description
+                entry["config"].update(body)
+                return 204, None
+            if method == "POST":
+                self.mounts[mount] = dict(
+                    type=body.get("type"),
+                    description=body.get("description") or "",
+                    config=dict(body.get("config") or {}),
+                )
+                return 204, None
+            if method == "DELETE":
+                self.mounts.pop(mount, None)
+                return 204, None
+
+        if path == "sys/policies/acl" and method == "LIST":
+            return 200, dict(data=dict(keys=sorted(self.policies)))
+
+        if path.startswith("sys/policies/acl/"):
+            name = path[len("sys/policies/acl/") :]
+            if method == "GET" and name in self.policies:
+                return 200, dict(data=dict(name=name, policy=self.policies[name]))
+            if method == "POST":
+                self.policies[name] = body["policy"]
+                return 204, None
+            if method == "DELETE":
+                self.policies.pop(name, None)
+                return 204, None
+
+        if path.startswith("secret/data/"):
+            name = path[len("secret/data/") :]
+            versions = self.secrets.get(name)
+            if method == "GET" and versions:
+                return 200, dict(
+                    data=dict(data=versions[-1], metadata=dict(version=len(versions)))
+                )
+            if method == "POST":
+                versions = self.secrets.setdefault(name, [])
+                versions.append(body["data"])
+                return 200, dict(data=dict(version=len(versions)))
+
+        if path.startswith("secret/metadata/"):
+            name = path[len("secret/metadata/") :]
+            if method == "LIST":
+                # Listing "apps" and "apps/" are the same.
+                name = name.rstrip("/") + "/" if name else ""
+                keys = set()
+                for secret in self.secrets:
+                    if secret.startswith(name):
+                        child, slash, rest = secret[len(name) :].partition("/")
+                        keys.add(child + slash)
+                if keys:
+                    return 200, dict(data=dict(keys=sorted(keys)))
+            elif method == "GET" and name in self.secrets:
+                count = len(self.secrets[name])
+                return 200, dict(
+                    data=dict(
+                        current_version=count,
+                        versions=dict((str(v), {}) for v in range(1, count + 1)),
+                    )
+                )
+
+        return 404, dict(errors=["no handler for %s %s" % (method, path)])
+
+
+@pytest.fixture
+def vault_server():
+    stub = VaultStub()
+    stub.start()
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def run_module(capsys):
+    """Runs a module's main() with the given arguments, and returns its result."""
+
+    def run(module, args):
+        set_module_args(args)
+        try:
+            module.main()
+        except SystemExit:
+            pass
+        out = capsys.readouterr().out
+        return json.loads(out.strip().splitlines()[-1])
+
+    return run
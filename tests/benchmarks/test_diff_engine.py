@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.dubzland.vault.plugins.module_utils import vault_utils
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_utils import (
+    diff_state,
+    get_keys_updated,
+)
+
+from ansible_collections.dubzland.vault.tests.unit.compat import mock
+
+
+def mount_table(size, ttl):
+    return dict(
+        (
+            "userpass-%d/" % i,
+            {
+                "type": "userpass",
+                "description": "Mount %d" % i,
+                "config": {
+                    "default_lease_ttl": ttl,
+                    "max_lease_ttl": ttl,
+                    "passthrough_request_headers": ["X-One", "X-Two", "X-Three"],
+                    "audit_non_hmac_request_keys": ["role_id", "username"],
+                    "listing_visibility": "hidden",
+                },
+            },
+        )
+        for i in range(size)
+    )
+
+
+def test_diff_large_mount_table(benchmark):
+    desired = mount_table(5000, "1h")
+    current = mount_table(5000, 3600)
+
+    result = benchmark(diff_state, desired, current)
+
+    assert result == {}
+
+
+def test_keys_updated_large_mount_table(benchmark):
+    desired = mount_table(5000, "1h")
+    current = mount_table(5000, 3600)
+    current["userpass-42/"]["description"] = "Changed"
+
+    result = benchmark(get_keys_updated, desired, current)
+
+    assert result == ["userpass-42/"]
+
+
+def test_diff_scales_linearly():
+    def operations(size):
+        desired = mount_table(size, "1h")
+        current = mount_table(size, 3600)
+        with mock.patch.object(
+            vault_utils, "_normalize", wraps=vault_utils._normalize
+        ) as normalize, mock.patch.object(
+            vault_utils, "_is_equal", wraps=vault_utils._is_equal
+        ) as is_equal:
+            assert diff_state(desired, current) == {}
+        return normalize.call_count + is_equal.call_count
+
+    # 8x the entries must cost exactly 8x the work; anything quadratic
+    # would be ~64x. Counting calls keeps this independent of the machine.
+    assert operations(8000) == 8 * operations(1000)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_utils import (
+    parse_duration,
+)
+
+# The TTLs seen across a bulk run: a handful of distinct values, compared
+# thousands of times.
+DURATIONS = ["1h", "30m", "8h", "768h", "45s", "1h30m", "2h15m10s"] * 1000
+
+
+def split_based(original_value):
+    """The split-based conversion that parse_duration replaced."""
+    try:
+        value = str(original_value)
+        seconds = 0
+        if "h" in value:
+            ray = value.split("h")
+            seconds = int(ray.pop(0)) * 3600
+            value = "".join(ray)
+        if "m" in value:
+            ray = value.split("m")
+            seconds += int(ray.pop(0)) * 60
+            value = "".join(ray)
+        if value:
+            ray = value.split("s")
+            seconds += int(ray.pop(0))
+        return seconds
+    except Exception:
+        pass
+    return original_value
+
+
+@pytest.mark.parametrize(
+    "convert", [split_based, parse_duration], ids=["split_based", "parse_duration"]
+)
+def test_convert_durations(benchmark, convert):
+    benchmark.group = "durations"
+
+    result = benchmark(lambda: [convert(value) for value in DURATIONS])
+
+    assert result == [split_based(value) for value in DURATIONS]
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+MODULE_UTILS = "ansible_collections.dubzland.vault.plugins.module_utils"
+
+# What a module does before it talks to Vault: import its module_utils and
+# pick the authentication method for the task.
+STARTUP = """
+import json, sys
+from {module_utils}.vault_module import VaultModule
+from {module_utils}.vault_auth import VaultAuth
+
+VaultAuth(dict(auth_method="{auth_method}")).get_authenticator()
+print(json.dumps(sorted(sys.modules)))
+"""
+
+# Imported only once a module builds a client or logs in.
+HEAVY_MODULES = ("hvac", "requests", "boto3", "azure.identity", "opentelemetry")
+
+
+def start(auth_method):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            STARTUP.format(module_utils=MODULE_UTILS, auth_method=auth_method),
+        ],
+        env=env,
+    )
+    return json.loads(output)
+
+
+@pytest.mark.parametrize("auth_method", ["token", "approle"])
+def test_startup(benchmark, auth_method):
+    benchmark.group = "startup"
+
+    modules = benchmark.pedantic(start, args=(auth_method,), rounds=5)
+
+    loaded = [name for name in modules if ".vault_auth_method_" in name]
+    assert len(loaded) == 1
+    for heavy in HEAVY_MODULES:
+        assert heavy not in modules
+
+
+IMPORT = """
+import importlib, json, sys
+importlib.import_module("ansible_collections.dubzland.vault.plugins.modules.{module}")
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["vault_auth_method", "vault_auth_methods", "vault_status", "vault_unseal"],
+)
+def test_module_import(benchmark, module):
+    benchmark.group = "module import"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    def import_module():
+        output = subprocess.check_output(
+            [sys.executable, "-c", IMPORT.format(module=module)], env=env
+        )
+        return json.loads(output)
+
+    # Each round runs in a fresh interpreter, and the benchmark records the
+    # process as a whole. The time depends on the host, so what is checked
+    # is that importing the module leaves the heavy dependencies alone.
+    modules = benchmark.pedantic(import_module, rounds=5)
+
+    for heavy in HEAVY_MODULES:
+        assert heavy not in modules
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.modules import vault_auth_method
+
+AUTH_ARGS = {
+    "token": dict(auth_method="token", token="hvs.root"),
+    "approle": dict(auth_method="approle", role_id="role", secret_id="secret"),
+    "userpass": dict(auth_method="userpass", username="admin", password="secret"),
+}
+
+# The mount each login-based method logs in through.
+LOGIN_MOUNTS = {"approle": "approle", "userpass": "userpass"}
+
+
+def module_args(vault_server, auth_method, **kwargs):
+    args = dict(
+        url=vault_server.url,
+        method_type="approle",
+        path="benchmark",
+        description="Benchmark AppRole mount",
+        config=dict(default_lease_ttl="1h", max_lease_ttl="8h"),
+    )
+    args.update(AUTH_ARGS[auth_method])
+    args.update(kwargs)
+    return args
+
+
+@pytest.mark.parametrize("auth_method", sorted(AUTH_ARGS))
+def test_create(benchmark, vault_server, run_module, auth_method):
+    benchmark.group = "vault_auth_method create"
+    args = module_args(vault_server, auth_method)
+    benchmark.pedantic(
+        run_module,
+        args=(vault_auth_method, args),
+        setup=vault_server.reset,
+        rounds=10,
+    )
+
+    # Counters only cover the last round, as setup resets them.
+    assert vault_server.mounts["benchmark/"]["description"] == args["description"]
+    assert vault_server.requests[("GET", "/v1/sys/auth")] == 1
+    assert vault_server.requests[("POST", "/v1/sys/auth/benchmark")] == 1
+    assert sum(vault_server.logins.values()) == (
+        1 if auth_method in LOGIN_MOUNTS else 0
+    )
+
+
+@pytest.mark.parametrize("auth_method", sorted(AUTH_ARGS))
+def test_unchanged(benchmark, vault_server, run_module, auth_method):
+    benchmark.group = "vault_auth_method unchanged"
+    args = module_args(vault_server, auth_method)
+    run_module(vault_auth_method, args)
+    mounts = dict(vault_server.mounts)
+
+    result = benchmark.pedantic(
+        run_module,
+        args=(vault_auth_method, args),
+        setup=lambda: vault_server.reset(mounts),
+        rounds=10,
+    )
+
+    assert result["changed"] is False
+    # A run that changes nothing lists the mounts once, after at most one
+    # login. The pooled session is shared across runs in the same process,
+    # so no new connection is opened.
+    logins = 1 if auth_method in LOGIN_MOUNTS else 0
+    assert vault_server.logins[LOGIN_MOUNTS.get(auth_method)] == logins
+    assert sum(vault_server.requests.values()) == 1 + logins
+    assert vault_server.connections == 0
+
+
+def test_login_count_with_targets(vault_server, run_module):
+    targets = [dict(url=vault_server.url, namespace="ns%d" % i) for i in range(8)]
+    args = module_args(vault_server, "approle", targets=targets, max_workers=4)
+
+    result = run_module(vault_auth_method, args)
+
+    assert not result.get("failed"), result
+    # One login per target, not one per request made against it.
+    assert vault_server.logins["approle"] == len(targets)
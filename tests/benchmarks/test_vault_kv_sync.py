@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from ansible_collections.dubzland.vault.plugins.modules import vault_kv_sync
+
+SECRET_COUNT = 2000
+
+
+def secrets(changed=0):
+    return dict(
+        (
+            "apps/team-%d/app-%d" % (i % 20, i),
+            [dict(password="secret-%d" % i, rotated=str(i < changed))],
+        )
+        for i in range(SECRET_COUNT)
+    )
+
+
+def module_args(vault_server, path, **kwargs):
+    args = dict(
+        url=vault_server.url,
+        token="hvs.root",
+        file=str(path),
+        prefix="apps",
+        max_workers=16,
+    )
+    args.update(kwargs)
+    return args
+
+
+def write_seed(path, stored):
+    with open(str(path), "w") as f:
+        for name, versions in sorted(stored.items()):
+            entry = dict(path=name[len("apps/") :], data=versions[-1])
+            f.write(json.dumps(entry) + "\n")
+
+
+def test_import(benchmark, vault_server, run_module, tmp_path):
+    benchmark.group = "vault_kv_sync"
+    path = tmp_path / "seed.jsonl"
+    write_seed(path, secrets())
+    args = module_args(vault_server, path, mode="import")
+
+    result = benchmark.pedantic(
+        run_module, args=(vault_kv_sync, args), setup=vault_server.reset, rounds=3
+    )
+
+    assert result["stats"]["written"] == SECRET_COUNT
+    assert len(vault_server.secrets) == SECRET_COUNT
+
+
+def test_reimport_mostly_unchanged(benchmark, vault_server, run_module, tmp_path):
+    benchmark.group = "vault_kv_sync"
+    path = tmp_path / "seed.jsonl"
+    write_seed(path, secrets(changed=20))
+    stored = secrets()
+    args = module_args(vault_server, path, mode="import")
+
+    result = benchmark.pedantic(
+        run_module,
+        args=(vault_kv_sync, args),
+        setup=lambda: vault_server.reset(secrets=stored),
+        rounds=3,
+    )
+
+    assert result["stats"]["written"] == 20
+    assert result["stats"]["unchanged"] == SECRET_COUNT - 20
+    # A read for every entry, and a write for each changed one only.
+    assert sum(vault_server.requests.values()) == SECRET_COUNT + 20
+
+
+def test_export(benchmark, vault_server, run_module, tmp_path):
+    benchmark.group = "vault_kv_sync"
+    path = tmp_path / "backup.jsonl"
+    stored = secrets()
+    args = module_args(vault_server, path, mode="export")
+
+    def setup():
+        vault_server.reset(secrets=stored)
+        if path.exists():
+            path.unlink()
+
+    result = benchmark.pedantic(
+        run_module, args=(vault_kv_sync, args), setup=setup, rounds=3
+    )
+
+    assert result["changed"] is True
+    assert result["stats"]["written"] == SECRET_COUNT
+    # One listing for the prefix and each of its 20 directories.
+    assert (
+        sum(
+            count
+            for (method, path), count in vault_server.requests.items()
+            if method == "LIST"
+        )
+        == 1 + 20
+    )
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.dubzland.vault.plugins.modules import vault_policies
+
+POLICY_COUNT = 1200
+
+
+def policy(index, capability="read"):
+    return 'path "secret/data/team-%d/*" {\n  capabilities = ["%s"]\n}\n' % (
+        index,
+        capability,
+    )
+
+
+def module_args(vault_server, policies, **kwargs):
+    args = dict(
+        url=vault_server.url,
+        token="hvs.root",
+        policies=[dict(name="team-%d" % i, policy=text) for i, text in policies],
+        max_workers=16,
+    )
+    args.update(kwargs)
+    return args
+
+
+def test_first_sync(benchmark, vault_server, run_module):
+    benchmark.group = "vault_policies"
+    args = module_args(vault_server, [(i, policy(i)) for i in range(POLICY_COUNT)])
+
+    result = benchmark.pedantic(
+        run_module, args=(vault_policies, args), setup=vault_server.reset, rounds=3
+    )
+
+    assert result["changed"] is True
+    assert len(vault_server.policies) == POLICY_COUNT
+    assert vault_server.requests[("LIST", "/v1/sys/policies/acl")] == 1
+
+
+def test_resync_with_known_hashes(benchmark, vault_server, run_module):
+    benchmark.group = "vault_policies"
+    policies = [(i, policy(i)) for i in range(POLICY_COUNT)]
+    stored = dict(("team-%d" % i, text) for i, text in policies)
+    hashes = run_module(vault_policies, module_args(vault_server, policies))["hashes"]
+
+    # Ten policies changed since the manifest was written.
+    policies[:10] = [(i, policy(i, "list")) for i in range(10)]
+    args = module_args(vault_server, policies, known_hashes=hashes)
+
+    result = benchmark.pedantic(
+        run_module,
+        args=(vault_policies, args),
+        setup=lambda: vault_server.reset(policies=stored),
+        rounds=5,
+    )
+
+    assert result["changed"] is True
+    # One listing, and a read and a write for each changed policy only.
+    assert sum(vault_server.requests.values()) == 1 + 10 + 10
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.action.vault_auth_method import (
+    ActionModule,
+)
+
+from ...compat import mock
+
+
+@pytest.fixture
+def task_args():
+    return {
+        "url": "http://localhost:8200",
+        "token": "example-token",
+        "method_type": "approle",
+        "description": "Test AppRole authentication",
+        "run_on_controller": True,
+    }
+
+
+@pytest.fixture
+def patch_controller_client(hvac_client, tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    with mock.patch(
+        "ansible_collections.dubzland.vault.plugins.module_utils.vault_module.VaultControllerModule.hvac_client",
+        return_value=hvac_client,
+    ):
+        yield
+
+
+def make_action(task_args, uuid="task-1", async_val=0, diff=False):
+    task = mock.MagicMock()
+    task.args = task_args
+    task.async_val = async_val
+    task.check_mode = False
+    task._uuid = uuid
+    play_context = mock.MagicMock()
+    play_context.check_mode = False
+    play_context.diff = diff
+    connection = mock.MagicMock()
+    connection.has_native_async = False
+
+    return ActionModule(
+        task=task,
+        connection=connection,
+        play_context=play_context,
+        loader=None,
+        templar=None,
+        shared_loader_obj=None,
+    )
+
+
+class TestVaultAuthMethodAction:
+    def test_runs_module_on_host_by_default(self, task_args):
+        task_args["run_on_controller"] = False
+        action = make_action(task_args)
+
+        with mock.patch.object(
+            action, "_execute_module", return_value={"changed": False}
+        ) as execute_module:
+            result = action.run(task_vars={})
+
+        execute_module.assert_called_once_with(
+            module_name="dubzland.vault.vault_auth_method",
+            module_args=task_args,
+            task_vars={},
+            wrap_async=0,
+        )
+        assert result["changed"] is False
+
+    def test_async_runs_module_on_host(self, task_args):
+        action = make_action(task_args, async_val=60)
+
+        with mock.patch.object(
+            action, "_execute_module", return_value={"ansible_job_id": "1"}
+        ) as execute_module:
+            result = action.run(task_vars={})
+
+        assert execute_module.call_args[1]["wrap_async"] is True
+        assert result["ansible_job_id"] == "1"
+
+    def test_passes_trace_context(self, task_args, monkeypatch):
+        traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+        monkeypatch.setenv("TRACEPARENT", traceparent)
+        task_args.update(run_on_controller=False, tracing={"exporter": "otlp"})
+        action = make_action(task_args)
+
+        with mock.patch.object(
+            action, "_execute_module", return_value={"changed": False}
+        ) as execute_module:
+            action.run(task_vars={})
+
+        module_args = execute_module.call_args[1]["module_args"]
+        assert module_args["tracing"] == {
+            "exporter": "otlp",
+            "traceparent": traceparent,
+        }
+
+    @pytest.mark.usefixtures("patch_controller_client")
+    def test_runs_once_for_all_hosts(self, task_args, hvac_client):
+        hvac_client.sys.list_auth_methods.return_value = {"data": {}}
+
+        results = [make_action(task_args).run(task_vars={}) for _ in range(3)]
+
+        hvac_client.sys.list_auth_methods.assert_called_once_with()
+        hvac_client.sys.enable_auth_method.assert_called_once_with(
+            "approle",
+            description="Test AppRole authentication",
+            path="approle/",
+            config={},
+        )
+        assert all(result == results[0] for result in results)
+        assert results[0]["changed"] is True
+        assert results[0]["auth_method"]["type"] == "approle"
+
+    @pytest.mark.usefixtures("patch_controller_client")
+    def test_diff_on_controller(self, task_args, hvac_client):
+        hvac_client.sys.list_auth_methods.return_value = {"data": {}}
+
+        plain = make_action(task_args).run(task_vars={})
+        result = make_action(task_args, diff=True).run(task_vars={})
+
+        assert "diff" not in plain
+        assert result["diff"]["before"] == {}
+        assert result["diff"]["after"]["type"] == "approle"
+
+    @pytest.mark.usefixtures("patch_controller_client")
+    def test_other_tasks_run_again(self, task_args, hvac_client):
+        hvac_client.sys.list_auth_methods.return_value = {"data": {}}
+
+        make_action(task_args, uuid="task-1").run(task_vars={})
+        make_action(task_args, uuid="task-2").run(task_vars={})
+
+        assert hvac_client.sys.list_auth_methods.call_count == 2
+
+    @pytest.mark.usefixtures("patch_controller_client")
+    def test_later_runs_run_again(self, task_args, hvac_client):
+        hvac_client.sys.list_auth_methods.return_value = {"data": {}}
+
+        for pid in (100, 200):
+            with mock.patch(
+                "ansible_collections.dubzland.vault.plugins.action.vault_auth_method.os.getppid",
+                return_value=pid,
+            ):
+                make_action(task_args).run(task_vars={})
+
+        assert hvac_client.sys.list_auth_methods.call_count == 2
+
+    @pytest.mark.usefixtures("patch_controller_client")
+    def test_secrets_are_masked(self, task_args, hvac_client):
+        hvac_client.sys.list_auth_methods.side_effect = Exception(
+            "permission denied for example-token"
+        )
+
+        result = make_action(task_args).run(task_vars={})
+
+        assert result["failed"] is True
+        assert "example-token" not in result["msg"]
+
+    @pytest.mark.usefixtures("patch_controller_client")
+    def test_failures_are_not_shared(self, task_args, hvac_client):
+        hvac_client.sys.list_auth_methods.side_effect = [
+            Exception("connection refused"),
+            {"data": {}},
+        ]
+
+        first = make_action(task_args).run(task_vars={})
+        second = make_action(task_args).run(task_vars={})
+
+        assert first["failed"] is True
+        assert first["msg"] == "connection refused"
+        assert second["changed"] is True
+
+    def test_invalid_arguments(self, task_args):
+        task_args["state"] = "enabled"
+
+        result = make_action(task_args).run(task_vars={})
+
+        assert result["failed"] is True
+        assert "state" in result["msg"]
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import stat
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.action import vault_init
+from ansible_collections.dubzland.vault.plugins.action.vault_init import (
+    ActionModule,
+)
+
+from ...compat import mock
+
+
+@pytest.fixture
+def task_args(tmp_path):
+    return {
+        "url": "http://localhost:8200",
+        "output_directory": str(tmp_path / "vault-tokens"),
+    }
+
+
+@pytest.fixture
+def init_result():
+    return {
+        "changed": True,
+        "initialized": True,
+        "root_token": "s.root",
+        "keys": ["aa", "bb", "cc"],
+        "keys_base64": ["qg==", "uw==", "zA=="],
+    }
+
+
+def make_action(task_args):
+    task = mock.MagicMock()
+    task.args = task_args
+    task.async_val = 0
+    task.check_mode = False
+
+    return ActionModule(
+        task=task,
+        connection=mock.MagicMock(),
+        play_context=mock.MagicMock(),
+        loader=None,
+        templar=None,
+        shared_loader_obj=None,
+    )
+
+
+def run_action(task_args, module_result):
+    action = make_action(task_args)
+    with mock.patch.object(
+        action, "_execute_module", return_value=module_result
+    ) as execute_module:
+        result = action.run(task_vars={})
+    return execute_module, result
+
+
+class TestVaultInitAction:
+    def test_writes_keys(self, task_args, init_result):
+        execute_module, result = run_action(task_args, init_result)
+
+        execute_module.assert_called_once_with(
+            module_name="dubzland.vault.vault_init",
+            module_args={"url": "http://localhost:8200"},
+            task_vars={},
+        )
+        directory = task_args["output_directory"]
+        with open(os.path.join(directory, "rootkey")) as f:
+            assert f.read() == "s.root"
+        for index, key in enumerate(init_result["keys"]):
+            path = os.path.join(directory, "unseal", "key_%d" % index)
+            with open(path) as f:
+                assert f.read() == key
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert sorted(os.listdir(directory)) == ["rootkey", "unseal"]
+
+        assert result["changed"] is True
+        assert len(result["files"]) == 4
+        assert "root_token" not in result
+        assert "keys" not in result
+
+    def test_nothing_written_when_initialized(self, task_args):
+        execute_module, result = run_action(
+            task_args, {"changed": False, "initialized": True}
+        )
+
+        assert not os.path.exists(task_args["output_directory"])
+        assert "files" not in result
+
+    def test_keys_returned_when_write_fails(self, task_args, init_result):
+        with mock.patch.object(
+            vault_init.os, "replace", side_effect=OSError(28, "No space left")
+        ):
+            execute_module, result = run_action(task_args, init_result)
+
+        assert result["failed"] is True
+        assert result["root_token"] == "s.root"
+        assert os.listdir(task_args["output_directory"]) == []
+
+    def test_replaces_earlier_keys(self, task_args, init_result):
+        init_result["recovery_keys"] = ["dd"]
+        run_action(task_args, init_result)
+
+        second = dict(init_result, root_token="s.second", keys=["ee", "ff"])
+        del second["recovery_keys"]
+        execute_module, result = run_action(task_args, second)
+
+        directory = task_args["output_directory"]
+        assert sorted(os.listdir(directory)) == ["rootkey", "unseal"]
+        assert sorted(os.listdir(os.path.join(directory, "unseal"))) == [
+            "key_0",
+            "key_1",
+        ]
+        with open(os.path.join(directory, "unseal", "key_0")) as f:
+            assert f.read() == "ee"
+        assert len(result["files"]) == 3
+
+    def test_earlier_keys_restored_when_write_fails(self, task_args, init_result):
+        run_action(task_args, init_result)
+
+        replace = os.replace
+        moves = []
+
+        def fail_on_unseal(src, dst):
+            moves.append(dst)
+            if len(moves) == 4:
+                raise OSError(28, "No space left")
+            replace(src, dst)
+
+        second = dict(init_result, root_token="s.second", keys=["ee", "ff"])
+        with mock.patch.object(vault_init.os, "replace", side_effect=fail_on_unseal):
+            execute_module, result = run_action(task_args, second)
+
+        assert result["failed"] is True
+        directory = task_args["output_directory"]
+        assert sorted(os.listdir(directory)) == ["rootkey", "unseal"]
+        with open(os.path.join(directory, "rootkey")) as f:
+            assert f.read() == "s.root"
+        assert sorted(os.listdir(os.path.join(directory, "unseal"))) == [
+            "key_0",
+            "key_1",
+            "key_2",
+        ]
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.action.vault_kv_sync import (
+    ActionModule,
+)
+
+from ...compat import mock
+
+
+@pytest.fixture
+def task_args():
+    return {
+        "url": "http://localhost:8200",
+        "token": "example-token",
+        "mode": "import",
+        "file": "/srv/seed/secrets.jsonl",
+    }
+
+
+def make_action(task_args, async_val=0):
+    task = mock.MagicMock()
+    task.args = task_args
+    task.async_val = async_val
+    task.check_mode = False
+    connection = mock.MagicMock()
+    connection.has_native_async = False
+
+    return ActionModule(
+        task=task,
+        connection=connection,
+        play_context=mock.MagicMock(),
+        loader=None,
+        templar=None,
+        shared_loader_obj=None,
+    )
+
+
+class TestVaultKVSyncAction:
+    def test_runs_module_on_host(self, task_args):
+        action = make_action(task_args)
+
+        with mock.patch.object(
+            action, "_execute_module", return_value={"changed": False}
+        ) as execute_module:
+            result = action.run(task_vars={})
+
+        execute_module.assert_called_once_with(
+            module_name="dubzland.vault.vault_kv_sync",
+            module_args=task_args,
+            task_vars={},
+            wrap_async=0,
+        )
+        assert result["changed"] is False
+
+    def test_async(self, task_args):
+        action = make_action(task_args, async_val=3600)
+
+        with mock.patch.object(
+            action, "_execute_module", return_value={"ansible_job_id": "1"}
+        ) as execute_module:
+            result = action.run(task_vars={})
+
+        assert execute_module.call_args[1]["wrap_async"] is True
+        assert result["ansible_job_id"] == "1"
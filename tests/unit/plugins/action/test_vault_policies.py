@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.action.vault_policies import (
+    ActionModule,
+)
+
+from ...compat import mock
+
+
+@pytest.fixture
+def policy_dir(tmp_path):
+    directory = tmp_path / "policies"
+    directory.mkdir()
+    (directory / "read-secrets.hcl").write_text('path "secret/*" {}')
+    (directory / "operators.hcl").write_text('path "sys/*" {}')
+    (directory / "README.md").write_text("not a policy")
+    return directory
+
+
+@pytest.fixture
+def task_args(tmp_path, policy_dir):
+    return {
+        "url": "http://localhost:8200",
+        "directory": str(policy_dir),
+        "manifest": str(tmp_path / "manifest.json"),
+    }
+
+
+def make_action(task_args, check_mode=False):
+    task = mock.MagicMock()
+    task.args = task_args
+    task.async_val = 0
+    task.check_mode = check_mode
+
+    return ActionModule(
+        task=task,
+        connection=mock.MagicMock(),
+        play_context=mock.MagicMock(),
+        loader=None,
+        templar=None,
+        shared_loader_obj=None,
+    )
+
+
+def run_action(task_args, module_result, check_mode=False):
+    action = make_action(task_args, check_mode)
+    with mock.patch.object(
+        action, "_execute_module", return_value=module_result
+    ) as execute_module:
+        result = action.run(task_vars={})
+    return execute_module, result
+
+
+class TestVaultPoliciesAction:
+    def test_reads_directory_and_writes_manifest(self, task_args):
+        hashes = {"operators": "sha256:aa", "read-secrets": "sha256:bb"}
+        execute_module, result = run_action(
+            task_args, {"changed": True, "policies": {}, "hashes": hashes}
+        )
+
+        module_args = execute_module.call_args.kwargs["module_args"]
+        assert module_args["policies"] == [
+            {"name": "operators", "policy": 'path "sys/*" {}'},
+            {"name": "read-secrets", "policy": 'path "secret/*" {}'},
+        ]
+        assert module_args["known_hashes"] == {}
+        assert "directory" not in module_args
+        assert "manifest" not in module_args
+        assert "hashes" not in result
+
+        with open(task_args["manifest"]) as f:
+            manifest = json.load(f)
+        assert manifest["policies"] == hashes
+        assert manifest["scope"] == {"url": "http://localhost:8200", "namespace": None}
+
+    def test_passes_known_hashes(self, task_args):
+        hashes = {"operators": "sha256:aa"}
+        run_action(task_args, {"changed": True, "policies": {}, "hashes": hashes})
+
+        execute_module, result = run_action(
+            task_args, {"changed": False, "policies": {}, "hashes": hashes}
+        )
+
+        module_args = execute_module.call_args.kwargs["module_args"]
+        assert module_args["known_hashes"] == hashes
+
+    def test_manifest_of_another_cluster_is_ignored(self, task_args):
+        run_action(task_args, {"changed": True, "hashes": {"operators": "sha256:aa"}})
+        task_args["url"] = "http://other:8200"
+
+        execute_module, result = run_action(task_args, {"changed": False, "hashes": {}})
+
+        module_args = execute_module.call_args.kwargs["module_args"]
+        assert module_args["known_hashes"] == {}
+
+    def test_manifest_untouched_on_failure(self, task_args):
+        execute_module, result = run_action(
+            task_args, {"failed": True, "msg": "permission denied"}
+        )
+
+        assert result["failed"] is True
+        with pytest.raises(IOError):
+            open(task_args["manifest"])
+
+    def test_manifest_untouched_in_check_mode(self, task_args):
+        execute_module, result = run_action(
+            task_args, {"changed": True, "hashes": {"operators": "sha256:aa"}}, True
+        )
+
+        assert "hashes" not in result
+        with pytest.raises(IOError):
+            open(task_args["manifest"])
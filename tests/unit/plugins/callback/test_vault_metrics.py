@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.callback.vault_metrics import (
+    CallbackModule,
+    VaultMetricsSummary,
+)
+
+from ansible_collections.dubzland.vault.tests.unit.compat import mock
+
+
+def request(method, path, seconds, status=200):
+    return dict(
+        method=method,
+        path=path,
+        status=status,
+        seconds=seconds,
+        retries=0,
+        bytes_sent=0,
+        bytes_received=10,
+    )
+
+
+def vault_metrics(requests, logins=()):
+    return dict(
+        requests=list(requests),
+        logins=list(logins),
+        totals=dict(
+            requests=len(requests),
+            errors=len([r for r in requests if r["status"] >= 400]),
+            retries=0,
+            seconds=sum(r["seconds"] for r in requests),
+            bytes_sent=0,
+            bytes_received=10 * len(requests),
+            logins=len(logins),
+        ),
+    )
+
+
+@pytest.fixture
+def metrics():
+    return [
+        vault_metrics(
+            [request("GET", "sys/auth", 0.01), request("POST", "sys/auth/ldap", 0.2)],
+            [dict(auth_method="approle", seconds=0.05, cached=False)],
+        ),
+        vault_metrics(
+            [request("GET", "sys/auth", 0.03), request("GET", "sys/auth", 0.5, 503)],
+            [dict(auth_method="approle", seconds=0.001, cached=True)],
+        ),
+    ]
+
+
+def task_result(result):
+    task = mock.Mock()
+    task._result = result
+    return task
+
+
+class TestVaultMetricsSummary:
+    def test_endpoints(self, metrics):
+        summary = VaultMetricsSummary()
+        for task_metrics in metrics:
+            summary.add(task_metrics)
+
+        slowest = summary.slowest()
+        assert [(e["method"], e["path"]) for e in slowest] == [
+            ("GET", "sys/auth"),
+            ("POST", "sys/auth/ldap"),
+        ]
+        assert slowest[0]["count"] == 3
+        assert slowest[0]["errors"] == 1
+        assert slowest[0]["max_seconds"] == 0.5
+        assert summary.slowest(1) == slowest[:1]
+        assert summary.totals["requests"] == 4
+        assert summary.logins == {
+            "approle": dict(count=2, cached=1, seconds=pytest.approx(0.051))
+        }
+
+
+class TestCallbackModule:
+    @pytest.fixture
+    def callback(self, tmp_path):
+        callback = CallbackModule(display=mock.Mock(verbosity=0))
+        options = dict(top=1, output=str(tmp_path / "metrics.json"))
+        callback.get_option = options.get
+        return callback
+
+    def test_summary(self, callback, metrics, tmp_path):
+        callback.v2_runner_on_ok(task_result(dict(changed=False)))
+        callback.v2_runner_on_ok(task_result(dict(vault_metrics=metrics[0])))
+        callback.v2_runner_item_on_failed(task_result(dict(vault_metrics=metrics[1])))
+        callback.v2_playbook_on_stats(mock.Mock())
+
+        lines = [call.args[0] for call in callback._display.display.call_args_list]
+        assert lines[0].startswith("4 requests (1 errors, 0 retries)")
+        assert lines[1] == "login approle: 2 (1 cached) in 0.05s"
+        assert len(lines) == 3
+        assert lines[2].startswith("GET    sys/auth ")
+
+        with open(str(tmp_path / "metrics.json")) as f:
+            written = json.load(f)
+        assert written["tasks"] == 2
+        assert len(written["endpoints"]) == 2
+
+    def test_nothing_collected(self, callback):
+        callback.v2_playbook_on_stats(mock.Mock())
+
+        callback._display.banner.assert_not_called()
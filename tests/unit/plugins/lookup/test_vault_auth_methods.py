@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.lookup import vault_auth_methods
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_connection_options import (
+    VaultConnectionOptions,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_auth import (
+    VaultAuth,
+)
+
+from ...compat import mock
+
+
+@pytest.fixture
+def lookup():
+    vault_auth_methods._mount_tables.clear()
+
+    defaults = dict(cache_ttl=60, cache_path=None)
+    for spec in (VaultConnectionOptions.ARGUMENT_SPEC, VaultAuth.ARGUMENT_SPEC):
+        for option, settings in spec.items():
+            defaults[option] = settings.get("default")
+
+    lookup = vault_auth_methods.LookupModule()
+
+    def set_options(var_options=None, direct=None):
+        lookup._options = dict(defaults, **(direct or {}))
+
+    lookup.set_options = set_options
+    return lookup
+
+
+@pytest.fixture
+def lookup_args(tmp_path):
+    return {
+        "url": "http://localhost:8200",
+        "token": "example-token",
+        "cache_path": str(tmp_path / "auth_methods_cache.json"),
+    }
+
+
+@pytest.fixture
+def mount_table():
+    return {
+        "data": {
+            "token/": {"type": "token", "description": "token based credentials"},
+            "approle/": {"type": "approle", "description": "AppRole authentication"},
+        }
+    }
+
+
+@pytest.fixture
+def patch_lookup_client(hvac_client):
+    with mock.patch.object(
+        vault_auth_methods.hvac, "Client", return_value=hvac_client
+    ) as client:
+        yield client
+
+
+class TestVaultAuthMethodsLookup:
+    def test_returns_mount_table(
+        self, lookup, lookup_args, mount_table, hvac_client, patch_lookup_client
+    ):
+        hvac_client.sys.list_auth_methods.return_value = mount_table
+
+        result = lookup.run([], **lookup_args)
+
+        assert result == [mount_table["data"]]
+        assert hvac_client.token == "example-token"
+
+    def test_returns_selected_paths(
+        self, lookup, lookup_args, mount_table, hvac_client, patch_lookup_client
+    ):
+        hvac_client.sys.list_auth_methods.return_value = mount_table
+
+        result = lookup.run(["approle", "userpass/"], **lookup_args)
+
+        assert result == [mount_table["data"]["approle/"], None]
+
+    def test_mount_table_is_cached(
+        self, lookup, lookup_args, mount_table, hvac_client, patch_lookup_client
+    ):
+        hvac_client.sys.list_auth_methods.return_value = mount_table
+
+        lookup.run([], **lookup_args)
+        vault_auth_methods._mount_tables.clear()
+        lookup.run(["approle/"], **lookup_args)
+
+        hvac_client.sys.list_auth_methods.assert_called_once_with()
+
+        lookup_args["token"] = "other-token"
+        lookup.run([], **lookup_args)
+
+        assert hvac_client.sys.list_auth_methods.call_count == 2
+
+    def test_cache_disabled(
+        self, lookup, lookup_args, mount_table, hvac_client, patch_lookup_client
+    ):
+        lookup_args["cache_ttl"] = 0
+        hvac_client.sys.list_auth_methods.return_value = mount_table
+
+        lookup.run([], **lookup_args)
+        lookup.run([], **lookup_args)
+
+        assert hvac_client.sys.list_auth_methods.call_count == 2
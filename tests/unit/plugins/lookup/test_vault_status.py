@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible.errors import AnsibleError
+
+from ansible_collections.dubzland.vault.plugins.lookup import vault_status
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_connection_options import (
+    VaultConnectionOptions,
+)
+
+from ...compat import mock
+
+
+@pytest.fixture
+def lookup():
+    defaults = dict(max_workers=8)
+    for option, settings in VaultConnectionOptions.ARGUMENT_SPEC.items():
+        defaults[option] = settings.get("default")
+    defaults.update(url=None, timeout=5, retries=0)
+
+    lookup = vault_status.LookupModule()
+
+    def set_options(var_options=None, direct=None):
+        lookup._options = dict(defaults, **(direct or {}))
+
+    lookup.set_options = set_options
+    return lookup
+
+
+@pytest.fixture
+def patch_controller_client(hvac_client):
+    with mock.patch(
+        "ansible_collections.dubzland.vault.plugins.module_utils.vault_module.VaultControllerModule.hvac_client",
+        return_value=hvac_client,
+    ) as hvac_client_factory:
+        yield hvac_client_factory
+
+
+@pytest.mark.usefixtures("patch_controller_client")
+class TestVaultStatusLookup:
+    def test_polls_every_node(self, lookup, hvac_client, patch_controller_client):
+        hvac_client.sys.read_seal_status.return_value = {
+            "sealed": True,
+            "initialized": True,
+            "t": 3,
+            "n": 5,
+            "progress": 2,
+        }
+        hvac_client.sys.read_health_status.return_value = {
+            "initialized": True,
+            "standby": True,
+        }
+
+        result = lookup.run(["http://vault-1:8200", "http://vault-2:8200"])
+
+        assert len(result) == 1
+        assert result[0]["cluster"]["sealed"] == [
+            "http://vault-1:8200",
+            "http://vault-2:8200",
+        ]
+        assert result[0]["nodes"][0]["progress"] == 2
+        patch_controller_client.assert_any_call(
+            url="http://vault-2:8200", namespace=None
+        )
+
+    def test_requires_nodes(self, lookup):
+        with pytest.raises(AnsibleError, match="requires node URLs"):
+            lookup.run([])
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import os
+import stat
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.module_utils import vault_auth
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_common import (
+    VaultAuthMethod,
+    VaultAuthenticationError,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_auth import (
+    VaultAuth,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultModule,
+)
+
+
+@pytest.fixture
+def auth_params(tmp_path):
+    return {
+        "url": "http://localhost:8200",
+        "auth_method": "approle",
+        "role_id": "example-role",
+        "secret_id": "example-secret",
+        "token_cache": True,
+        "token_cache_path": str(tmp_path / "token_cache.json"),
+        "token_cache_ttl": 3600,
+        "token_cache_margin": 60,
+    }
+
+
+def login_response(token, lease_duration=3600, renewable=True):
+    return {
+        "auth": {
+            "client_token": token,
+            "lease_duration": lease_duration,
+            "renewable": renewable,
+        }
+    }
+
+
+class TestVaultAuthTokenCache:
+    def test_login_without_cache(self, auth_params, hvac_client):
+        auth_params["token_cache"] = False
+        hvac_client.auth.approle.login.return_value = login_response("s.first")
+
+        VaultAuth(auth_params).authenticate(hvac_client)
+        VaultAuth(auth_params).authenticate(hvac_client)
+
+        assert hvac_client.auth.approle.login.call_count == 2
+        assert not os.path.exists(auth_params["token_cache_path"])
+
+    def test_cached_token_is_reused(self, auth_params, hvac_client):
+        hvac_client.auth.approle.login.return_value = login_response("s.first")
+
+        VaultAuth(auth_params).authenticate(hvac_client)
+        hvac_client.token = None
+        VaultAuth(auth_params).authenticate(hvac_client)
+
+        hvac_client.auth.approle.login.assert_called_once_with(
+            use_token=True, role_id="example-role", secret_id="example-secret"
+        )
+        assert hvac_client.token == "s.first"
+        mode = stat.S_IMODE(os.stat(auth_params["token_cache_path"]).st_mode)
+        assert mode == 0o600
+
+    def test_cache_is_keyed_by_identity(self, auth_params, hvac_client):
+        hvac_client.auth.approle.login.side_effect = [
+            login_response("s.first"),
+            login_response("s.second"),
+        ]
+
+        VaultAuth(auth_params).authenticate(hvac_client)
+        auth_params["role_id"] = "other-role"
+        VaultAuth(auth_params).authenticate(hvac_client)
+
+        assert hvac_client.auth.approle.login.call_count == 2
+        assert hvac_client.token == "s.second"
+
+    @pytest.mark.parametrize(
+        "auth_method, identity, secret",
+        [
+            ("approle", "role_id", "secret_id"),
+            ("userpass", "username", "password"),
+            ("ldap", "username", "password"),
+        ],
+    )
+    def test_cache_is_keyed_by_credentials(
+        self, auth_params, hvac_client, auth_method, identity, secret
+    ):
+        login = getattr(hvac_client.auth, auth_method).login
+        login.side_effect = [login_response("s.first"), login_response("s.second")]
+        auth_params.update(
+            {"auth_method": auth_method, identity: "example", secret: "first"}
+        )
+
+        VaultAuth(auth_params).authenticate(hvac_client)
+        auth_params[secret] = "rotated"
+        VaultAuth(auth_params).authenticate(hvac_client)
+
+        assert login.call_count == 2
+        assert hvac_client.token == "s.second"
+
+    def test_expiring_token_is_renewed(self, auth_params, hvac_client):
+        hvac_client.auth.approle.login.return_value = login_response(
+            "s.first", lease_duration=30
+        )
+        hvac_client.auth.token.renew_self.return_value = login_response("s.first")
+
+        VaultAuth(auth_params).authenticate(hvac_client)
+        VaultAuth(auth_params).authenticate(hvac_client)
+        VaultAuth(auth_params).authenticate(hvac_client)
+
+        hvac_client.auth.approle.login.assert_called_once()
+        hvac_client.auth.token.renew_self.assert_called_once_with()
+        assert hvac_client.token == "s.first"
+
+    def test_failed_renewal_logs_in_again(self, auth_params, hvac_client):
+        hvac_client.auth.approle.login.side_effect = [
+            login_response("s.first", lease_duration=30),
+            login_response("s.second"),
+        ]
+        hvac_client.auth.token.renew_self.side_effect = Exception("permission denied")
+
+        VaultAuth(auth_params).authenticate(hvac_client)
+        VaultAuth(auth_params).authenticate(hvac_client)
+
+        assert hvac_client.auth.approle.login.call_count == 2
+        assert hvac_client.token == "s.second"
+
+    def test_token_auth_is_not_cached(self, auth_params, hvac_client):
+        auth_params.update(auth_method="token", token="s.static")
+
+        VaultAuth(auth_params).authenticate(hvac_client)
+
+        assert hvac_client.token == "s.static"
+        assert not os.path.exists(auth_params["token_cache_path"])
+
+
+class VaultAuthMethodOidc(VaultAuthMethod):
+    NAME = "oidc"
+    ARGUMENT_SPEC = dict(oidc_role=dict(type="str"))
+
+    def validate(self):
+        self.validate_required_fields("oidc_role")
+
+    def authenticate(self, client):
+        return client.auth.oidc.oidc_callback(role=self._options["oidc_role"])
+
+    def cache_identity(self):
+        return self._options["oidc_role"]
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(vault_auth, "_registered_methods", {})
+
+
+@pytest.mark.usefixtures("registry")
+class TestVaultAuthRegistry:
+    def test_register_method(self, auth_params, hvac_client):
+        VaultAuth.register_method(
+            "oidc", lambda: VaultAuthMethodOidc, VaultAuthMethodOidc.ARGUMENT_SPEC
+        )
+        auth_params.update(auth_method="oidc", oidc_role="example")
+
+        auth = VaultAuth(auth_params)
+        auth.validate()
+        auth.authenticate(hvac_client)
+
+        spec = VaultModule.generate_argument_spec()
+        assert "oidc" in spec["auth_method"]["choices"]
+        assert spec["oidc_role"] == dict(type="str")
+        hvac_client.auth.oidc.oidc_callback.assert_called_once_with(role="example")
+
+    def test_shared_spec_is_unchanged(self):
+        builtin = copy.deepcopy(VaultAuth.ARGUMENT_SPEC)
+
+        VaultAuth.register_method(
+            "oidc", lambda: VaultAuthMethodOidc, VaultAuthMethodOidc.ARGUMENT_SPEC
+        )
+        spec = VaultModule.generate_argument_spec()
+        spec["auth_method"]["choices"].append("other")
+
+        assert VaultAuth.ARGUMENT_SPEC == builtin
+        assert "other" not in VaultAuth.argument_spec()["auth_method"]["choices"]
+
+    def test_method_is_loaded_when_selected(self, auth_params):
+        loads = []
+
+        def loader():
+            loads.append("oidc")
+            return VaultAuthMethodOidc
+
+        VaultAuth.register_method("oidc", loader)
+
+        VaultAuth(auth_params).validate()
+        assert loads == []
+
+        auth_params.update(auth_method="oidc")
+        with pytest.raises(VaultAuthenticationError, match="oidc_role"):
+            VaultAuth(auth_params).validate()
+        assert loads == ["oidc"]
+
+    def test_conflicting_option(self):
+        with pytest.raises(ValueError, match="redefines the role_id option"):
+            VaultAuth.register_method(
+                "oidc", lambda: VaultAuthMethodOidc, dict(role_id=dict(type="int"))
+            )
+
+
+@pytest.mark.parametrize(
+    "auth_method,missing",
+    [
+        ("cert", "cert_auth_public_key"),
+        ("jwt", "jwt"),
+        ("ldap", "username"),
+        ("userpass", "username"),
+    ],
+)
+def test_required_fields(auth_method, missing):
+    with pytest.raises(VaultAuthenticationError, match=missing):
+        VaultAuth(dict(auth_method=auth_method)).validate()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.module_utils import (
+    vault_auth_method_aws_iam,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_auth import (
+    VaultAuth,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_credentials():
+    vault_auth_method_aws_iam._session_credentials.clear()
+    yield
+    vault_auth_method_aws_iam._session_credentials.clear()
+
+
+@pytest.fixture
+def boto3(mocker):
+    boto3 = mocker.MagicMock()
+    credentials = boto3.session.Session.return_value.get_credentials.return_value
+    frozen = credentials.get_frozen_credentials.return_value
+    frozen.access_key = "AKIAEXAMPLE"
+    frozen.secret_key = "example-secret"
+    frozen.token = "example-session-token"
+    mocker.patch.dict(sys.modules, {"boto3": boto3, "botocore": mocker.MagicMock()})
+    return boto3
+
+
+@pytest.fixture
+def auth_params(tmp_path):
+    return {
+        "url": "http://localhost:8200",
+        "auth_method": "aws_iam",
+        "role_id": "example-role",
+        "aws_profile": "example-profile",
+        "token_cache_path": str(tmp_path / "token_cache.json"),
+    }
+
+
+def login(params, client):
+    auth = VaultAuth(params)
+    auth.validate()
+    auth.authenticate(client)
+
+
+class TestVaultAuthMethodAwsIam:
+    def test_validate_does_not_discover_credentials(self, auth_params, boto3):
+        VaultAuth(auth_params).validate()
+
+        boto3.session.Session.assert_not_called()
+
+    def test_credentials_are_discovered_once(self, auth_params, boto3, hvac_client):
+        login(auth_params, hvac_client)
+        login(auth_params, hvac_client)
+
+        boto3.session.Session.assert_called_once_with(profile_name="example-profile")
+        assert hvac_client.auth.aws.iam_login.call_count == 2
+        hvac_client.auth.aws.iam_login.assert_called_with(
+            use_token=True,
+            access_key="AKIAEXAMPLE",
+            secret_key="example-secret",
+            session_token="example-session-token",
+            role="example-role",
+        )
+
+    def test_static_keys_skip_discovery(self, auth_params, boto3, hvac_client):
+        auth_params.update(aws_access_key="AKIASTATIC", aws_secret_key="static")
+
+        login(auth_params, hvac_client)
+
+        boto3.session.Session.assert_not_called()
+        hvac_client.auth.aws.iam_login.assert_called_once_with(
+            use_token=True,
+            access_key="AKIASTATIC",
+            secret_key="static",
+            role="example-role",
+        )
+
+    def test_cached_token_skips_discovery(self, auth_params, boto3, hvac_client):
+        auth_params["token_cache"] = True
+        hvac_client.auth.aws.iam_login.return_value = {
+            "auth": {"client_token": "s.aws", "lease_duration": 3600}
+        }
+
+        login(auth_params, hvac_client)
+        vault_auth_method_aws_iam._session_credentials.clear()
+        login(auth_params, hvac_client)
+
+        boto3.session.Session.assert_called_once()
+        hvac_client.auth.aws.iam_login.assert_called_once()
+        assert hvac_client.token == "s.aws"
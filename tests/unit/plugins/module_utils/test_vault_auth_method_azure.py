@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+import time
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.module_utils import (
+    vault_auth_method_azure,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_common import (
+    VaultAuthenticationError,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_auth import (
+    VaultAuth,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_credentials():
+    vault_auth_method_azure._credentials.clear()
+    vault_auth_method_azure._access_tokens.clear()
+    yield
+    vault_auth_method_azure._credentials.clear()
+    vault_auth_method_azure._access_tokens.clear()
+
+
+@pytest.fixture
+def azure_identity(mocker):
+    azure = mocker.MagicMock()
+    access_token = azure.identity.ManagedIdentityCredential.return_value.get_token
+    access_token.return_value.token = "example-jwt"
+    access_token.return_value.expires_on = time.time() + 3600
+    mocker.patch.dict(sys.modules, {"azure": azure, "azure.identity": azure.identity})
+    return azure.identity
+
+
+@pytest.fixture
+def auth_params():
+    return {
+        "url": "http://localhost:8200",
+        "auth_method": "azure",
+        "role_id": "example-role",
+        "azure_resource": "https://management.azure.com/",
+    }
+
+
+def login(params, client):
+    auth = VaultAuth(params)
+    auth.validate()
+    auth.authenticate(client)
+
+
+class TestVaultAuthMethodAzure:
+    def test_validate_does_not_request_a_token(self, auth_params, azure_identity):
+        VaultAuth(auth_params).validate()
+
+        azure_identity.ManagedIdentityCredential.assert_not_called()
+
+    def test_access_token_is_reused(self, auth_params, azure_identity, hvac_client):
+        login(auth_params, hvac_client)
+        login(auth_params, hvac_client)
+
+        credential = azure_identity.ManagedIdentityCredential
+        credential.assert_called_once_with()
+        credential.return_value.get_token.assert_called_once_with(
+            "https://management.azure.com//.default"
+        )
+        hvac_client.auth.azure.login.assert_called_with(
+            use_token=True, role="example-role", jwt="example-jwt"
+        )
+
+    def test_expiring_token_is_refreshed(
+        self, auth_params, azure_identity, hvac_client
+    ):
+        get_token = azure_identity.ManagedIdentityCredential.return_value.get_token
+        get_token.return_value.expires_on = time.time() + 60
+
+        login(auth_params, hvac_client)
+        login(auth_params, hvac_client)
+
+        azure_identity.ManagedIdentityCredential.assert_called_once_with()
+        assert get_token.call_count == 2
+
+    def test_service_principal_requires_tenant(self, auth_params):
+        auth_params.update(azure_client_id="client", azure_client_secret="secret")
+
+        with pytest.raises(VaultAuthenticationError):
+            VaultAuth(auth_params).validate()
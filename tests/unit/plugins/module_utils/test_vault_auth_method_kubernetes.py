@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.module_utils import _vault_cache
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_common import (
+    VaultAuthenticationError,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_auth import (
+    VaultAuth,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_tokens():
+    _vault_cache._file_contents.clear()
+    yield
+    _vault_cache._file_contents.clear()
+
+
+@pytest.fixture
+def token_path(tmp_path):
+    path = tmp_path / "token"
+    path.write_text("example-jwt\n")
+    return path
+
+
+@pytest.fixture
+def auth_params(token_path):
+    return {
+        "url": "http://localhost:8200",
+        "auth_method": "kubernetes",
+        "role_id": "example-role",
+        "kubernetes_token_path": str(token_path),
+    }
+
+
+def login(params, client):
+    auth = VaultAuth(params)
+    auth.validate()
+    auth.authenticate(client)
+
+
+class TestVaultAuthMethodKubernetes:
+    def test_login(self, auth_params, hvac_client):
+        auth_params["mount_point"] = "k8s"
+
+        login(auth_params, hvac_client)
+
+        hvac_client.auth.kubernetes.login.assert_called_once_with(
+            role="example-role", jwt="example-jwt", use_token=True, mount_point="k8s"
+        )
+
+    def test_token_is_read_once(self, auth_params, hvac_client, mocker):
+        read = mocker.patch(
+            "builtins.open", mocker.mock_open(read_data="example-jwt\n")
+        )
+
+        login(auth_params, hvac_client)
+        login(auth_params, hvac_client)
+
+        read.assert_called_once_with(auth_params["kubernetes_token_path"])
+        assert hvac_client.auth.kubernetes.login.call_count == 2
+
+    def test_rotated_token_is_read_again(self, auth_params, token_path, hvac_client):
+        login(auth_params, hvac_client)
+        token_path.write_text("rotated-jwt\n")
+        stat = os.stat(str(token_path))
+        os.utime(str(token_path), (stat.st_atime, stat.st_mtime + 10))
+        login(auth_params, hvac_client)
+
+        hvac_client.auth.kubernetes.login.assert_called_with(
+            role="example-role", jwt="rotated-jwt", use_token=True
+        )
+
+    def test_missing_token(self, auth_params, tmp_path, hvac_client):
+        auth_params["kubernetes_token_path"] = str(tmp_path / "missing")
+
+        with pytest.raises(VaultAuthenticationError, match="service account token"):
+            login(auth_params, hvac_client)
+
+    def test_role_is_required(self, auth_params):
+        del auth_params["role_id"]
+
+        with pytest.raises(VaultAuthenticationError, match="role_id"):
+            VaultAuth(auth_params).validate()
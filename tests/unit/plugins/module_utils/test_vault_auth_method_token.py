@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from hvac.exceptions import Forbidden
+
+from ansible_collections.dubzland.vault.plugins.module_utils import _vault_cache
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_auth import (
+    VaultAuth,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_files():
+    _vault_cache._file_contents.clear()
+    yield
+    _vault_cache._file_contents.clear()
+
+
+@pytest.fixture
+def token_file(tmp_path):
+    path = tmp_path / ".vault-token"
+    path.write_text("s.first\n")
+    return path
+
+
+@pytest.fixture
+def auth_params(tmp_path, token_file):
+    return {
+        "url": "http://localhost:8200",
+        "auth_method": "token",
+        "token_path": str(tmp_path),
+        "token_filename": ".vault-token",
+        "token_validate": True,
+        "token_cache": True,
+        "token_cache_path": str(tmp_path / "token_cache.json"),
+        "token_cache_ttl": 3600,
+    }
+
+
+def lookup_response(ttl, renewable=True):
+    return {"data": {"ttl": ttl, "renewable": renewable, "policies": ["default"]}}
+
+
+def renew_response(token, lease_duration=3600):
+    return {
+        "auth": {
+            "client_token": token,
+            "lease_duration": lease_duration,
+            "renewable": True,
+            "policies": ["default"],
+        }
+    }
+
+
+def login(params, client):
+    auth = VaultAuth(params)
+    auth.validate()
+    auth.authenticate(client)
+
+
+class TestVaultAuthMethodToken:
+    def test_token_file_is_read(self, auth_params, hvac_client):
+        hvac_client.auth.token.lookup_self.return_value = lookup_response(3600)
+
+        login(auth_params, hvac_client)
+
+        assert hvac_client.token == "s.first"
+
+    def test_lookup_is_cached(self, auth_params, hvac_client):
+        auth_params["token_validate"] = False
+        auth_params["token_renew_threshold"] = 600
+        hvac_client.auth.token.lookup_self.return_value = lookup_response(3600)
+
+        login(auth_params, hvac_client)
+        login(auth_params, hvac_client)
+
+        hvac_client.auth.token.lookup_self.assert_called_once_with()
+
+    def test_validated_token_is_always_looked_up(self, auth_params, hvac_client):
+        hvac_client.auth.token.lookup_self.side_effect = [
+            lookup_response(3600),
+            Forbidden("permission denied"),
+        ]
+
+        login(auth_params, hvac_client)
+        with pytest.raises(Forbidden):
+            login(auth_params, hvac_client)
+
+        assert hvac_client.auth.token.lookup_self.call_count == 2
+
+    def test_lookup_without_cache(self, auth_params, hvac_client):
+        auth_params["token_cache"] = False
+        hvac_client.auth.token.lookup_self.return_value = lookup_response(3600)
+
+        login(auth_params, hvac_client)
+        login(auth_params, hvac_client)
+
+        assert hvac_client.auth.token.lookup_self.call_count == 2
+
+    def test_expiring_token_is_renewed(self, auth_params, token_file, hvac_client):
+        auth_params["token_validate"] = False
+        auth_params["token_renew_threshold"] = 600
+        hvac_client.auth.token.lookup_self.return_value = lookup_response(300)
+        hvac_client.auth.token.renew_self.return_value = renew_response("s.first")
+
+        login(auth_params, hvac_client)
+        login(auth_params, hvac_client)
+
+        hvac_client.auth.token.lookup_self.assert_called_once_with()
+        hvac_client.auth.token.renew_self.assert_called_once_with()
+        assert hvac_client.token == "s.first"
+        assert token_file.read_text() == "s.first\n"
+
+    def test_fresh_token_is_not_renewed(self, auth_params, hvac_client):
+        auth_params["token_renew_threshold"] = 600
+        hvac_client.auth.token.lookup_self.return_value = lookup_response(3600)
+
+        login(auth_params, hvac_client)
+
+        hvac_client.auth.token.renew_self.assert_not_called()
+
+    def test_non_renewable_token_is_not_renewed(self, auth_params, hvac_client):
+        auth_params["token_renew_threshold"] = 600
+        hvac_client.auth.token.lookup_self.return_value = lookup_response(
+            300, renewable=False
+        )
+
+        login(auth_params, hvac_client)
+
+        hvac_client.auth.token.renew_self.assert_not_called()
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import hvac
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_connection_options import (
+    VaultConnectionOptions,
+)
+
+
+@pytest.fixture
+def vault_server():
+    """Serves a status code set by the test, counting the requests received."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def handle_request(self):
+            server.requests.append(self.command)
+            self.send_response(server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_GET = do_POST = do_PUT = do_LIST = handle_request
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    server.status = 500
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def connection_params():
+    return {
+        "url": "https://vault.example.com:8200",
+        "timeout": 5,
+        "validate_certs": True,
+        "ca_cert": "/etc/ssl/vault-ca.pem",
+        "client_cert": "/etc/ssl/client.pem",
+        "client_key": "/etc/ssl/client.key",
+        "pool_connections": 4,
+        "pool_maxsize": 16,
+        "retries": 2,
+        "retry_backoff_factor": 0.5,
+    }
+
+
+class TestVaultConnectionOptions:
+    def test_hvac_connection_params(self, connection_params):
+        params = VaultConnectionOptions(connection_params).get_hvac_connection_params()
+
+        assert params["url"] == "https://vault.example.com:8200"
+        assert params["timeout"] == 5
+        assert params["verify"] == "/etc/ssl/vault-ca.pem"
+        assert params["cert"] == ("/etc/ssl/client.pem", "/etc/ssl/client.key")
+
+        adapter = params["session"].get_adapter("https://vault.example.com:8200")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 16
+        assert adapter.max_retries.total == 2
+        assert adapter.max_retries.backoff_factor == 0.5
+        assert 412 in adapter.max_retries.status_forcelist
+        assert 429 in adapter.max_retries.status_forcelist
+
+    def test_verify_disabled(self, connection_params):
+        connection_params["validate_certs"] = False
+
+        params = VaultConnectionOptions(connection_params).get_hvac_connection_params()
+
+        assert params["verify"] is False
+
+    @pytest.mark.parametrize(
+        "validate_certs, ca_cert, verify",
+        [
+            (False, None, False),
+            (False, "/etc/ssl/vault-ca.pem", False),
+            (True, "/etc/ssl/vault-ca.pem", "/etc/ssl/vault-ca.pem"),
+            (True, None, True),
+        ],
+    )
+    def test_client_tls_settings(
+        self, connection_params, validate_certs, ca_cert, verify
+    ):
+        connection_params.update(validate_certs=validate_certs, ca_cert=ca_cert)
+
+        client = hvac.Client(
+            **VaultConnectionOptions(connection_params).get_hvac_connection_params()
+        )
+
+        assert client.adapter._kwargs["verify"] == verify
+        assert client.adapter._kwargs["cert"] == (
+            "/etc/ssl/client.pem",
+            "/etc/ssl/client.key",
+        )
+
+    def test_session_is_shared(self, connection_params):
+        first = VaultConnectionOptions(connection_params).get_hvac_connection_params()
+        second = VaultConnectionOptions(connection_params).get_hvac_connection_params()
+
+        assert first["session"] is second["session"]
+
+        connection_params["pool_maxsize"] = 32
+        third = VaultConnectionOptions(connection_params).get_hvac_connection_params()
+
+        assert third["session"] is not first["session"]
+
+        connection_params["validate_certs"] = False
+        fourth = VaultConnectionOptions(connection_params).get_hvac_connection_params()
+
+        assert fourth["session"] is not third["session"]
+
+    @pytest.mark.parametrize(
+        "method, status, sent",
+        [
+            ("GET", 500, 3),
+            ("LIST", 503, 3),
+            ("POST", 500, 1),
+            ("PUT", 503, 1),
+            ("POST", 429, 3),
+            ("PUT", 412, 3),
+        ],
+    )
+    def test_retries(self, vault_server, method, status, sent):
+        vault_server.status = status
+        url = "http://127.0.0.1:%d" % vault_server.server_port
+        params = VaultConnectionOptions(
+            {"url": url, "retries": 2, "retry_backoff_factor": 0}
+        ).get_hvac_connection_params()
+
+        response = params["session"].request(method, url + "/v1/sys/init")
+
+        assert response.status_code == status
+        assert vault_server.requests == [method] * sent
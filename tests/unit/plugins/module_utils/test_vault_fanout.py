@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_fanout import (
+    RateLimiter,
+    VaultFanout,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultModuleFailure,
+)
+
+from ...compat import mock
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def module():
+    return mock.Mock(
+        params=dict(
+            url="http://localhost:8200",
+            namespace=None,
+            targets=[
+                dict(url="http://vault-1:8200"),
+                dict(url="http://vault-2:8200"),
+                dict(url="http://vault-3:8200"),
+            ],
+            max_workers=3,
+            rate_limit=None,
+        ),
+        vault_tracing=None,
+    )
+
+
+class TestRateLimiter:
+    def test_spaces_calls(self):
+        clock = FakeClock()
+        limiter = RateLimiter(50, clock=clock, sleep=clock.sleep)
+        calls = []
+        limited = limiter.wrap(lambda: calls.append(clock()))
+
+        for _ in range(5):
+            limited()
+
+        assert calls == pytest.approx([100.0, 100.02, 100.04, 100.06, 100.08])
+
+
+class TestVaultFanout:
+    @pytest.mark.parametrize(
+        "error, msg",
+        [
+            (VaultModuleFailure("Failed to import hvac"), "Failed to import hvac"),
+            (SystemExit(1), "Exited with status 1"),
+        ],
+    )
+    def test_module_failure_fails_one_target(self, module, error, msg):
+        def hvac_client(url, namespace):
+            if url == "http://vault-2:8200":
+                raise error
+            return mock.Mock()
+
+        module.hvac_client.side_effect = hvac_client
+
+        results = VaultFanout(module).run(
+            lambda client, target: dict(changed=True), authenticate=False
+        )
+
+        assert [result["failed"] for result in results] == [False, True, False]
+        assert results[1]["msg"] == msg
+        assert results[1]["changed"] is False
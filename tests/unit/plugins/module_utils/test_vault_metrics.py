@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+import pytest
+
+from hvac import exceptions
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_metrics import (
+    VaultMetrics,
+    request_path,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_auth import (
+    VaultAuth,
+)
+from ansible_collections.dubzland.vault.plugins.modules import vault_policies
+
+from ansible_collections.dubzland.vault.tests.unit.compat import mock
+from ansible_collections.dubzland.vault.tests.unit.plugins.modules.utils import (
+    set_module_args,
+)
+
+
+def fake_response(status=200, body=b"{}", sent=b'{"a": 1}', retries=0):
+    response = mock.Mock()
+    response.status_code = status
+    response.content = body
+    response.request.body = sent
+    response.raw.retries.history = (None,) * retries
+    return response
+
+
+@pytest.fixture
+def client():
+    """A client whose adapter answers every request with the next fake response."""
+    client = mock.Mock()
+    client.responses = []
+
+    def request(method, url, headers=None, raise_exception=True, **kwargs):
+        response = client.responses.pop(0)
+        for hook in kwargs["hooks"]["response"]:
+            hook(response)
+        if response.status_code >= 400:
+            raise exceptions.Forbidden("permission denied")
+        return response
+
+    client.adapter.request = request
+    return client
+
+
+class TestRequestPath:
+    @pytest.mark.parametrize(
+        "url, path",
+        [
+            ("/v1/sys/auth", "sys/auth"),
+            ("/v1/secret/metadata/apps?list=true", "secret/metadata/apps"),
+            ("https://vault.example.com:8200/v1/sys/health", "sys/health"),
+        ],
+    )
+    def test_request_path(self, url, path):
+        assert request_path(url) == path
+
+
+class TestVaultMetrics:
+    def test_disabled_by_default(self):
+        assert VaultMetrics.from_params({}) is None
+        assert isinstance(VaultMetrics.from_params({"metrics": True}), VaultMetrics)
+
+    def test_requests_are_recorded(self, client):
+        metrics = VaultMetrics()
+        metrics.instrument(client)
+        client.responses = [
+            fake_response(body=b'{"data": {}}', retries=2),
+            fake_response(status=403, sent=None),
+        ]
+
+        client.adapter.request("get", "/v1/sys/auth")
+        with pytest.raises(exceptions.Forbidden):
+            client.adapter.request("post", "/v1/sys/auth/userpass")
+
+        result = metrics.as_result()
+        first, second = result["requests"]
+        assert first["method"] == "GET"
+        assert first["path"] == "sys/auth"
+        assert first["status"] == 200
+        assert first["retries"] == 2
+        assert first["bytes_sent"] == 8
+        assert first["bytes_received"] == 12
+        assert second["status"] == 403
+        assert second["bytes_sent"] == 0
+        assert result["totals"]["requests"] == 2
+        assert result["totals"]["errors"] == 1
+        assert result["totals"]["retries"] == 2
+
+    def test_requests_listed_are_limited(self, client):
+        metrics = VaultMetrics(max_requests=2)
+        metrics.instrument(client)
+        client.responses = [fake_response() for i in range(5)]
+
+        for i in range(5):
+            client.adapter.request("get", "/v1/secret/data/app-%d" % i)
+
+        result = metrics.as_result()
+        assert len(result["requests"]) == 2
+        assert result["totals"]["requests"] == 5
+
+    def test_existing_hooks_are_kept(self, client):
+        hook = mock.Mock()
+        VaultMetrics().instrument(client)
+        client.responses = [fake_response()]
+
+        client.adapter.request("get", "/v1/sys/auth", hooks={"response": hook})
+
+        hook.assert_called_once()
+
+
+class TestLoginMetrics:
+    def test_login_is_recorded(self, hvac_client, tmp_path):
+        metrics = VaultMetrics()
+        params = {
+            "url": "http://localhost:8200",
+            "auth_method": "approle",
+            "role_id": "example-role",
+            "secret_id": "example-secret",
+            "token_cache": True,
+            "token_cache_path": str(tmp_path / "token_cache.json"),
+        }
+        hvac_client.auth.approle.login.return_value = {
+            "auth": {"client_token": "s.first", "lease_duration": 3600}
+        }
+
+        VaultAuth(params, metrics=metrics).authenticate(hvac_client)
+        VaultAuth(params, metrics=metrics).authenticate(hvac_client)
+
+        logins = metrics.as_result()["logins"]
+        assert [login["auth_method"] for login in logins] == ["approle", "approle"]
+        assert [login["cached"] for login in logins] == [False, True]
+
+
+@pytest.mark.usefixtures("patch_hvac_client")
+class TestModuleResult:
+    def run_module(self, capfd):
+        with pytest.raises(SystemExit):
+            vault_policies.main()
+        out, *rest = capfd.readouterr()
+        return json.loads(out)
+
+    def test_metrics_are_returned(self, hvac_client, capfd):
+        hvac_client.sys.list_acl_policies.return_value = {"data": {"keys": []}}
+        set_module_args(
+            {"url": "http://localhost:8200", "token": "example-token", "metrics": True}
+        )
+
+        result = self.run_module(capfd)
+
+        assert result["vault_metrics"]["logins"][0]["auth_method"] == "token"
+        assert result["vault_metrics"]["totals"]["logins"] == 1
+
+    def test_metrics_are_not_returned_by_default(self, hvac_client, capfd):
+        hvac_client.sys.list_acl_policies.return_value = {"data": {"keys": []}}
+        set_module_args({"url": "http://localhost:8200", "token": "example-token"})
+
+        result = self.run_module(capfd)
+
+        assert "vault_metrics" not in result
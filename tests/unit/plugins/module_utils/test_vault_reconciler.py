@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_reconciler import (
+    VaultReconciler,
+)
+
+from ...compat import mock
+
+
+class PolicyReconciler(VaultReconciler):
+    """A minimal reconciler, backed by a dict standing in for Vault."""
+
+    KIND = "policy"
+    KIND_PLURAL = "policies"
+    RESULT_KEY = "policy"
+
+    def __init__(self, module, store):
+        super(PolicyReconciler, self).__init__(module, client=None)
+        self.store = store
+        self.calls = []
+
+    def list(self):
+        self.calls.append(("list",))
+        return self.store
+
+    def create(self, key, desired):
+        self.calls.append(("create", key))
+
+    def update(self, key, desired, current, updated_keys):
+        self.calls.append(("update", key, updated_keys))
+
+    def delete(self, key, current):
+        self.calls.append(("delete", key))
+
+    def is_protected(self, key, current):
+        return key == "root"
+
+
+@pytest.fixture
+def module():
+    return mock.Mock(check_mode=False, _diff=False, vault_tracing=None)
+
+
+@pytest.fixture
+def store():
+    return {
+        "root": {"rules": ""},
+        "default": {"rules": 'path "a" {}'},
+        "stale": {"rules": 'path "b" {}'},
+    }
+
+
+class TestVaultReconciler:
+    def test_reconcile_all(self, module, store):
+        reconciler = PolicyReconciler(module, store)
+
+        result = reconciler.reconcile_all(
+            [
+                ("default", {"rules": 'path "a" {}'}, "present"),
+                ("stale", {"rules": 'path "c" {}'}, "present"),
+                ("new", {"rules": 'path "d" {}'}, "present"),
+            ]
+        )
+
+        assert reconciler.calls == [
+            ("list",),
+            ("update", "stale", ["rules"]),
+            ("create", "new"),
+        ]
+        assert result["changed"] is True
+        assert result["msg"] == "Successfully reconciled 3 policies"
+        assert result["results"]["default"]["changed"] is False
+        assert result["results"]["stale"]["policy"] == {"rules": 'path "c" {}'}
+
+    def test_reconcile_all_exclusive(self, module, store):
+        reconciler = PolicyReconciler(module, store)
+
+        result = reconciler.reconcile_all(
+            [("default", {"rules": 'path "a" {}'}, "present")], exclusive=True
+        )
+
+        assert ("delete", "stale") in reconciler.calls
+        assert ("delete", "root") not in reconciler.calls
+        assert result["results"]["stale"] == {"changed": True, "state": "absent"}
+
+    def test_reconcile_all_duplicates(self, module, store):
+        reconciler = PolicyReconciler(module, store)
+
+        result = reconciler.reconcile_all(
+            [("new", {}, "present"), ("new", {}, "absent")]
+        )
+
+        assert result["failed"] is True
+        assert result["msg"] == "Policies listed more than once: new"
+        assert reconciler.calls == []
+
+    def test_check_mode(self, module, store):
+        module.check_mode = True
+        reconciler = PolicyReconciler(module, store)
+
+        result = reconciler.reconcile_all(
+            [("new", {"rules": ""}, "present"), ("stale", None, "absent")]
+        )
+
+        assert reconciler.calls == [("list",)]
+        assert result["changed"] is True
+
+    def test_diff(self, module, store):
+        module._diff = True
+        reconciler = PolicyReconciler(module, store)
+
+        result = reconciler.reconcile_all(
+            [("stale", {"rules": 'path "c" {}'}, "present")], exclusive=True
+        )
+
+        assert result["diff"]["before"]["stale"] == {"rules": 'path "b" {}'}
+        assert result["diff"]["after"]["stale"] == {"rules": 'path "c" {}'}
+        assert result["diff"]["before"]["default"] == {"rules": 'path "a" {}'}
+        assert "default" not in result["diff"]["after"]
+        assert "diff" not in result["results"]["stale"]
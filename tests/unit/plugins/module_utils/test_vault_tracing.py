@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import subprocess
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_tracing import (
+    VaultTracing,
+    VaultTracingDependencyError,
+    inject_context,
+    propagate,
+    span,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_auth import (
+    VaultAuth,
+)
+from ansible_collections.dubzland.vault.plugins.modules import vault_policies
+
+from ansible_collections.dubzland.vault.tests.unit.compat import mock
+from ansible_collections.dubzland.vault.tests.unit.plugins.modules.utils import (
+    set_module_args,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT = "00-%s-00f067aa0ba902b7-01" % TRACE_ID
+
+
+@pytest.fixture
+def options(tmp_path):
+    return dict(
+        traceparent=TRACEPARENT,
+        tracestate=None,
+        exporter="file",
+        endpoint=None,
+        headers=None,
+        path=str(tmp_path / "spans.jsonl"),
+        service_name="ansible",
+    )
+
+
+def read_spans(path):
+    with open(path) as f:
+        return dict((span["name"], span) for span in map(json.loads, f))
+
+
+def fake_client(status=200):
+    client = mock.Mock()
+
+    def request(method, url, **kwargs):
+        response = mock.Mock(status_code=status)
+        response.raw.retries.history = ()
+        for hook in kwargs["hooks"]["response"]:
+            hook(response)
+        return response
+
+    client.adapter.request = request
+    return client
+
+
+class TestVaultTracing:
+    def test_disabled(self):
+        assert VaultTracing.from_params({"tracing": None}, "test") is None
+        with span(None, "vault.test") as current:
+            assert current is None
+
+    def test_spans_are_exported(self, options):
+        tracing = VaultTracing(options, "ansible.module test")
+        client = tracing.instrument(fake_client())
+        VaultAuth(
+            {"auth_method": "token", "token": "example-token"}, tracing=tracing
+        ).authenticate(client, url="http://localhost:8200")
+        client.adapter.request("get", "/v1/sys/auth")
+        tracing.finish()
+
+        spans = read_spans(options["path"])
+        root = spans["ansible.module test"]
+        assert root["context"]["trace_id"] == "0x" + TRACE_ID
+        assert root["parent_id"] == "0x00f067aa0ba902b7"
+
+        login = spans["vault.authenticate"]
+        assert login["parent_id"] == root["context"]["span_id"]
+        assert login["attributes"]["vault.auth_method"] == "token"
+        assert login["attributes"]["vault.token_cached"] is False
+
+        request = spans["HTTP GET"]
+        assert request["parent_id"] == root["context"]["span_id"]
+        assert request["attributes"]["url.path"] == "sys/auth"
+        assert request["attributes"]["http.response.status_code"] == 200
+
+    def test_worker_spans_follow_the_submitter(self, options):
+        tracing = VaultTracing(options, "ansible.module test")
+
+        def work():
+            with tracing.span("vault.worker"):
+                pass
+
+        with tracing.span("vault.submitter"):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                pool.submit(propagate(tracing, work)).result()
+        tracing.finish()
+
+        spans = read_spans(options["path"])
+        assert (
+            spans["vault.worker"]["parent_id"]
+            == spans["vault.submitter"]["context"]["span_id"]
+        )
+
+    def test_missing_sdk(self, options):
+        with mock.patch.dict(sys.modules, {"opentelemetry": None}):
+            with pytest.raises(VaultTracingDependencyError) as e:
+                VaultTracing(options, "test")
+
+        assert e.value.library == "opentelemetry-sdk"
+
+    def test_opentelemetry_is_not_imported_when_disabled(self):
+        code = (
+            "import sys\n"
+            "from ansible_collections.dubzland.vault.plugins.module_utils import vault_module\n"
+            "print(any(name.startswith('opentelemetry') for name in sys.modules))\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.check_output([sys.executable, "-c", code], env=env)
+
+        assert output.strip() == b"False"
+
+
+class TestInjectContext:
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setenv("TRACEPARENT", TRACEPARENT)
+
+        assert inject_context({"url": "x"}) == {"url": "x"}
+
+    def test_from_environment(self, monkeypatch):
+        monkeypatch.setenv("TRACEPARENT", TRACEPARENT)
+        monkeypatch.setenv("TRACESTATE", "vendor=value")
+
+        module_args = inject_context({"tracing": {"exporter": "file"}})
+
+        assert module_args["tracing"] == {
+            "exporter": "file",
+            "traceparent": TRACEPARENT,
+            "tracestate": "vendor=value",
+        }
+
+    def test_given_traceparent_is_kept(self, monkeypatch):
+        monkeypatch.setenv("TRACEPARENT", TRACEPARENT)
+        module_args = {
+            "tracing": {"traceparent": "00-%s-00f067aa0ba902b8-01" % TRACE_ID}
+        }
+
+        assert inject_context(module_args) == module_args
+
+    def test_from_current_span(self, options, monkeypatch):
+        monkeypatch.delenv("TRACEPARENT", raising=False)
+        tracing = VaultTracing(options, "ansible.playbook")
+
+        with tracing.span("ansible.task") as current:
+            module_args = inject_context({"tracing": {}})
+        tracing.finish()
+
+        span_id = "%016x" % current.get_span_context().span_id
+        assert module_args["tracing"]["traceparent"] == "00-%s-%s-01" % (
+            TRACE_ID,
+            span_id,
+        )
+
+
+@pytest.mark.usefixtures("patch_hvac_client")
+class TestModuleTracing:
+    def test_reconcile_spans(self, options, hvac_client, capfd):
+        hvac_client.sys.list_acl_policies.return_value = {"data": {"keys": []}}
+        set_module_args(
+            {
+                "url": "http://localhost:8200",
+                "token": "example-token",
+                "policies": [{"name": "read-secrets", "policy": 'path "a" {}'}],
+                "tracing": options,
+            }
+        )
+
+        with pytest.raises(SystemExit):
+            vault_policies.main()
+        out, *rest = capfd.readouterr()
+
+        assert json.loads(out)["changed"] is True
+        spans = read_spans(options["path"])
+        assert spans["vault.reconcile"]["attributes"] == {
+            "vault.kind": "policy",
+            "vault.key": "read-secrets",
+            "vault.state": "present",
+            "vault.changed": True,
+        }
+        assert spans["vault.reconcile"]["context"]["trace_id"] == "0x" + TRACE_ID
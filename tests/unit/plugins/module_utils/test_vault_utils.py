@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import pytest
+
+from hypothesis import given, strategies as st
+
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_utils import (
+    _compare_state,
+    diff_state,
+    get_keys_updated,
+    parse_duration,
+)
+
+
+class TestDiffState:
+    def test_durations_are_compared_in_seconds(self):
+        desired = {"default_lease_ttl": "1h", "max_lease_ttl": "90m"}
+        current = {"default_lease_ttl": 3600, "max_lease_ttl": 3600}
+
+        assert diff_state(desired, current) == {
+            "max_lease_ttl": {"before": 3600, "after": "90m"}
+        }
+
+    def test_durations_go_style(self):
+        desired = {"default_lease_ttl": "1d", "max_lease_ttl": "1.5h"}
+        current = {"default_lease_ttl": 86400, "max_lease_ttl": 5400}
+
+        assert diff_state(desired, current) == {}
+
+    def test_set_options_ignore_order(self):
+        desired = {
+            "passthrough_request_headers": ["X-Two", "X-One"],
+            "listing_visibility": ["hidden", "unauth"],
+        }
+        current = {
+            "passthrough_request_headers": ["X-One", "X-Two"],
+            "listing_visibility": ["unauth", "hidden"],
+        }
+
+        assert get_keys_updated(desired, current) == ["listing_visibility"]
+
+    def test_ignore_applies_to_nested_keys(self):
+        desired = {"config": {"description": "new", "plugin_version": "v1.0.0"}}
+        current = {"config": {"description": "old", "plugin_version": "v1.0.0"}}
+
+        assert get_keys_updated(desired, current) == ["config"]
+        assert get_keys_updated(desired, current, ignore=["description"]) == []
+
+    def test_missing_keys(self):
+        assert diff_state({"plugin_version": "v1.0.0"}, {}) == {
+            "plugin_version": {"before": None, "after": "v1.0.0"}
+        }
+
+    def test_numbers_compare_as_strings(self):
+        assert _compare_state({"token_num_uses": "5"}, {"token_num_uses": 5})
+        assert not _compare_state({"token_num_uses": "5"}, {"token_num_uses": 6})
+
+
+UNIT_NANOSECONDS = {
+    "ns": 1,
+    "us": 10**3,
+    "ms": 10**6,
+    "s": 10**9,
+    "m": 60 * 10**9,
+    "h": 3600 * 10**9,
+    "d": 86400 * 10**9,
+}
+
+
+def as_seconds(nanoseconds):
+    if nanoseconds % 10**9 == 0:
+        return nanoseconds // 10**9
+    return nanoseconds / 10**9
+
+
+class TestParseDuration:
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("0", 0),
+            ("30", 30),
+            (45, 45),
+            ("5s", 5),
+            ("90m", 5400),
+            ("1h30m", 5400),
+            ("1.5h", 5400),
+            ("7d", 604800),
+            ("1d12h", 129600),
+            ("-2m", -120),
+            ("+10s", 10),
+            ("300ms", 0.3),
+            ("2h45m30.5s", 9930.5),
+            ("1500000us", 1.5),
+            ("1500000\u00b5s", 1.5),
+            ("1000000000ns", 1),
+            (".5m", 30),
+            ("1.m", 60),
+        ],
+    )
+    def test_valid(self, value, expected):
+        assert parse_duration(value) == expected
+
+    @pytest.mark.parametrize(
+        "value", ["", "-", ".", "1x", "h", "1h30", "1..5s", "5 s", True, None, [1]]
+    )
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_duration(value)
+
+    @given(
+        st.lists(
+            st.tuples(st.integers(0, 10**6), st.sampled_from(sorted(UNIT_NANOSECONDS))),
+            min_size=1,
+            max_size=5,
+        ),
+        st.booleans(),
+    )
+    def test_compound_durations_add_up(self, components, negative):
+        value = "".join("%d%s" % (amount, unit) for amount, unit in components)
+        nanoseconds = sum(
+            amount * UNIT_NANOSECONDS[unit] for amount, unit in components
+        )
+        if negative:
+            value = "-" + value
+            nanoseconds = -nanoseconds
+
+        assert parse_duration(value) == as_seconds(nanoseconds)
+
+    @given(st.integers(0, 10**6), st.integers(0, 999))
+    def test_fractions_match_the_smaller_unit(self, whole, millis):
+        assert parse_duration("%d.%03ds" % (whole, millis)) == parse_duration(
+            "%ds%dms" % (whole, millis)
+        )
+
+    @given(st.integers(0, 10**9))
+    def test_bare_numbers_are_seconds(self, seconds):
+        assert parse_duration(str(seconds)) == parse_duration("%ds" % seconds)
+
+    @given(st.text(alphabet="0123456789.hmsdnu-", max_size=12))
+    def test_never_raises_anything_but_value_error(self, value):
+        try:
+            result = parse_duration(value)
+        except ValueError:
+            return
+        assert isinstance(result, (int, float))
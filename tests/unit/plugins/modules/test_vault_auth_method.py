@@ -66,8 +66,14 @@ def create_json_response(create_args):
 
 
 @pytest.fixture
-def update_json_response(update_args):
-    return {"data": {"approle/": {"description": update_args["description"]}}}
+def tuning_json_response(update_args):
+    return {
+        "data": {
+            "description": update_args["description"],
+            "default_lease_ttl": 2764800,
+            "max_lease_ttl": 2764800,
+        }
+    }
 
 
 class TestVaultAuthMethod:
@@ -75,13 +81,11 @@ class TestVaultAuthMethod:
         self,
         create_args,
         missing_json_response,
-        create_json_response,
         hvac_client,
         capfd,
     ):
         hvac_client.sys.list_auth_methods.side_effect = [
             missing_json_response,
-            create_json_response,
         ]
         hvac_client.sys.enable_auth_method.return_value = {}
 
@@ -113,13 +117,11 @@ class TestVaultAuthMethod:
         self,
         update_args,
         create_json_response,
-        update_json_response,
         hvac_client,
         capfd,
     ):
         hvac_client.sys.list_auth_methods.side_effect = [
             create_json_response,
-            update_json_response,
         ]
         hvac_client.sys.tune_auth_method.return_value = {}
 
@@ -134,6 +136,8 @@ class TestVaultAuthMethod:
             update_args["method_type"] + "/",
             description=update_args["description"],
         )
+        hvac_client.sys.list_auth_methods.assert_called_once_with()
+        hvac_client.sys.read_auth_method_tuning.assert_not_called()
 
         assert e.value.code == 0
         assert result["changed"] is True
@@ -145,6 +149,68 @@ class TestVaultAuthMethod:
         auth_method = result["auth_method"]
         assert auth_method["description"] == update_args["description"]
 
+    def test_vault_auth_method_update_ttl_in_seconds(
+        self,
+        create_args,
+        create_json_response,
+        hvac_client,
+        capfd,
+    ):
+        create_json_response["data"]["approle/"]["config"] = {
+            "default_lease_ttl": 2764800,
+            "max_lease_ttl": 2764800,
+        }
+        create_args["config"] = {"default_lease_ttl": "1h"}
+        hvac_client.sys.list_auth_methods.return_value = create_json_response
+        hvac_client.sys.tune_auth_method.return_value = {}
+
+        set_module_args(dict(create_args, _ansible_diff=True))
+        with pytest.raises(SystemExit):
+            vault_auth_method.main()
+
+        out, *rest = capfd.readouterr()
+        result = json.loads(out)
+
+        assert result["changed"] is True
+        assert result["auth_method"]["config"] == {
+            "default_lease_ttl": 3600,
+            "max_lease_ttl": 2764800,
+        }
+        assert result["diff"]["after"]["config"]["default_lease_ttl"] == 3600
+
+    def test_vault_auth_method_update_verify_result(
+        self,
+        update_args,
+        create_json_response,
+        tuning_json_response,
+        hvac_client,
+        capfd,
+    ):
+        update_args["verify_result"] = True
+        hvac_client.sys.list_auth_methods.side_effect = [
+            create_json_response,
+        ]
+        hvac_client.sys.tune_auth_method.return_value = {}
+        hvac_client.sys.read_auth_method_tuning.return_value = tuning_json_response
+
+        set_module_args(update_args)
+        with pytest.raises(SystemExit) as e:
+            vault_auth_method.main()
+
+        out, *rest = capfd.readouterr()
+        result = json.loads(out)
+
+        hvac_client.sys.list_auth_methods.assert_called_once_with()
+        hvac_client.sys.read_auth_method_tuning.assert_called_once_with(
+            update_args["method_type"] + "/"
+        )
+
+        assert e.value.code == 0
+        assert result["changed"] is True
+        auth_method = result["auth_method"]
+        assert auth_method["description"] == update_args["description"]
+        assert auth_method["config"]["default_lease_ttl"] == 2764800
+
     def test_vault_auth_method_update_no_change(
         self,
         create_args,
@@ -176,6 +242,51 @@ class TestVaultAuthMethod:
         auth_method = result["auth_method"]
         assert auth_method["description"] == create_args["description"]
 
+    def test_vault_auth_method_description_not_set(
+        self,
+        create_args,
+        create_json_response,
+        hvac_client,
+        capfd,
+    ):
+        del create_args["description"]
+        hvac_client.sys.list_auth_methods.return_value = create_json_response
+
+        set_module_args(create_args)
+        with pytest.raises(SystemExit):
+            vault_auth_method.main()
+
+        out, *rest = capfd.readouterr()
+        result = json.loads(out)
+
+        hvac_client.sys.tune_auth_method.assert_not_called()
+        assert result["changed"] is False
+        assert result["auth_method"]["description"] == "Test AppRole authentication"
+
+    def test_vault_auth_method_description_cleared(
+        self,
+        create_args,
+        create_json_response,
+        hvac_client,
+        capfd,
+    ):
+        create_args["description"] = ""
+        hvac_client.sys.list_auth_methods.return_value = create_json_response
+        hvac_client.sys.tune_auth_method.return_value = {}
+
+        set_module_args(create_args)
+        with pytest.raises(SystemExit):
+            vault_auth_method.main()
+
+        out, *rest = capfd.readouterr()
+        result = json.loads(out)
+
+        hvac_client.sys.tune_auth_method.assert_called_once_with(
+            "approle/", description=""
+        )
+        assert result["changed"] is True
+        assert result["auth_method"]["description"] == ""
+
     def test_vault_auth_method_delete(
         self,
         delete_args,
@@ -234,3 +345,65 @@ class TestVaultAuthMethod:
         assert result["msg"] == "Authentication method %s deleted or does not exist" % (
             delete_args["method_type"] + "/"
         )
+
+    def test_vault_auth_method_targets(
+        self,
+        create_args,
+        missing_json_response,
+        hvac_client,
+        capfd,
+    ):
+        create_args["targets"] = [
+            {"namespace": "team-a"},
+            {"url": "http://vault-west:8200", "namespace": "team-b"},
+        ]
+        hvac_client.sys.list_auth_methods.return_value = missing_json_response
+
+        set_module_args(create_args)
+        with pytest.raises(SystemExit) as e:
+            vault_auth_method.main()
+
+        out, *rest = capfd.readouterr()
+        result = json.loads(out)
+
+        assert hvac_client.sys.enable_auth_method.call_count == 2
+
+        assert e.value.code == 0
+        assert result["changed"] is True
+        assert [(t["url"], t["namespace"]) for t in result["targets"]] == [
+            ("http://localhost:8200", "team-a"),
+            ("http://vault-west:8200", "team-b"),
+        ]
+        assert all(t["changed"] for t in result["targets"])
+        assert all(not t["failed"] for t in result["targets"])
+
+    def test_vault_auth_method_targets_failure(
+        self,
+        create_args,
+        create_json_response,
+        hvac_client,
+        capfd,
+    ):
+        create_args.update(
+            targets=[{"namespace": "team-a"}, {"namespace": "team-b"}],
+            max_workers=1,
+        )
+        hvac_client.sys.list_auth_methods.side_effect = [
+            Exception("permission denied"),
+            create_json_response,
+        ]
+
+        set_module_args(create_args)
+        with pytest.raises(SystemExit) as e:
+            vault_auth_method.main()
+
+        out, *rest = capfd.readouterr()
+        result = json.loads(out)
+
+        assert e.value.code == 1
+        assert result["msg"] == "1 of 2 targets failed"
+        first, second = result["targets"]
+        assert first["failed"] is True
+        assert first["msg"] == "permission denied"
+        assert second["failed"] is False
+        assert second["changed"] is False
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.modules import vault_auth_methods
+
+pytestmark = pytest.mark.usefixtures(
+    "patch_hvac_client",
+)
+
+from ansible_collections.dubzland.vault.tests.unit.plugins.modules.utils import (
+    set_module_args,
+)
+
+
+@pytest.fixture
+def module_args():
+    return {
+        "url": "http://localhost:8200",
+        "token": "example-token",
+        "auth_methods": [
+            {"method_type": "approle", "description": "AppRole authentication"},
+            {
+                "method_type": "userpass",
+                "path": "operators",
+                "description": "Operator logins",
+                "config": {"default_lease_ttl": "1h"},
+            },
+        ],
+    }
+
+
+@pytest.fixture
+def mount_table():
+    return {
+        "data": {
+            "token/": {"type": "token", "description": "token based credentials"},
+            "approle/": {
+                "type": "approle",
+                "description": "AppRole authentication",
+                "config": {"default_lease_ttl": 0, "max_lease_ttl": 0},
+            },
+            "legacy/": {"type": "userpass", "description": "", "config": {}},
+        }
+    }
+
+
+def run_module(capfd):
+    with pytest.raises(SystemExit) as e:
+        vault_auth_methods.main()
+
+    out, *rest = capfd.readouterr()
+    return e.value.code, json.loads(out)
+
+
+class TestVaultAuthMethods:
+    def test_vault_auth_methods_reconcile(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        hvac_client.sys.list_auth_methods.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.list_auth_methods.assert_called_once_with()
+        hvac_client.sys.enable_auth_method.assert_called_once_with(
+            "userpass",
+            description="Operator logins",
+            path="operators/",
+            config={"default_lease_ttl": "1h"},
+        )
+        hvac_client.sys.tune_auth_method.assert_not_called()
+        hvac_client.sys.disable_auth_method.assert_not_called()
+
+        assert code == 0
+        assert result["changed"] is True
+        assert result["auth_methods"]["approle/"]["changed"] is False
+        assert result["auth_methods"]["operators/"]["changed"] is True
+        operators = result["auth_methods"]["operators/"]["auth_method"]
+        assert operators["description"] == "Operator logins"
+        assert operators["config"] == {"default_lease_ttl": 3600}
+        assert "legacy/" not in result["auth_methods"]
+
+    def test_vault_auth_methods_tune(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        module_args["auth_methods"][0]["config"] = {"max_lease_ttl": "2h"}
+        hvac_client.sys.list_auth_methods.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.tune_auth_method.assert_called_once_with(
+            "approle/", description="AppRole authentication", max_lease_ttl="2h"
+        )
+        assert result["auth_methods"]["approle/"]["updated_keys"] == ["max_lease_ttl"]
+        assert (
+            result["auth_methods"]["approle/"]["auth_method"]["config"]["max_lease_ttl"]
+            == 7200
+        )
+
+    def test_vault_auth_methods_exclusive(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        module_args["exclusive"] = True
+        hvac_client.sys.list_auth_methods.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.disable_auth_method.assert_called_once_with("legacy/")
+        assert result["auth_methods"]["legacy/"] == {
+            "changed": True,
+            "state": "absent",
+        }
+        assert "token/" not in result["auth_methods"]
+
+    def test_vault_auth_methods_exclusive_keeps_unmanaged_types(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        module_args.update(exclusive=True, exclude=["break-glass"])
+        mount_table["data"].update(
+            {
+                "ldap/": {"type": "ldap", "description": "Directory", "config": {}},
+                "break-glass/": {"type": "userpass", "description": "", "config": {}},
+            }
+        )
+        hvac_client.sys.list_auth_methods.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.disable_auth_method.assert_called_once_with("legacy/")
+        assert "ldap/" not in result["auth_methods"]
+        assert "break-glass/" not in result["auth_methods"]
+
+    def test_vault_auth_methods_check_mode(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        module_args.update(exclusive=True, _ansible_check_mode=True)
+        hvac_client.sys.list_auth_methods.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.enable_auth_method.assert_not_called()
+        hvac_client.sys.disable_auth_method.assert_not_called()
+        assert result["changed"] is True
+
+    def test_vault_auth_methods_duplicates(self, module_args, hvac_client, capfd):
+        module_args["auth_methods"].append({"method_type": "approle"})
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.list_auth_methods.assert_not_called()
+        assert code == 1
+        assert result["msg"] == "Authentication methods listed more than once: approle/"
+
+    def test_vault_auth_methods_diff(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        module_args.update(exclusive=True, _ansible_diff=True)
+        hvac_client.sys.list_auth_methods.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert "approle/" not in result["diff"]["before"]
+        assert result["diff"]["before"]["legacy/"] == mount_table["data"]["legacy/"]
+        assert "legacy/" not in result["diff"]["after"]
+        assert result["diff"]["after"]["operators/"]["description"] == "Operator logins"
+        assert "diff" not in result["auth_methods"]["operators/"]
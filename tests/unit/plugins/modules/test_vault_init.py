@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.modules import vault_init
+
+pytestmark = pytest.mark.usefixtures(
+    "patch_hvac_client",
+)
+
+from ansible_collections.dubzland.vault.tests.unit.plugins.modules.utils import (
+    set_module_args,
+)
+
+
+@pytest.fixture
+def module_args():
+    return {"url": "http://localhost:8200"}
+
+
+@pytest.fixture
+def init_response():
+    return {
+        "keys": ["aa", "bb", "cc"],
+        "keys_base64": ["qg==", "uw==", "zA=="],
+        "root_token": "s.root",
+    }
+
+
+def run_module(capfd):
+    with pytest.raises(SystemExit) as e:
+        vault_init.main()
+
+    out, *rest = capfd.readouterr()
+    return e.value.code, json.loads(out)
+
+
+class TestVaultInit:
+    def test_vault_init(self, module_args, init_response, hvac_client, capfd):
+        module_args.update(secret_shares=3, secret_threshold=2)
+        hvac_client.sys.is_initialized.return_value = False
+        hvac_client.sys.initialize.return_value = init_response
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.initialize.assert_called_once_with(
+            secret_shares=3, secret_threshold=2
+        )
+        assert code == 0
+        assert result["changed"] is True
+        assert result["root_token"] == "s.root"
+        assert result["keys"] == ["aa", "bb", "cc"]
+        assert "recovery_keys" not in result
+
+    def test_vault_init_already_initialized(self, module_args, hvac_client, capfd):
+        hvac_client.sys.is_initialized.return_value = True
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.initialize.assert_not_called()
+        assert result["changed"] is False
+        assert result["initialized"] is True
+
+    def test_vault_init_check_mode(self, module_args, hvac_client, capfd):
+        module_args["_ansible_check_mode"] = True
+        hvac_client.sys.is_initialized.return_value = False
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.initialize.assert_not_called()
+        assert result["changed"] is True
+
+    def test_vault_init_pgp_keys(self, module_args, init_response, hvac_client, capfd):
+        module_args.update(
+            secret_shares=1,
+            secret_threshold=1,
+            pgp_keys=["operator-key"],
+            root_token_pgp_key="root-key",
+        )
+        hvac_client.sys.is_initialized.return_value = False
+        hvac_client.sys.initialize.return_value = init_response
+
+        set_module_args(module_args)
+        run_module(capfd)
+
+        hvac_client.sys.initialize.assert_called_once_with(
+            secret_shares=1,
+            secret_threshold=1,
+            pgp_keys=["operator-key"],
+            root_token_pgp_key="root-key",
+        )
+
+    def test_vault_init_invalid_threshold(self, module_args, hvac_client, capfd):
+        module_args.update(secret_shares=3, secret_threshold=4)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.is_initialized.assert_not_called()
+        assert code == 1
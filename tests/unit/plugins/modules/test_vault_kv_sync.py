@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import pytest
+
+from hvac import exceptions
+
+from ansible_collections.dubzland.vault.plugins.modules import vault_kv_sync
+
+pytestmark = pytest.mark.usefixtures(
+    "patch_hvac_client",
+)
+
+from ansible_collections.dubzland.vault.tests.unit.plugins.modules.utils import (
+    set_module_args,
+)
+
+
+@pytest.fixture
+def module_args():
+    return {
+        "url": "http://localhost:8200",
+        "token": "example-token",
+        "prefix": "apps",
+    }
+
+
+@pytest.fixture
+def stored(hvac_client):
+    """Stands in for the secrets under apps/ of the secret/ engine."""
+    secrets = {
+        "apps/web": ({"password": "hunter2"}, 3),
+        "apps/db/primary": ({"user": "app", "password": "s3cret"}, 1),
+    }
+    listing = {
+        "apps/": ["db/", "web"],
+        "apps/db/": ["primary"],
+    }
+    kv = hvac_client.secrets.kv.v2
+
+    def read_secret_version(path, mount_point, raise_on_deleted_version):
+        if path not in secrets:
+            raise exceptions.InvalidPath()
+        data, version = secrets[path]
+        return {"data": {"data": dict(data), "metadata": {"version": version}}}
+
+    def read_secret_metadata(path, mount_point):
+        if path not in secrets:
+            raise exceptions.InvalidPath()
+        version = secrets[path][1]
+        return {"data": {"current_version": version, "versions": {str(version): {}}}}
+
+    def list_secrets(path, mount_point):
+        if path not in listing:
+            raise exceptions.InvalidPath()
+        return {"data": {"keys": listing[path]}}
+
+    kv.read_secret_version.side_effect = read_secret_version
+    kv.read_secret_metadata.side_effect = read_secret_metadata
+    kv.list_secrets.side_effect = list_secrets
+    return secrets
+
+
+def write_entries(path, entries):
+    with open(path, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def run_module(capfd):
+    with pytest.raises(SystemExit) as e:
+        vault_kv_sync.main()
+
+    out, *rest = capfd.readouterr()
+    return e.value.code, json.loads(out)
+
+
+class TestReadEntries:
+    def test_jsonl(self):
+        lines = [
+            b'{"path": "a", "data": {"k": "v"}}\n',
+            b"\n",
+            b'{"path": "b", "data": {}}',
+        ]
+        entries = vault_kv_sync.read_entries(lines, "jsonl")
+        assert [entry["path"] for entry in entries] == ["a", "b"]
+
+    def test_yaml(self):
+        stream = "---\npath: a\ndata:\n  k: v\n---\npath: b\ndata: {}\n"
+        entries = vault_kv_sync.read_entries(stream, "yaml")
+        assert [entry["path"] for entry in entries] == ["a", "b"]
+
+    def test_invalid_json(self):
+        with pytest.raises(ValueError, match="Line 2"):
+            list(
+                vault_kv_sync.read_entries(
+                    [b'{"path": "a", "data": {}}', b"{"], "jsonl"
+                )
+            )
+
+    def test_missing_data(self):
+        with pytest.raises(ValueError, match="Entry 1 needs a path and a data mapping"):
+            list(vault_kv_sync.read_entries([b'{"path": "a"}'], "jsonl"))
+
+    def test_data_hash_ignores_key_order(self):
+        assert vault_kv_sync.data_hash({"a": 1, "b": 2}) == vault_kv_sync.data_hash(
+            {"b": 2, "a": 1}
+        )
+
+
+class TestVaultKVSyncImport:
+    def test_import(self, module_args, stored, hvac_client, tmp_path, capfd):
+        path = str(tmp_path / "secrets.jsonl")
+        write_entries(
+            path,
+            [
+                {"path": "web", "data": {"password": "hunter2"}},
+                {"path": "db/primary", "data": {"user": "app", "password": "changed"}},
+                {"path": "api", "data": {"key": "abc"}},
+            ],
+        )
+        module_args.update(mode="import", file=path, chunk_size=2)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        kv = hvac_client.secrets.kv.v2
+        assert code == 0
+        assert result["changed"] is True
+        assert sorted(
+            call.kwargs["path"] for call in kv.create_or_update_secret.call_args_list
+        ) == ["apps/api", "apps/db/primary"]
+        assert result["stats"]["entries"] == 3
+        assert result["stats"]["written"] == 2
+        assert result["stats"]["unchanged"] == 1
+
+    def test_import_approle_custom_mount(
+        self, module_args, stored, hvac_client, tmp_path, capfd
+    ):
+        path = str(tmp_path / "secrets.jsonl")
+        write_entries(path, [{"path": "api", "data": {"key": "abc"}}])
+        del module_args["token"]
+        module_args.update(
+            mode="import",
+            file=path,
+            auth_method="approle",
+            role_id="example-role",
+            secret_id="example-secret",
+            mount_point="approle-ci",
+            engine_mount_point="kv",
+        )
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert code == 0
+        login = hvac_client.auth.approle.login
+        assert login.call_args.kwargs["mount_point"] == "approle-ci"
+        hvac_client.secrets.kv.v2.create_or_update_secret.assert_called_once_with(
+            path="apps/api", secret={"key": "abc"}, mount_point="kv"
+        )
+
+    def test_import_unchanged(self, module_args, stored, hvac_client, tmp_path, capfd):
+        path = str(tmp_path / "secrets.jsonl")
+        write_entries(path, [{"path": "web", "data": {"password": "hunter2"}}])
+        module_args.update(mode="import", file=path)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.secrets.kv.v2.create_or_update_secret.assert_not_called()
+        assert result["changed"] is False
+
+    def test_import_compare_version(
+        self, module_args, stored, hvac_client, tmp_path, capfd
+    ):
+        path = str(tmp_path / "secrets.jsonl")
+        write_entries(
+            path,
+            [
+                {"path": "web", "data": {"password": "other"}, "version": 3},
+                {"path": "db/primary", "data": {"user": "app"}, "version": 2},
+            ],
+        )
+        module_args.update(mode="import", file=path, compare="version")
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        kv = hvac_client.secrets.kv.v2
+        kv.read_secret_version.assert_not_called()
+        kv.create_or_update_secret.assert_called_once_with(
+            path="apps/db/primary", secret={"user": "app"}, mount_point="secret"
+        )
+        assert result["stats"]["unchanged"] == 1
+
+    def test_import_check_mode(self, module_args, stored, hvac_client, tmp_path, capfd):
+        path = str(tmp_path / "secrets.jsonl")
+        write_entries(path, [{"path": "api", "data": {"key": "abc"}}])
+        module_args.update(mode="import", file=path, _ansible_check_mode=True)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.secrets.kv.v2.create_or_update_secret.assert_not_called()
+        assert result["changed"] is True
+        assert result["stats"]["written"] == 1
+
+    def test_import_failure(self, module_args, stored, hvac_client, tmp_path, capfd):
+        path = str(tmp_path / "secrets.jsonl")
+        write_entries(
+            path,
+            [
+                {"path": "api", "data": {"key": "abc"}},
+                {"path": "denied", "data": {"key": "abc"}},
+            ],
+        )
+        module_args.update(mode="import", file=path)
+
+        def create_or_update_secret(path, secret, mount_point):
+            if path == "apps/denied":
+                raise exceptions.Forbidden("permission denied")
+
+        hvac_client.secrets.kv.v2.create_or_update_secret.side_effect = (
+            create_or_update_secret
+        )
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert code == 1
+        assert result["msg"] == "1 of 2 entries could not be synchronized"
+        assert [failure["path"] for failure in result["failures"]] == ["denied"]
+        assert result["failures"][0]["msg"].startswith("permission denied")
+        assert result["stats"]["written"] == 1
+
+    def test_import_invalid_file(self, module_args, stored, tmp_path, capfd):
+        path = str(tmp_path / "secrets.jsonl")
+        with open(path, "w") as f:
+            f.write("not json\n")
+        module_args.update(mode="import", file=path)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert code == 1
+        assert result["msg"].startswith("Could not import %s: Line 1" % path)
+
+
+class TestVaultKVSyncExport:
+    def test_export(self, module_args, stored, tmp_path, capfd):
+        path = str(tmp_path / "secrets.jsonl")
+        module_args.update(mode="export", file=path)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert code == 0
+        assert result["changed"] is True
+        assert result["stats"]["written"] == 2
+        assert oct(os.stat(path).st_mode & 0o777) == "0o600"
+        with open(path) as f:
+            entries = [json.loads(line) for line in f]
+        assert entries == [
+            {
+                "path": "db/primary",
+                "data": {"user": "app", "password": "s3cret"},
+                "version": 1,
+            },
+            {"path": "web", "data": {"password": "hunter2"}, "version": 3},
+        ]
+
+    def test_export_unchanged(self, module_args, stored, tmp_path, capfd):
+        path = str(tmp_path / "secrets.jsonl")
+        module_args.update(mode="export", file=path)
+
+        set_module_args(module_args)
+        run_module(capfd)
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert result["changed"] is False
+        assert [name for name in os.listdir(str(tmp_path))] == ["secrets.jsonl"]
+
+    def test_export_yaml(self, module_args, stored, tmp_path, capfd):
+        path = str(tmp_path / "secrets.yml")
+        module_args.update(mode="export", file=path)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        with open(path) as f:
+            entries = list(vault_kv_sync.read_entries(f, "yaml"))
+        assert [entry["path"] for entry in entries] == ["db/primary", "web"]
+
+    def test_export_check_mode(self, module_args, stored, tmp_path, capfd):
+        path = str(tmp_path / "secrets.jsonl")
+        module_args.update(mode="export", file=path, _ansible_check_mode=True)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert result["changed"] is True
+        assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.modules import vault_policies
+
+pytestmark = pytest.mark.usefixtures(
+    "patch_hvac_client",
+)
+
+from ansible_collections.dubzland.vault.tests.unit.plugins.modules.utils import (
+    set_module_args,
+)
+
+READ_SECRETS = 'path "secret/data/*" {\n  capabilities = ["read"]\n}\n'
+OPERATORS = 'path "sys/*" {\n  capabilities = ["sudo"]\n}\n'
+
+
+@pytest.fixture
+def module_args():
+    return {
+        "url": "http://localhost:8200",
+        "token": "example-token",
+        "policies": [
+            {"name": "read-secrets", "policy": READ_SECRETS},
+            {"name": "operators", "policy": OPERATORS},
+        ],
+    }
+
+
+@pytest.fixture
+def stored(hvac_client):
+    policies = {
+        "root": "",
+        "default": 'path "auth/token/lookup-self" {}',
+        "read-secrets": '  path "secret/data/*" {\r\n  capabilities = ["read"]   \r\n}',
+        "legacy": 'path "legacy/*" {}',
+    }
+    hvac_client.sys.list_acl_policies.return_value = {
+        "data": {"keys": sorted(policies)}
+    }
+    hvac_client.sys.read_acl_policy.side_effect = lambda name: {
+        "data": {"name": name, "policy": policies[name]}
+    }
+    return policies
+
+
+def run_module(capfd):
+    with pytest.raises(SystemExit) as e:
+        vault_policies.main()
+
+    out, *rest = capfd.readouterr()
+    return e.value.code, json.loads(out)
+
+
+class TestNormalizePolicy:
+    def test_whitespace_is_ignored(self):
+        assert vault_policies.policy_hash(READ_SECRETS) == vault_policies.policy_hash(
+            '\npath "secret/data/*" {   \r\n  capabilities = ["read"]\n\n}'
+        )
+
+    def test_content_is_compared(self):
+        assert vault_policies.policy_hash(READ_SECRETS) != vault_policies.policy_hash(
+            READ_SECRETS.replace("read", "list")
+        )
+
+
+class TestVaultPolicies:
+    def test_vault_policies_sync(self, module_args, stored, hvac_client, capfd):
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.list_acl_policies.assert_called_once_with()
+        hvac_client.sys.read_acl_policy.assert_called_once_with("read-secrets")
+        hvac_client.sys.create_or_update_acl_policy.assert_called_once_with(
+            "operators", OPERATORS
+        )
+        assert code == 0
+        assert result["changed"] is True
+        assert result["policies"]["read-secrets"]["changed"] is False
+        assert result["policies"]["operators"]["changed"] is True
+        assert sorted(result["hashes"]) == ["operators", "read-secrets"]
+
+    def test_vault_policies_known_hashes(self, module_args, stored, hvac_client, capfd):
+        module_args["known_hashes"] = {
+            "read-secrets": vault_policies.policy_hash(READ_SECRETS)
+        }
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.read_acl_policy.assert_not_called()
+        assert result["policies"]["read-secrets"]["changed"] is False
+
+    def test_vault_policies_verify(self, module_args, stored, hvac_client, capfd):
+        stored["read-secrets"] = READ_SECRETS.replace("read", "list")
+        module_args["verify"] = True
+        module_args["known_hashes"] = {
+            "read-secrets": vault_policies.policy_hash(READ_SECRETS)
+        }
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.read_acl_policy.assert_any_call("read-secrets")
+        assert result["policies"]["read-secrets"]["changed"] is True
+        assert result["policies"]["read-secrets"]["updated_keys"] == ["policy"]
+
+    def test_vault_policies_stale_hash(self, module_args, stored, hvac_client, capfd):
+        module_args["policies"][0]["policy"] = READ_SECRETS.replace("read", "list")
+        module_args["known_hashes"] = {
+            "read-secrets": vault_policies.policy_hash(READ_SECRETS)
+        }
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.read_acl_policy.assert_called_once_with("read-secrets")
+        assert result["policies"]["read-secrets"]["changed"] is True
+        assert result["policies"]["read-secrets"]["updated_keys"] == ["policy"]
+
+    def test_vault_policies_exclusive(self, module_args, stored, hvac_client, capfd):
+        module_args.update(exclusive=True, max_workers=1)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.delete_acl_policy.assert_called_once_with("legacy")
+        assert result["policies"]["legacy"] == {"changed": True, "state": "absent"}
+        assert "root" not in result["policies"]
+        assert "default" not in result["policies"]
+
+    def test_vault_policies_check_mode(self, module_args, stored, hvac_client, capfd):
+        module_args.update(exclusive=True, _ansible_check_mode=True)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.create_or_update_acl_policy.assert_not_called()
+        hvac_client.sys.delete_acl_policy.assert_not_called()
+        assert result["changed"] is True
+
+    def test_vault_policies_diff(self, module_args, stored, hvac_client, capfd):
+        module_args["_ansible_diff"] = True
+        module_args["policies"][0]["policy"] = READ_SECRETS.replace("read", "list")
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert (
+            result["diff"]["before"]["read-secrets"]["policy"] == stored["read-secrets"]
+        )
+        assert "list" in result["diff"]["after"]["read-secrets"]["policy"]
+        assert result["diff"]["before"]["operators"] == {}
+
+    def test_vault_policies_root(self, module_args, stored, capfd):
+        module_args["policies"].append({"name": "root", "policy": ""})
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert code == 1
+        assert result["msg"] == "The root policy can not be changed"
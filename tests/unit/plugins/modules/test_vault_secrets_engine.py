@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.modules import vault_secrets_engine
+
+pytestmark = pytest.mark.usefixtures(
+    "patch_hvac_client",
+)
+
+from ansible_collections.dubzland.vault.tests.unit.plugins.modules.utils import (
+    set_module_args,
+)
+
+
+@pytest.fixture
+def module_args():
+    return {
+        "url": "http://localhost:8200",
+        "token": "example-token",
+        "engine_type": "kv",
+        "path": "secret",
+        "description": "Application secrets",
+        "options": {"version": 2},
+    }
+
+
+@pytest.fixture
+def mount_table():
+    return {
+        "data": {
+            "sys/": {"type": "system", "description": "system endpoints"},
+            "secret/": {
+                "type": "kv",
+                "description": "Application secrets",
+                "config": {"default_lease_ttl": 0, "max_lease_ttl": 0},
+                "options": {"version": "2"},
+                "local": False,
+                "seal_wrap": False,
+            },
+        }
+    }
+
+
+def run_module(capfd):
+    with pytest.raises(SystemExit) as e:
+        vault_secrets_engine.main()
+
+    out, *rest = capfd.readouterr()
+    return e.value.code, json.loads(out)
+
+
+class TestVaultSecretsEngine:
+    def test_vault_secrets_engine_create(self, module_args, hvac_client, capfd):
+        hvac_client.sys.list_mounted_secrets_engines.return_value = {"data": {}}
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.enable_secrets_engine.assert_called_once_with(
+            "kv",
+            path="secret/",
+            description="Application secrets",
+            config={},
+            options={"version": "2"},
+        )
+        assert code == 0
+        assert result["changed"] is True
+        assert (
+            result["msg"]
+            == "Successfully created or updated the secrets engine secret/"
+        )
+        assert result["secrets_engine"]["options"] == {"version": "2"}
+
+    def test_vault_secrets_engine_unchanged(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        hvac_client.sys.list_mounted_secrets_engines.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.list_mounted_secrets_engines.assert_called_once_with()
+        hvac_client.sys.tune_mount_configuration.assert_not_called()
+        assert code == 0
+        assert result["changed"] is False
+        assert result["msg"] == "No changes to secrets engine secret/"
+
+    def test_vault_secrets_engine_tune(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        module_args["config"] = {"max_lease_ttl": "24h", "default_lease_ttl": "0s"}
+        hvac_client.sys.list_mounted_secrets_engines.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.tune_mount_configuration.assert_called_once_with(
+            "secret/",
+            description="Application secrets",
+            options={"version": "2"},
+            default_lease_ttl="0s",
+            max_lease_ttl="24h",
+        )
+        assert result["changed"] is True
+        assert result["secrets_engine"]["config"]["max_lease_ttl"] == 86400
+
+    def test_vault_secrets_engine_type_mismatch(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        module_args["engine_type"] = "pki"
+        hvac_client.sys.list_mounted_secrets_engines.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert code == 1
+        assert result["msg"] == "Secrets engine secret/ is of type kv, not pki"
+
+    def test_vault_secrets_engine_seal_wrap_immutable(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        module_args["seal_wrap"] = True
+        hvac_client.sys.list_mounted_secrets_engines.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.tune_mount_configuration.assert_not_called()
+        assert code == 1
+        assert "seal_wrap can not be changed" in result["msg"]
+
+    def test_vault_secrets_engine_delete(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        module_args.update(state="absent", _ansible_diff=True)
+        hvac_client.sys.list_mounted_secrets_engines.return_value = mount_table
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.disable_secrets_engine.assert_called_once_with("secret/")
+        assert result["changed"] is True
+        assert result["msg"] == "Successfully deleted secrets engine secret/"
+        assert result["diff"]["before"] == mount_table["data"]["secret/"]
+
+    def test_vault_secrets_engine_check_mode(self, module_args, hvac_client, capfd):
+        module_args["_ansible_check_mode"] = True
+        hvac_client.sys.list_mounted_secrets_engines.return_value = {"data": {}}
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.enable_secrets_engine.assert_not_called()
+        assert result["changed"] is True
+
+    def test_vault_secrets_engine_verify_result(
+        self, module_args, mount_table, hvac_client, capfd
+    ):
+        module_args.update(description="Updated", verify_result=True)
+        hvac_client.sys.list_mounted_secrets_engines.return_value = mount_table
+        hvac_client.sys.read_mount_configuration.return_value = {
+            "data": {
+                "description": "Updated",
+                "default_lease_ttl": 2764800,
+                "max_lease_ttl": 2764800,
+                "force_no_cache": False,
+                "options": {"version": "2"},
+            }
+        }
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.read_mount_configuration.assert_called_once_with("secret/")
+        secrets_engine = result["secrets_engine"]
+        assert secrets_engine["description"] == "Updated"
+        assert secrets_engine["config"]["default_lease_ttl"] == 2764800
+        assert secrets_engine["options"] == {"version": "2"}
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.module_utils._vault_status import (
+    HEALTH_PARAMS,
+)
+from ansible_collections.dubzland.vault.plugins.module_utils.vault_module import (
+    VaultModule,
+)
+from ansible_collections.dubzland.vault.plugins.modules import vault_status
+
+from ansible_collections.dubzland.vault.tests.unit.plugins.modules.utils import (
+    set_module_args,
+)
+
+from ...compat import mock
+
+
+NODES = ["http://vault-1:8200", "http://vault-2:8200", "http://vault-3:8200"]
+
+
+def node_client(sealed=False, standby=False, progress=0):
+    client = mock.MagicMock()
+    client.sys.read_seal_status.return_value = {
+        "sealed": sealed,
+        "initialized": True,
+        "t": 3,
+        "n": 5,
+        "progress": progress,
+        "version": "1.17.2",
+        "cluster_name": "vault-cluster",
+    }
+    client.sys.read_health_status.return_value = {
+        "initialized": True,
+        "sealed": sealed,
+        "standby": standby,
+        "performance_standby": False,
+        "version": "1.17.2",
+    }
+    client.sys.read_leader_status.return_value = {
+        "ha_enabled": True,
+        "leader_address": NODES[0],
+    }
+    return client
+
+
+@pytest.fixture
+def clients():
+    return {
+        NODES[0]: node_client(),
+        NODES[1]: node_client(standby=True),
+        NODES[2]: node_client(standby=True),
+    }
+
+
+@pytest.fixture
+def module_args():
+    return {"url": NODES[0], "targets": [{"url": url} for url in NODES]}
+
+
+def run_module(clients, capfd):
+    with mock.patch.object(
+        VaultModule,
+        "hvac_client",
+        side_effect=lambda url=None, namespace=None: clients[url],
+    ):
+        with pytest.raises(SystemExit) as e:
+            vault_status.main()
+
+    out, *rest = capfd.readouterr()
+    return e.value.code, json.loads(out)
+
+
+class TestVaultStatus:
+    def test_vault_status_healthy(self, module_args, clients, capfd):
+        set_module_args(module_args)
+        code, result = run_module(clients, capfd)
+
+        assert code == 0
+        assert result["changed"] is False
+        assert result["cluster"] == {
+            "nodes": 3,
+            "reachable": 3,
+            "unreachable": [],
+            "initialized": True,
+            "sealed": [],
+            "active": [NODES[0]],
+            "standby": NODES[1:],
+            "versions": ["1.17.2"],
+            "healthy": True,
+        }
+        assert [node["url"] for node in result["nodes"]] == NODES
+        assert result["nodes"][1]["leader_address"] == NODES[0]
+        clients[NODES[0]].sys.read_health_status.assert_called_once_with(
+            **HEALTH_PARAMS
+        )
+
+    def test_vault_status_sealed_node(self, module_args, clients, capfd):
+        clients[NODES[2]] = node_client(sealed=True, standby=True, progress=1)
+
+        set_module_args(module_args)
+        code, result = run_module(clients, capfd)
+
+        clients[NODES[2]].sys.read_leader_status.assert_not_called()
+        assert result["cluster"]["sealed"] == [NODES[2]]
+        assert result["cluster"]["standby"] == [NODES[1]]
+        assert result["cluster"]["healthy"] is False
+        assert result["nodes"][2]["progress"] == 1
+        assert result["nodes"][2]["active"] is False
+
+    def test_vault_status_unreachable_node(self, module_args, clients, capfd):
+        clients[NODES[1]].sys.read_seal_status.side_effect = Exception(
+            "connection refused"
+        )
+
+        set_module_args(module_args)
+        code, result = run_module(clients, capfd)
+
+        assert code == 0
+        assert result["cluster"]["unreachable"] == [NODES[1]]
+        assert result["cluster"]["reachable"] == 2
+        assert result["cluster"]["healthy"] is False
+        assert result["nodes"][1] == {
+            "url": NODES[1],
+            "reachable": False,
+            "active": False,
+            "error": "connection refused",
+        }
+
+    def test_vault_status_single_node(self, clients, capfd):
+        set_module_args({"url": NODES[0]})
+        code, result = run_module(clients, capfd)
+
+        assert result["cluster"]["nodes"] == 1
+        assert result["cluster"]["healthy"] is True
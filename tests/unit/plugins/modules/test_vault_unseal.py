@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: Josh Williams <jdubz@dubzland.com>
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import pytest
+
+from ansible_collections.dubzland.vault.plugins.modules import vault_unseal
+
+pytestmark = pytest.mark.usefixtures(
+    "patch_hvac_client",
+)
+
+from ansible_collections.dubzland.vault.tests.unit.plugins.modules.utils import (
+    set_module_args,
+)
+
+
+@pytest.fixture
+def module_args():
+    return {
+        "url": "http://localhost:8200",
+        "keys": ["key-0", "key-1", "key-2", "key-3", "key-4"],
+    }
+
+
+def seal_status(sealed=True, progress=0):
+    return {"sealed": sealed, "t": 3, "n": 5, "progress": progress}
+
+
+def run_module(capfd):
+    with pytest.raises(SystemExit) as e:
+        vault_unseal.main()
+
+    out, *rest = capfd.readouterr()
+    return e.value.code, json.loads(out)
+
+
+class TestVaultUnseal:
+    def test_vault_unseal(self, module_args, hvac_client, capfd):
+        hvac_client.sys.read_seal_status.return_value = seal_status()
+        hvac_client.sys.submit_unseal_key.side_effect = [
+            seal_status(progress=1),
+            seal_status(progress=2),
+            seal_status(sealed=False),
+        ]
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert code == 0
+        assert hvac_client.sys.submit_unseal_key.call_count == 3
+        hvac_client.sys.submit_unseal_key.assert_called_with(key="key-2")
+        assert result["changed"] is True
+        assert result["sealed"] is False
+        assert result["keys_submitted"] == 3
+        assert "key-0" not in json.dumps(result)
+
+    def test_vault_unseal_already_unsealed(self, module_args, hvac_client, capfd):
+        hvac_client.sys.read_seal_status.return_value = seal_status(sealed=False)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.submit_unseal_key.assert_not_called()
+        assert result["changed"] is False
+
+    def test_vault_unseal_check_mode(self, module_args, hvac_client, capfd):
+        module_args["_ansible_check_mode"] = True
+        hvac_client.sys.read_seal_status.return_value = seal_status()
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.submit_unseal_key.assert_not_called()
+        assert result["changed"] is True
+
+    def test_vault_unseal_reset(self, module_args, hvac_client, capfd):
+        module_args["reset"] = True
+        hvac_client.sys.read_seal_status.return_value = seal_status(progress=2)
+        hvac_client.sys.submit_unseal_key.side_effect = [
+            seal_status(),
+            seal_status(progress=1),
+            seal_status(progress=2),
+            seal_status(sealed=False),
+        ]
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert hvac_client.sys.submit_unseal_key.call_args_list[0] == (
+            (),
+            {"reset": True},
+        )
+        assert result["keys_submitted"] == 3
+
+    def test_vault_unseal_not_enough_keys(self, module_args, hvac_client, capfd):
+        module_args["keys"] = ["key-0"]
+        hvac_client.sys.read_seal_status.return_value = seal_status()
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        hvac_client.sys.submit_unseal_key.assert_not_called()
+        assert code == 1
+        assert result["msg"] == "3 more unseal keys are needed, but only 1 were given"
+
+    def test_vault_unseal_targets(self, module_args, hvac_client, capfd):
+        module_args["targets"] = [
+            {"url": "http://vault-1:8200"},
+            {"url": "http://vault-2:8200"},
+        ]
+        hvac_client.sys.read_seal_status.return_value = seal_status(progress=2)
+        hvac_client.sys.submit_unseal_key.return_value = seal_status(sealed=False)
+
+        set_module_args(module_args)
+        code, result = run_module(capfd)
+
+        assert code == 0
+        assert [target["url"] for target in result["targets"]] == [
+            "http://vault-1:8200",
+            "http://vault-2:8200",
+        ]
+        assert all(target["keys_submitted"] == 1 for target in result["targets"])
+        hvac_client.auth.token.lookup_self.assert_not_called()